@@ -0,0 +1,76 @@
+"""24 add test case latest run pointer
+
+Revision ID: 7b4e2f9c1d36
+Revises: 3c1d7e5a9b20
+Create Date: 2026-10-18 21:20:05.402117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b4e2f9c1d36"
+down_revision: Union[str, None] = "3c1d7e5a9b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "flow_test_cases", sa.Column("latest_run_id", sa.BigInteger(), nullable=True)
+    )
+    op.create_foreign_key(
+        "fk_flow_test_cases_latest_run_id",
+        "flow_test_cases",
+        "flow_test_case_runs",
+        ["latest_run_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index(
+        "idx_flow_test_cases_suite_id", "flow_test_cases", ["suite_id"], unique=False
+    )
+    op.create_index(
+        "idx_flow_test_case_runs_test_case_id_created_at",
+        "flow_test_case_runs",
+        ["test_case_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_flow_test_case_runs_task_run_id",
+        "flow_test_case_runs",
+        ["task_run_id"],
+        unique=False,
+    )
+
+    # Backfill the pointer with each case's most recent run
+    op.execute(
+        """
+        UPDATE flow_test_cases AS c
+        SET latest_run_id = r.id
+        FROM (
+            SELECT DISTINCT ON (test_case_id) test_case_id, id
+            FROM flow_test_case_runs
+            ORDER BY test_case_id, created_at DESC, id DESC
+        ) AS r
+        WHERE r.test_case_id = c.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_flow_test_case_runs_task_run_id", table_name="flow_test_case_runs"
+    )
+    op.drop_index(
+        "idx_flow_test_case_runs_test_case_id_created_at",
+        table_name="flow_test_case_runs",
+    )
+    op.drop_index("idx_flow_test_cases_suite_id", table_name="flow_test_cases")
+    op.drop_constraint(
+        "fk_flow_test_cases_latest_run_id", "flow_test_cases", type_="foreignkey"
+    )
+    op.drop_column("flow_test_cases", "latest_run_id")
@@ -2,7 +2,10 @@ import os
 import sys
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
+from loguru import logger
 from src.configs.config import get_app_settings
+from src.utils.async_utils import run_async, start_worker_loop, stop_worker_loop
 
 sys.path.insert(0, os.getcwd())
 
@@ -32,3 +35,32 @@ celery_app.autodiscover_tasks(
         "src.celery_worker.tasks.flow_test_tasks",
     ]
 )
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """
+    Per worker process setup: drop DB connections inherited from the parent
+    and start the persistent event loop all tasks of this process run on.
+    """
+    from src.dependencies.db_dependency import async_engine, engine
+
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+    start_worker_loop()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    """Close pooled async connections, then the worker event loop."""
+    from src.core.run_result_writer import close_run_result_writer
+    from src.dependencies.db_dependency import async_engine
+    from src.dependencies.redis_dependency import close_redis_pools
+
+    try:
+        run_async(close_run_result_writer())
+        run_async(async_engine.dispose())
+        run_async(close_redis_pools())
+    except Exception as e:
+        logger.error(f"Error closing worker connections: {e}")
+    stop_worker_loop()
@@ -1,19 +1,23 @@
 from typing import Dict
 
 from loguru import logger
-from redis import Redis
 from src.celery_worker.celery_worker import celery_app
-from src.configs.config import get_app_settings
+from src.dependencies.redis_dependency import get_redis_client
 from src.executors.ExecutionContext import ExecutionContext
 from src.executors.ExecutionEventPublisher import (
     ExecutionControl,
     ExecutionEventPublisher,
 )
+from src.executors.FlowResultStore import get_flow_result_store
 from src.executors.GraphExecutor import GraphExecutor
 from src.nodes.GraphCompiler import GraphCompiler
 from src.nodes.GraphLoader import GraphLoader
-from src.schemas.flowbuilder.flow_graph_schemas import CanvasFlowRunRequest
+from src.schemas.flowbuilder.flow_graph_schemas import (
+    ApiFlowRunRequest,
+    CanvasFlowRunRequest,
+)
 from src.utils.async_utils import run_async
+from src.workers.FlowAsyncWorker import FlowAsyncWorker
 
 
 @celery_app.task
@@ -73,7 +77,6 @@ def run_flow(
         Dictionary with execution results
     """
     try:
-        app_settings = get_app_settings()
         logger.info(f"Starting flow execution task for flow_id: {flow_id}")
 
         # Parse the request
@@ -93,16 +96,12 @@ def run_flow(
         execution_plan = run_async(compiler.async_compile())
 
         # Create executor
-        redis_client = Redis(
-            host=app_settings.REDIS_HOST,
-            port=app_settings.REDIS_PORT,
-            db=app_settings.REDIS_DB,
-            decode_responses=True,
-        )
+        redis_client = get_redis_client()
         exe_event_publisher = ExecutionEventPublisher(
             user_id=user_id,
             task_id=self.request.id,
             redis_client=redis_client,
+            flow_id=flow_id,
         )
         execution_context = ExecutionContext(
             run_id=self.request.id,
@@ -112,7 +111,9 @@ def run_flow(
             metadata={},
         )
         exe_control = ExecutionControl(
-            start_node=flow_graph_request.start_node, scope=flow_graph_request.scope
+            start_node=flow_graph_request.start_node,
+            scope=flow_graph_request.scope,
+            incremental=flow_graph_request.incremental,
         )
         logger.info(f"Creating executor with {len(execution_plan)} layers")
         executor = GraphExecutor(
@@ -122,6 +123,7 @@ def run_flow(
             execution_context=execution_context,
             execution_control=exe_control,
             enable_debug=enable_debug,
+            result_store=get_flow_result_store(),
         )
 
         # Run the async execution using run_async utility
@@ -142,3 +144,39 @@ def run_flow(
         logger.error(f"Flow execution failed for flow_id {flow_id}: {str(e)}")
         # Re-raise the exception so Celery marks the task as failed
         raise
+
+
+# Acknowledged after the run, so a run whose worker died is redelivered with
+# the same id and resumes from its node checkpoints
+@celery_app.task(bind=True, acks_late=True, reject_on_worker_lost=True)
+def run_api_flow(
+    self, flow_id: str, flow_run_request_dict: Dict, flow_graph_request_dict: Dict
+):
+    """
+    Celery fallback for public API flow runs when the API process's
+    in-process execution pool is saturated.
+
+    Args:
+        flow_id: Unique identifier for the flow
+        flow_run_request_dict: Serialized ApiFlowRunRequest
+        flow_graph_request_dict: Validated flow definition
+
+    Returns:
+        Serialized FlowExecutionResult
+    """
+    logger.info(f"Starting API flow run task for flow_id: {flow_id}")
+
+    flow_async_worker = FlowAsyncWorker(task_id=self.request.id)
+    execution_result = run_async(
+        flow_async_worker.run_async(
+            flow_id=flow_id,
+            flow_run_request=ApiFlowRunRequest(**flow_run_request_dict),
+            session_id=flow_run_request_dict.get("session_id"),
+            flow_graph_request_dict=flow_graph_request_dict,
+            enable_debug=False,
+            checkpoint=True,
+        )
+    )
+
+    logger.success(f"API flow run completed for flow_id: {flow_id}")
+    return execution_result.model_dump(mode="json")
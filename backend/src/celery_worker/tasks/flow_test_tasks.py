@@ -1,14 +1,18 @@
-import random
+import math
 import signal
 import sys
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from celery.exceptions import SoftTimeLimitExceeded
 from loguru import logger
 from src.celery_worker.BaseTask import BaseTask
 from src.celery_worker.celery_worker import celery_app
-from src.core.semaphore import acquire_user_slot_sync, release_user_slot_sync
-from src.dependencies.db_dependency import AsyncNullPoolSessionLocal
+from src.configs.config import get_app_settings
+from src.core.semaphore import UserSlotHeartbeat, release_user_slot_sync
+from src.core.run_scheduler import RunJob, get_run_scheduler
+from src.dependencies.db_dependency import get_task_sessionmaker
+from src.exceptions.execution_exceptions import UserSlotUnavailableError
 from src.exceptions.graph_exceptions import GraphCompilerError
 from src.models.alchemy.flows.FlowTestCaseRunModel import TestCaseRunStatus
 from src.repositories.FlowTestRepository import FlowTestRepository
@@ -17,13 +21,92 @@ from src.utils.async_utils import run_async
 from src.workers.FlowAsyncWorker import FlowAsyncWorker
 
 
+# Defaults of the test run tasks (the floor for chunk tasks)
+TEST_TASK_SOFT_TIME_LIMIT = 3540
+TEST_TASK_TIME_LIMIT = 3600
+
+
+def _chunk_time_limits(case_count: int) -> Tuple[int, int]:
+    """
+    (soft, hard) time limits of a chunk task: one case deadline plus overhead
+    for every wave of concurrently running cases, so a chunk of slow LLM
+    cases does not hit a limit sized for a single case.
+    """
+    app_settings = get_app_settings()
+    waves = math.ceil(case_count / max(1, app_settings.TEST_BATCH_CHUNK_CONCURRENCY))
+    soft_time_limit = max(
+        TEST_TASK_SOFT_TIME_LIMIT,
+        waves
+        * (
+            app_settings.FLOW_RUN_TIMEOUT_SECONDS
+            + app_settings.TEST_BATCH_CASE_OVERHEAD_SECONDS
+        ),
+    )
+    return soft_time_limit, soft_time_limit + (
+        TEST_TASK_TIME_LIMIT - TEST_TASK_SOFT_TIME_LIMIT
+    )
+
+
+def _send_test_run(job: RunJob) -> None:
+    """Hand a scheduled test run (slot already taken) to its worker task."""
+    if "cases" in job:
+        soft_time_limit, time_limit = _chunk_time_limits(len(job["cases"]))
+        run_flow_test_chunk.apply_async(
+            kwargs=job,
+            task_id=job["task_id"],
+            soft_time_limit=soft_time_limit,
+            time_limit=time_limit,
+        )
+        logger.info(f"Dispatched test chunk {job['task_id']} to run_flow_test_chunk")
+        return
+
+    run_flow_test.apply_async(kwargs=job, task_id=job["task_id"])
+    logger.info(f"Dispatched test task {job['task_id']} to run_flow_test")
+
+
+def _enqueue_test_job(job: RunJob) -> None:
+    """
+    Put a job in its user's queue and dispatch whatever fits in free slots.
+    The rest is dispatched when slots are released.
+    """
+    # IMPORTANT: the scheduler is called OUTSIDE the async context
+    # to avoid mixing sync operations with the async event loop
+    scheduler = get_run_scheduler()
+    scheduler.enqueue(job)
+    scheduler.dispatch_ready(_send_test_run)
+
+    if scheduler.is_queued(job["task_id"]):
+        logger.info(f"No slot available, task {job['task_id']} is queued")
+        _schedule_scheduler_watchdog()
+
+
+def _dispatch_queued_tests() -> None:
+    """Dispatch queued test runs for every user with a free slot."""
+    try:
+        get_run_scheduler().dispatch_ready(_send_test_run)
+    except Exception as e:
+        logger.error(f"Error dispatching queued test runs: {e}", exc_info=True)
+
+
+def _schedule_scheduler_watchdog() -> None:
+    """Schedule one pump of the scheduler, in case a slot is only freed by its TTL."""
+    watchdog_seconds = get_app_settings().TEST_SCHEDULER_WATCHDOG_SECONDS
+    if get_run_scheduler().claim_watchdog(watchdog_seconds):
+        pump_test_scheduler.apply_async(countdown=watchdog_seconds)
+
+
 @celery_app.task(bind=True, max_retries=None, time_limit=3600)
 def dispatch_run_test(
-    self, generated_task_id: str, user_id: int, flow_id: str, case_id: int
+    self,
+    generated_task_id: str,
+    user_id: int,
+    flow_id: str,
+    case_id: int,
+    batch_id: Optional[str] = None,
 ):
     """
-    Task dispatcher: Kiểm tra slot và gọi task worker nếu có slot.
-    Tự động retry nếu không có slot.
+    Task dispatcher: đưa test run vào hàng đợi của user và dispatch ngay
+    nếu user còn slot. Các run còn lại được dispatch khi slot được giải phóng.
 
     IMPORTANT: This task creates a NEW database session in each worker process
     to avoid connection sharing issues across forked processes.
@@ -32,7 +115,7 @@ def dispatch_run_test(
     async def check_and_dispatch():
         """All async operations must be in the same function to use the same loop"""
         # Create a fresh session in this worker process
-        async with AsyncNullPoolSessionLocal() as db_session:
+        async with get_task_sessionmaker()() as db_session:
             try:
                 flow_test_service = FlowTestService(
                     test_repository=FlowTestRepository(),
@@ -63,34 +146,16 @@ def dispatch_run_test(
         if result and result.get("cancelled"):
             return
 
-        # IMPORTANT: acquire_user_slot_sync must be called OUTSIDE the async context
-        # to avoid mixing sync operations with the async event loop
-        has_slot = acquire_user_slot_sync(user_id)
-
-        if has_slot:
-            # Có slot, gọi task xử lý thật
-            run_flow_test.apply_async(
-                kwargs={
-                    "task_id": generated_task_id,
-                    "user_id": user_id,
-                    "case_id": case_id,
-                    "flow_id": flow_id,
-                },
-                task_id=generated_task_id,
-            )
-            logger.info(f"Dispatched test task {generated_task_id} to run_flow_test")
-            return
-        else:
-            countdown = 6 + random.randint(-3, 3)
-            # Hết slot, retry sau countdown giây
-            logger.info(
-                f"No slot available, retrying task {generated_task_id} in {countdown}s"
-            )
-            raise self.retry(countdown=countdown)
+        _enqueue_test_job(
+            {
+                "task_id": generated_task_id,
+                "user_id": user_id,
+                "case_id": case_id,
+                "flow_id": flow_id,
+                "batch_id": batch_id,
+            }
+        )
 
-    except self.retry:
-        # Re-raise retry exception
-        raise
     except Exception as e:
         # Nếu có lỗi bất ngờ, log và return
         logger.error(
@@ -100,13 +165,60 @@ def dispatch_run_test(
         return
 
 
-@celery_app.task(bind=True, base=BaseTask, time_limit=3600, soft_time_limit=3540)
+@celery_app.task(time_limit=60)
+def dispatch_run_test_chunk(
+    chunk_task_id: str,
+    user_id: int,
+    flow_id: str,
+    batch_id: Optional[str],
+    cases: List[Dict[str, Any]],
+):
+    """
+    Task dispatcher for a chunk of batch cases: the whole chunk takes one slot
+    of the user and runs in a single run_flow_test_chunk task. Cancelled cases
+    are skipped by the cases themselves.
+    """
+    try:
+        _enqueue_test_job(
+            {
+                "task_id": chunk_task_id,
+                "user_id": user_id,
+                "flow_id": flow_id,
+                "batch_id": batch_id,
+                "cases": cases,
+            }
+        )
+    except Exception as e:
+        logger.error(
+            f"Error dispatching test chunk {chunk_task_id}: {str(e)}", exc_info=True
+        )
+
+
+@celery_app.task(time_limit=60)
+def pump_test_scheduler():
+    """Watchdog: dispatch queued test runs whose slots were freed by expiry."""
+    scheduler = get_run_scheduler()
+    scheduler.release_watchdog()
+    _dispatch_queued_tests()
+
+    # Keep watching while runs are still waiting
+    if scheduler.has_waiting():
+        _schedule_scheduler_watchdog()
+
+
+@celery_app.task(
+    bind=True,
+    base=BaseTask,
+    time_limit=TEST_TASK_TIME_LIMIT,
+    soft_time_limit=TEST_TASK_SOFT_TIME_LIMIT,
+)
 def run_flow_test(  # noqa: C901
     self,
     task_id: str,
     user_id: int,
     flow_id: str,
     case_id: int,
+    batch_id: Optional[str] = None,
 ):
     """
     Celery task that runs a flow test.
@@ -116,11 +228,14 @@ def run_flow_test(  # noqa: C901
 
     Args:
         case_id: Test case ID
+        batch_id: Batch run whose pinned execution plan to use (if any)
 
     Returns:
         Dictionary with test execution results
     """
     cleanup_done = False
+    requeued = False
+    slot_heartbeat = UserSlotHeartbeat(user_id=user_id, lease_id=task_id)
 
     def emergency_cleanup(signum, frame):
         """Runs when SIGTERM is received"""
@@ -134,7 +249,7 @@ def run_flow_test(  # noqa: C901
         async def cleanup_async():
             """All async operations in one function with fresh session"""
             # Create a fresh session for cleanup in this process
-            async with AsyncNullPoolSessionLocal() as db_session:
+            async with get_task_sessionmaker()() as db_session:
                 try:
                     flow_test_service = FlowTestService(
                         test_repository=FlowTestRepository(),
@@ -156,7 +271,8 @@ def run_flow_test(  # noqa: C901
             logger.error(f"Error in emergency cleanup: {e}", exc_info=True)
 
         try:
-            release_user_slot_sync(user_id)
+            slot_heartbeat.stop()
+            release_user_slot_sync(user_id, task_id)
         except Exception as e:
             logger.error(f"Error releasing user slot: {e}")
 
@@ -181,13 +297,30 @@ def run_flow_test(  # noqa: C901
                 flow_id=flow_id,
                 case_id=case_id,
                 session_id=None,
+                batch_id=batch_id,
             )
 
-        # Run the async test using run_async utility
-        run_async(run_test_async())
+        # Run the async test using run_async utility, keeping the slot lease alive
+        with slot_heartbeat:
+            run_async(run_test_async())
         logger.info(f"Flow test completed successfully for case_id: {case_id}")
         return
 
+    except UserSlotUnavailableError as e:
+        # The dispatch lease expired in the broker and the slot was taken:
+        # wait in the user's queue again instead of exceeding the limit
+        logger.warning(f"{e}, requeueing test task {task_id}")
+        requeued = True
+        _enqueue_test_job(
+            {
+                "task_id": task_id,
+                "user_id": user_id,
+                "case_id": case_id,
+                "flow_id": flow_id,
+                "batch_id": batch_id,
+            }
+        )
+        return
     except GraphCompilerError as e:
         logger.error(f"Graph compiler error for case_id {case_id}: {e}")
         raise self.retry(
@@ -209,6 +342,119 @@ def run_flow_test(  # noqa: C901
         # Re-raise the exception so Celery marks the task as failed
         raise
     finally:
-        # Release user slot
-        logger.info(f"Releasing user slot for user_id: {user_id}")
-        release_user_slot_sync(user_id)
+        slot_heartbeat.stop()
+        # A requeued run holds no slot, and the requeue may already have
+        # leased a new one under this task_id for the redelivered run
+        if not requeued:
+            # Release user slot (idempotent) and hand it to the next queued run
+            logger.info(f"Releasing user slot for user_id: {user_id}")
+            release_user_slot_sync(user_id, task_id)
+            _dispatch_queued_tests()
+
+
+@celery_app.task(
+    bind=True,
+    base=BaseTask,
+    time_limit=TEST_TASK_TIME_LIMIT,
+    soft_time_limit=TEST_TASK_SOFT_TIME_LIMIT,
+)
+def run_flow_test_chunk(
+    self,
+    task_id: str,
+    user_id: int,
+    flow_id: str,
+    batch_id: Optional[str],
+    cases: List[Dict[str, Any]],
+):
+    """
+    Celery task that runs a chunk of flow test cases concurrently on the
+    worker event loop, holding a single user slot for the whole chunk.
+
+    Args:
+        task_id: Chunk ID (also the slot lease ID)
+        cases: [{"task_id": ..., "case_id": ...}, ...] sharing the batch plan
+    """
+    cleanup_done = False
+    requeued = False
+    slot_heartbeat = UserSlotHeartbeat(user_id=user_id, lease_id=task_id)
+    case_task_ids = [case["task_id"] for case in cases]
+
+    def emergency_cleanup(signum, frame):
+        """Runs when SIGTERM is received: cancel the unfinished cases"""
+        nonlocal cleanup_done
+
+        if cleanup_done:
+            return
+
+        logger.warning(f"Chunk {task_id} received termination signal, cleaning up...")
+
+        async def cleanup_async():
+            async with get_task_sessionmaker()() as db_session:
+                flow_test_service = FlowTestService(
+                    test_repository=FlowTestRepository(),
+                )
+                await flow_test_service.cancel_test_case_runs(
+                    session=db_session, task_run_ids=case_task_ids
+                )
+                await db_session.commit()
+
+        try:
+            run_async(cleanup_async())
+        except Exception as e:
+            logger.error(f"Error in emergency cleanup: {e}", exc_info=True)
+
+        try:
+            slot_heartbeat.stop()
+            release_user_slot_sync(user_id, task_id)
+        except Exception as e:
+            logger.error(f"Error releasing user slot: {e}")
+
+        cleanup_done = True
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, emergency_cleanup)
+
+    try:
+        logger.info(f"Starting test chunk {task_id} with {len(cases)} cases")
+        with slot_heartbeat:
+            errors = run_async(
+                FlowAsyncWorker.run_flow_test_chunk(
+                    user_id=user_id,
+                    flow_id=flow_id,
+                    cases=cases,
+                    batch_id=batch_id,
+                    max_concurrency=get_app_settings().TEST_BATCH_CHUNK_CONCURRENCY,
+                )
+            )
+
+        failed = sum(1 for error in errors.values() if error is not None)
+        logger.info(f"Test chunk {task_id} completed ({failed}/{len(cases)} errored)")
+        return
+
+    except UserSlotUnavailableError as e:
+        logger.warning(f"{e}, requeueing test chunk {task_id}")
+        requeued = True
+        _enqueue_test_job(
+            {
+                "task_id": task_id,
+                "user_id": user_id,
+                "flow_id": flow_id,
+                "batch_id": batch_id,
+                "cases": cases,
+            }
+        )
+        return
+    except SoftTimeLimitExceeded:
+        logger.warning(f"Chunk {task_id} approaching time limit")
+        raise
+    except SystemExit:
+        raise
+    except Exception as e:
+        logger.error(f"Test chunk {task_id} failed: {str(e)}", exc_info=True)
+        raise
+    finally:
+        slot_heartbeat.stop()
+        # See run_flow_test: the requeue may hold a new lease under task_id
+        if not requeued:
+            release_user_slot_sync(user_id, task_id)
+            _dispatch_queued_tests()
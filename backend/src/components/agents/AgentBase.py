@@ -5,6 +5,7 @@ This module defines the base class for LLM-based agents. It provides the foundat
 and methods that can be extended or overridden by specific agent implementations.
 """  # noqa
 
+import asyncio
 from abc import ABC
 from datetime import timezone
 from typing import Any, Dict, List, Optional
@@ -71,7 +72,7 @@ class Agent(ABC):
         )
 
         # Initial plan
-        agent_response = self.llm_provider.structured_completion(
+        agent_response = await self._structured_completion(
             messages=chat_messages, output_schema=agent_response_schema
         )
         logger.info(f"Agent Response: {agent_response.model_dump_json(indent=2)}")
@@ -134,7 +135,7 @@ class Agent(ABC):
                     phase="retry",
                     note="retry requested",
                 )
-                agent_response = self.llm_provider.structured_completion(
+                agent_response = await self._structured_completion(
                     messages=chat_messages, output_schema=agent_response_schema
                 )
                 logger.info(
@@ -151,7 +152,7 @@ class Agent(ABC):
                 continue
 
             # Default path (CONTINUE without explicit retry): ask the LLM for next step
-            agent_response = self.llm_provider.structured_completion(
+            agent_response = await self._structured_completion(
                 messages=chat_messages, output_schema=agent_response_schema
             )
             logger.info(
@@ -168,6 +169,17 @@ class Agent(ABC):
         logger.info("💬 Returning final response")
         return ChatResponse(content=agent_response.final_response)
 
+    async def _structured_completion(self, messages: List[ChatMessage], output_schema):
+        """
+        Run the provider's (blocking) structured completion in a thread, so
+        the event loop keeps serving other runs and can cancel this one.
+        """
+        return await asyncio.to_thread(
+            self.llm_provider.structured_completion,
+            messages=messages,
+            output_schema=output_schema,
+        )
+
     def chat_structured(
         self,
         message: ChatMessage,
@@ -343,7 +355,7 @@ class Agent(ABC):
             )
             logger.info(f"📋 Tool Schema: {tool_schema_model.model_json_schema()}")
 
-            tool_call_response = self.llm_provider.structured_completion(
+            tool_call_response = await self._structured_completion(
                 messages=chat_messages, output_schema=tool_schema_model
             )
             logger.info(
@@ -407,12 +419,12 @@ class Agent(ABC):
                 content="I couldn’t execute any of the requested tools. Some error occurred. Please try again.",
             )
             chat_messages.append(fallback_msg)
-            return self.llm_provider.structured_completion(
+            return await self._structured_completion(
                 messages=chat_messages, output_schema=agent_response_schema
             )
 
         # Once all tool calls are executed, ask the LLM for a follow-up structured response
-        agent_response = self.llm_provider.structured_completion(
+        agent_response = await self._structured_completion(
             messages=chat_messages, output_schema=agent_response_schema
         )
 
@@ -27,6 +27,11 @@ class Settings(BaseSettings):
     REDIS_HOST: str
     REDIS_PORT: str
     REDIS_DB: str
+    REDIS_MAX_CONNECTIONS: int = 100
+    REDIS_ASYNC_MAX_CONNECTIONS: int = 200
+    REDIS_POOL_TIMEOUT_SECONDS: int = 10
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS: int = 30
+    REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS: int = 5
 
     # Logging configuration
     LOG_DIR: str
@@ -48,7 +53,93 @@ class Settings(BaseSettings):
     CELERY_RETRY_JITTER: bool = True
 
     LIMIT_TEST_CASE_PER_USER: int = 3
-    LIMIT_TTL_TEST_CASE_SEMAPHORE_PER_USER_SECONDS: int = 60
+    # Dispatch lease: covers the broker queue delay until the task starts
+    LIMIT_TTL_TEST_CASE_SEMAPHORE_PER_USER_SECONDS: int = 600
+    TEST_SLOT_LEASE_TTL_SECONDS: int = 15
+    TEST_SLOT_HEARTBEAT_SECONDS: int = 5
+
+    # Fair per-user test run scheduler
+    TEST_SCHEDULER_WATCHDOG_SECONDS: int = 30
+
+    # Flow definition cache (public run API)
+    FLOW_DEFINITION_CACHE_LOCAL_SIZE: int = 512
+    FLOW_DEFINITION_CACHE_LOCAL_TTL_SECONDS: int = 60
+    FLOW_DEFINITION_CACHE_TTL_SECONDS: int = 3600
+
+    # Compiled execution plans pinned per batch test run
+    BATCH_PLAN_TTL_SECONDS: int = 21600
+    BATCH_PLAN_LOCAL_SIZE: int = 64
+
+    # Batch test runs: cases per worker task (1 = one task per case) and how
+    # many of them run at once inside that task
+    TEST_BATCH_CHUNK_SIZE: int = 10
+    TEST_BATCH_CHUNK_CONCURRENCY: int = 5
+    # Time a chunk task allows per case on top of the case's run deadline
+    # (pass criteria, result writes); its time limit scales with the chunk
+    TEST_BATCH_CASE_OVERHEAD_SECONDS: int = 120
+
+    # Parsed pass criteria, keyed by criteria hash
+    PASS_CRITERIA_CACHE_SIZE: int = 1024
+    # LLM judges of one test case evaluated at once
+    PASS_CRITERIA_MAX_CONCURRENT_JUDGES: int = 4
+
+    # Buffered test run status/result writes
+    TEST_RUN_WRITE_FLUSH_INTERVAL_MS: int = 200
+    TEST_RUN_WRITE_BATCH_SIZE: int = 100
+
+    # Cancelled test run ids checked by running executors
+    TEST_CANCEL_TTL_SECONDS: int = 86400
+
+    # Graph execution deadlines and cancellation polling
+    FLOW_RUN_TIMEOUT_SECONDS: int = 900
+    FLOW_NODE_TIMEOUT_SECONDS: int = 300
+    FLOW_CANCEL_POLL_INTERVAL_MS: int = 1000
+    # Declared test case timeouts below this are ignored (legacy 300 default)
+    TEST_CASE_MIN_TIMEOUT_MS: int = 1000
+
+    # Node checkpoints of Celery flow runs, used to resume redelivered tasks
+    EXECUTION_CHECKPOINT_STORE: str = "redis"  # "redis" or "none"
+    EXECUTION_CHECKPOINT_TTL_SECONDS: int = 3600
+
+    # Per-flow node results reused by incremental canvas runs
+    FLOW_RESULT_STORE: str = "redis"  # "redis" or "none"
+    FLOW_RESULT_STORE_TTL_SECONDS: int = 86400
+
+    # Memoized outputs of nodes declaring a cache policy (0 disables)
+    NODE_RESULT_CACHE_SIZE: int = 4096
+
+    # API key validation cache and deferred usage tracking
+    API_KEY_CACHE_LOCAL_SIZE: int = 2048
+    API_KEY_CACHE_TTL_SECONDS: int = 60
+    API_KEY_NEGATIVE_CACHE_TTL_SECONDS: int = 10
+    API_KEY_USAGE_FLUSH_INTERVAL_SECONDS: int = 30
+    API_KEY_USAGE_FLUSH_BATCH_SIZE: int = 500
+
+    # Auth fast path
+    AUTH_CLAIMS_CACHE_SIZE: int = 10000
+    AUTH_REVOCATION_RESYNC_SECONDS: int = 60
+
+    # Execution event streams (per run)
+    EXECUTION_EVENT_STREAM_MAXLEN: int = 2000
+    EXECUTION_EVENT_STREAM_TTL_SECONDS: int = 3600
+    EXECUTION_EVENT_COMPLETED_TTL_SECONDS: int = 600
+    EXECUTION_EVENT_FLUSH_INTERVAL_MS: int = 50
+    EXECUTION_EVENT_FLUSH_BATCH_SIZE: int = 64
+    EXECUTION_EVENT_VALUE_MAX_BYTES: int = 16384
+    EXECUTION_EVENT_VALUE_PREVIEW_CHARS: int = 512
+
+    # In-process execution of API flow runs
+    EXECUTION_SERVICE_MAX_CONCURRENCY: int = 16
+    EXECUTION_SERVICE_MAX_QUEUE: int = 64
+    EXECUTION_SERVICE_PER_TENANT_LIMIT: int = 4
+    EXECUTION_SERVICE_QUEUE_TIMEOUT_SECONDS: float = 2
+    EXECUTION_SERVICE_CELERY_FALLBACK: bool = True
+    EXECUTION_SERVICE_CELERY_TIMEOUT_SECONDS: int = 300
+
+    # SSE event fan-out (one Redis reader per API process)
+    EVENT_FANOUT_QUEUE_SIZE: int = 1000
+    EVENT_FANOUT_BLOCK_MS: int = 1000
+    EVENT_FANOUT_READ_COUNT: int = 100
 
     # Websocket
     WEBSOCKET_HEARTBEAT_SECONDS: int = 30
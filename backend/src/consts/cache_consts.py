@@ -1,2 +1,10 @@
 class CACHE_PREFIX:
     TEST_CASE = "flowuni-test-case"
+    FLOW_COUNT = "flowuni-flow-count"
+    FLOW_DEFINITION = "flowuni-flow-definition"
+    API_KEY = "flowuni-api-key"
+    BATCH_PLAN = "flowuni-batch-plan"
+
+
+class CACHE_TTL:
+    FLOW_COUNT = 300  # Approximate total; invalidated on create/delete anyway
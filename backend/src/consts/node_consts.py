@@ -12,10 +12,13 @@ class NODE_EXECUTION_STATUS:
     COMPLETED = "completed"
     FAILED = "failed"
     SKIPPED = "skipped"
+    CANCELLED = "cancelled"
+    TIMED_OUT = "timed_out"
 
 
 class NODE_LABEL_CONSTS:
     ROUTER = "Router"
+    CHAT_OUTPUT = "Chat Output"
 
 
 class SPECIAL_NODE_INPUT_CONSTS:
@@ -0,0 +1,130 @@
+# src/core/api_key_cache.py
+import threading
+from typing import Optional, Tuple
+
+from loguru import logger
+from src.configs.config import get_app_settings
+from src.consts.cache_consts import CACHE_PREFIX
+from src.core.cache import LocalLRUCache
+from src.core.invalidation import CacheInvalidationBus, get_invalidation_bus
+from src.dependencies.redis_dependency import get_redis_client
+from src.helpers.CacheHelper import CacheHelper
+from src.schemas.api_keys.api_key_schemas import CachedApiKey
+
+# Marker stored for hashes that did not resolve to a usable key
+_INVALID = {"invalid": True}
+
+
+class ApiKeyValidationCache:
+    """
+    Short-TTL cache of API key validation results, keyed by key hash.
+
+    Valid keys are cached as a `CachedApiKey` projection; unknown, inactive or
+    expired hashes are negatively cached for a shorter TTL. Both a process-local
+    LRU and Redis are used. Deactivate/delete broadcast the hash on the
+    invalidation bus so every process drops it immediately.
+    """
+
+    CHANNEL = "api-key"
+
+    def __init__(
+        self,
+        positive_helper: CacheHelper,
+        negative_helper: CacheHelper,
+        invalidation_bus: CacheInvalidationBus,
+        local_size: int = 2048,
+        positive_ttl_seconds: int = 60,
+        negative_ttl_seconds: int = 10,
+    ):
+        self.positive_helper = positive_helper
+        self.negative_helper = negative_helper
+        self.invalidation_bus = invalidation_bus
+        self.positive_ttl_seconds = positive_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.local = LocalLRUCache(
+            max_size=local_size, ttl_seconds=positive_ttl_seconds
+        )
+
+        self.invalidation_bus.subscribe(self.CHANNEL, self._on_remote_invalidate)
+
+    @staticmethod
+    def _key(key_hash: str) -> str:
+        return f"{CACHE_PREFIX.API_KEY}:{key_hash}"
+
+    def get(self, key_hash: str) -> Tuple[bool, Optional[CachedApiKey]]:
+        """
+        Look up a validation result.
+
+        Returns:
+            (hit, api_key). On a negative hit api_key is None.
+        """
+        entry = self.local.get(key_hash)
+        if entry is None:
+            raw = self.positive_helper.get(self._key(key_hash))
+            if raw is None:
+                return False, None
+
+            if raw == _INVALID:
+                entry = _INVALID
+                ttl = self.negative_ttl_seconds
+            else:
+                entry = CachedApiKey(**raw)
+                ttl = self.positive_ttl_seconds
+            self.local.set(key_hash, entry, ttl_seconds=ttl)
+
+        if entry == _INVALID:
+            return True, None
+
+        # Expiry is checked on every read, the cache never extends a key's life
+        if entry.is_expired():
+            self.local.delete(key_hash)
+            return True, None
+        return True, entry
+
+    def set_valid(self, key_hash: str, api_key: CachedApiKey) -> None:
+        """Cache a successfully validated key."""
+        self.local.set(key_hash, api_key, ttl_seconds=self.positive_ttl_seconds)
+        self.positive_helper.set(self._key(key_hash), api_key.model_dump(mode="json"))
+
+    def set_invalid(self, key_hash: str) -> None:
+        """Negatively cache a hash that did not resolve to a usable key."""
+        self.local.set(key_hash, _INVALID, ttl_seconds=self.negative_ttl_seconds)
+        self.negative_helper.set(self._key(key_hash), _INVALID)
+
+    def invalidate(self, key_hash: str) -> None:
+        """Drop a key hash from every tier in every process."""
+        self.local.delete(key_hash)
+        self.positive_helper.delete(self._key(key_hash))
+        self.invalidation_bus.publish(self.CHANNEL, key_hash)
+        logger.debug("Invalidated cached API key validation result")
+
+    def _on_remote_invalidate(self, key_hash: str) -> None:
+        self.local.delete(key_hash)
+
+
+_cache: Optional[ApiKeyValidationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_api_key_validation_cache() -> ApiKeyValidationCache:
+    """Get the process-wide API key validation cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                app_settings = get_app_settings()
+                redis_client = get_redis_client()
+                _cache = ApiKeyValidationCache(
+                    positive_helper=CacheHelper(
+                        redis_client, ttl=app_settings.API_KEY_CACHE_TTL_SECONDS
+                    ),
+                    negative_helper=CacheHelper(
+                        redis_client,
+                        ttl=app_settings.API_KEY_NEGATIVE_CACHE_TTL_SECONDS,
+                    ),
+                    invalidation_bus=get_invalidation_bus(),
+                    local_size=app_settings.API_KEY_CACHE_LOCAL_SIZE,
+                    positive_ttl_seconds=app_settings.API_KEY_CACHE_TTL_SECONDS,
+                    negative_ttl_seconds=app_settings.API_KEY_NEGATIVE_CACHE_TTL_SECONDS,
+                )
+    return _cache
@@ -0,0 +1,108 @@
+# src/core/api_key_usage.py
+import asyncio
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from loguru import logger
+from src.configs.config import get_app_settings
+from src.dependencies.db_dependency import AsyncSessionLocal
+from src.repositories.ApiKeyRepository import ApiKeyRepository
+
+
+class ApiKeyUsageTracker:
+    """
+    Buffers API key `last_used_at` updates in memory and flushes them in batches.
+
+    Only the latest timestamp per key is kept, so N calls with the same key
+    between two flushes cost a single row update. Flushing runs on a periodic
+    background task and once more on shutdown.
+    """
+
+    def __init__(
+        self,
+        api_key_repository: Optional[ApiKeyRepository] = None,
+        flush_interval_seconds: int = 30,
+        batch_size: int = 500,
+    ):
+        self.api_key_repository = api_key_repository or ApiKeyRepository()
+        self.flush_interval_seconds = flush_interval_seconds
+        self.batch_size = batch_size
+
+        self._pending: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, key_id: str, used_at: Optional[datetime] = None) -> None:
+        """Record a key usage. Never touches the database."""
+        with self._lock:
+            self._pending[key_id] = used_at or datetime.utcnow()
+
+    async def flush(self) -> int:
+        """
+        Write all buffered usages to the database.
+
+        Returns:
+            int: Number of keys updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        items = list(pending.items())
+        updated = 0
+        try:
+            async with AsyncSessionLocal() as session:
+                for start in range(0, len(items), self.batch_size):
+                    batch = dict(items[start : start + self.batch_size])
+                    updated += await self.api_key_repository.bulk_update_last_used_at(
+                        session=session, usages=batch
+                    )
+                await session.commit()
+            logger.debug(f"Flushed last_used_at for {updated} API key(s)")
+        except Exception as e:
+            logger.error(f"Failed to flush API key usage: {e}")
+            # Put back what we could not write, keeping any newer timestamps
+            with self._lock:
+                for key_id, used_at in pending.items():
+                    current = self._pending.get(key_id)
+                    if current is None or current < used_at:
+                        self._pending[key_id] = used_at
+        return updated
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await self.flush()
+
+    def start(self) -> None:
+        """Start the periodic flush task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush task and flush what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+_tracker: Optional[ApiKeyUsageTracker] = None
+
+
+def get_api_key_usage_tracker() -> ApiKeyUsageTracker:
+    """Get the process-wide API key usage tracker."""
+    global _tracker
+    if _tracker is None:
+        app_settings = get_app_settings()
+        _tracker = ApiKeyUsageTracker(
+            flush_interval_seconds=app_settings.API_KEY_USAGE_FLUSH_INTERVAL_SECONDS,
+            batch_size=app_settings.API_KEY_USAGE_FLUSH_BATCH_SIZE,
+        )
+    return _tracker
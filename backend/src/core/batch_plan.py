@@ -0,0 +1,106 @@
+# src/core/batch_plan.py
+import threading
+from typing import List, Optional
+
+from loguru import logger
+from src.configs.config import get_app_settings
+from src.consts.cache_consts import CACHE_PREFIX
+from src.core.cache import LocalLRUCache
+from src.dependencies.redis_dependency import get_async_redis_client
+from src.nodes.GraphCompiler import GraphCompiler
+from src.nodes.GraphLoader import GraphLoader
+from src.schemas.flowbuilder.flow_graph_schemas import CanvasFlowRunRequest
+from src.schemas.flows.flow_schemas import CachedFlowDefinition, PinnedExecutionPlan
+
+
+class BatchPlanStore:
+    """
+    Execution plans compiled once per batch test run.
+
+    The batch route compiles the flow and pins the plan together with the
+    resolved flow snapshot under the batch id (Redis, with a process-local
+    tier in front). Every case of the batch then only loads the pinned plan
+    and injects its own input text, instead of re-reading and recompiling
+    the flow. Pinned plans are immutable, so they need no invalidation.
+
+    Redis is reached through the async client of the running loop, so the
+    batch route and every case read the plan without blocking their loop.
+    """
+
+    def __init__(self, ttl_seconds: int, local_size: int = 64):
+        self.ttl_seconds = ttl_seconds
+        self.local = LocalLRUCache(max_size=local_size, ttl_seconds=ttl_seconds)
+
+    @staticmethod
+    def _key(batch_id: str) -> str:
+        return f"{CACHE_PREFIX.BATCH_PLAN}:{batch_id}"
+
+    async def pin(
+        self, batch_id: str, flow: CachedFlowDefinition
+    ) -> PinnedExecutionPlan:
+        """
+        Compile the flow and pin the plan under batch_id.
+
+        Raises:
+            GraphCompilerError: If the flow graph cannot be compiled
+        """
+        graph = GraphLoader.from_request(CanvasFlowRunRequest(**flow.flow_definition))
+        compiler = GraphCompiler(graph=graph, remove_standalone=False)
+        execution_plan: List[List[str]] = await compiler.async_compile()
+
+        plan = PinnedExecutionPlan(
+            batch_id=batch_id,
+            flow_id=flow.flow_id,
+            version=flow.version,
+            flow_definition=flow.flow_definition,
+            execution_plan=execution_plan,
+        )
+        self.local.set(batch_id, plan)
+        try:
+            await get_async_redis_client().setex(
+                self._key(batch_id), self.ttl_seconds, plan.model_dump_json()
+            )
+        except Exception as e:
+            # Cases that miss the plan compile the flow themselves
+            logger.warning(f"Failed to store pinned plan for batch {batch_id}: {e}")
+        logger.info(
+            f"Pinned execution plan for batch {batch_id} "
+            f"(flow {flow.flow_id}, {len(execution_plan)} layers)"
+        )
+        return plan
+
+    async def get(self, batch_id: str) -> Optional[PinnedExecutionPlan]:
+        """Look up a pinned plan, local tier first then Redis."""
+        plan = self.local.get(batch_id)
+        if plan is not None:
+            return plan
+
+        try:
+            data = await get_async_redis_client().get(self._key(batch_id))
+        except Exception as e:
+            logger.warning(f"Failed to load pinned plan for batch {batch_id}: {e}")
+            return None
+        if not data:
+            return None
+
+        plan = PinnedExecutionPlan.model_validate_json(data)
+        self.local.set(batch_id, plan)
+        return plan
+
+
+_store: Optional[BatchPlanStore] = None
+_store_lock = threading.Lock()
+
+
+def get_batch_plan_store() -> BatchPlanStore:
+    """Get the process-wide batch plan store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                app_settings = get_app_settings()
+                _store = BatchPlanStore(
+                    ttl_seconds=app_settings.BATCH_PLAN_TTL_SECONDS,
+                    local_size=app_settings.BATCH_PLAN_LOCAL_SIZE,
+                )
+    return _store
@@ -1,7 +1,10 @@
 # src/core/cache.py
 import hashlib
 import json
-from typing import Any, List
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
 
 
 def generate_catalog_etag(catalog_data: List[Any]) -> str:
@@ -22,3 +25,69 @@ def generate_catalog_etag(catalog_data: List[Any]) -> str:
 
     # Wrap in quotes for valid ETag format
     return f'"{etag_hash}"'
+
+
+class LocalLRUCache:
+    """
+    Bounded in-process LRU cache with per-entry TTL.
+
+    Used as the first (process-local) tier in front of Redis. Thread-safe so it
+    can be shared between the event loop and worker threads.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            max_size: Maximum number of entries before the least recently used is evicted
+            ttl_seconds: Default time-to-live of an entry (None = no expiry)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing/expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(
+        self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None
+    ) -> None:
+        """Insert or refresh an entry, evicting the LRU entry if full."""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_MISSING = object()
@@ -0,0 +1,249 @@
+# src/core/event_fanout.py
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+
+from loguru import logger
+from redis.asyncio import Redis
+from src.configs.config import get_app_settings
+from src.dependencies.redis_dependency import get_async_redis_client
+
+# (stream entry id, fields)
+FanoutEntry = Tuple[str, Dict[str, Any]]
+
+
+def _parse_stream_id(entry_id: str) -> Tuple[int, int]:
+    ms, _, seq = str(entry_id).partition("-")
+    return int(ms), int(seq or 0)
+
+
+class EventSubscription:
+    """
+    Per-client bounded buffer fed by the process-wide EventFanout.
+
+    Slow consumer policy: when the buffer overflows it is dropped and the
+    missed entries are replayed from Redis (XRANGE from the last delivered id)
+    on the next read, so a slow client never loses events.
+    """
+
+    def __init__(
+        self,
+        fanout: "EventFanout",
+        key: str,
+        max_size: int,
+        last_id: str,
+    ):
+        self.fanout = fanout
+        self.key = key
+        self.last_id = last_id
+        self.dropped = 0
+        self.closed = False
+
+        self._max_size = max_size
+        self._buffer: Deque[FanoutEntry] = deque()
+        self._ready = asyncio.Event()
+        # Start lagged: the first read replays everything after last_id
+        self._lagged = True
+
+    async def get(self, timeout: float) -> Optional[FanoutEntry]:
+        """Next entry in order, or None if nothing arrived within timeout."""
+        while True:
+            while self._buffer:
+                entry_id, data = self._buffer.popleft()
+                if _parse_stream_id(entry_id) <= _parse_stream_id(self.last_id):
+                    continue  # Already delivered by a replay
+                self.last_id = entry_id
+                return entry_id, data
+
+            if self._lagged:
+                await self._replay()
+                continue
+
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+
+    def replay_from(self, entry_id: str) -> None:
+        """Discard buffered entries and replay the stream after entry_id."""
+        self.last_id = entry_id
+        self._buffer.clear()
+        self._lagged = True
+        self._ready.set()
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        if not self.closed:
+            self.closed = True
+            self.fanout.unsubscribe(self)
+
+    def _push(self, entry_id: str, data: Dict[str, Any]) -> None:
+        if self.closed or self._lagged:
+            return
+
+        if len(self._buffer) >= self._max_size:
+            self.dropped += 1
+            logger.warning(
+                f"Slow SSE consumer on {self.key}, replaying from {self.last_id}"
+            )
+            self._buffer.clear()
+            self._lagged = True
+            self._ready.set()
+            return
+
+        self._buffer.append((entry_id, data))
+        self._ready.set()
+
+    async def _replay(self) -> None:
+        # Live entries that arrive while replaying are buffered and de-duplicated
+        self._lagged = False
+        entries = await self.fanout.redis.xrange(
+            self.key, min=f"({self.last_id}", max="+", count=self._max_size
+        )
+        if len(entries) >= self._max_size:
+            # More to replay: serve this page, then read the rest from Redis
+            self._buffer = deque(entries)
+            self._lagged = True
+        else:
+            self._buffer.extendleft(reversed(entries))
+
+
+class EventFanout:
+    """
+    Single per-process reader that multiplexes Redis Streams to SSE clients.
+
+    One task XREADs every subscribed stream and dispatches the entries to
+    in-memory per-client buffers, so Redis connections and commands scale
+    with API processes, not with open browser tabs.
+    """
+
+    def __init__(self, redis_client: Redis):
+        app_settings = get_app_settings()
+
+        self.redis = redis_client
+        self.queue_size = app_settings.EVENT_FANOUT_QUEUE_SIZE
+        self.block_ms = app_settings.EVENT_FANOUT_BLOCK_MS
+        self.read_count = app_settings.EVENT_FANOUT_READ_COUNT
+
+        self._subscriptions: Dict[str, Set[EventSubscription]] = {}
+        self._stream_cursors: Dict[str, str] = {}
+        self._streams_changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._loop = asyncio.get_running_loop()
+
+    async def subscribe_stream(self, key: str, since_id: str) -> EventSubscription:
+        """Subscribe to a Redis Stream, replaying entries after since_id."""
+        latest_id = await self._latest_stream_id(key)
+        subscription = EventSubscription(
+            self,
+            key,
+            max_size=self.queue_size,
+            last_id=latest_id if since_id == "$" else since_id,
+        )
+        self._stream_cursors.setdefault(key, latest_id)
+        self._add(subscription)
+        self._streams_changed.set()
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        subscribers = self._subscriptions.get(subscription.key)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscriptions[subscription.key]
+            self._stream_cursors.pop(subscription.key, None)
+
+    async def stop(self) -> None:
+        """Cancel the reader task (used on app shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.redis.aclose()
+
+    def _add(self, subscription: EventSubscription) -> None:
+        self._subscriptions.setdefault(subscription.key, set()).add(subscription)
+        self._ensure_started()
+
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def _dispatch(self, key: str, entry_id: str, data: Dict[str, Any]) -> None:
+        for subscription in list(self._subscriptions.get(key, ())):
+            subscription._push(entry_id, data)
+
+    async def _latest_stream_id(self, key: str) -> str:
+        entries = await self.redis.xrevrange(key, max="+", min="-", count=1)
+        return entries[0][0] if entries else "0-0"
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._read_streams()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Event fan-out reader failed: {e}")
+                await asyncio.sleep(1)
+
+    async def _read_streams(self) -> None:
+        if not self._stream_cursors:
+            self._streams_changed.clear()
+            await self._streams_changed.wait()
+            return
+
+        events = await self.redis.xread(
+            streams=dict(self._stream_cursors),
+            count=self.read_count,
+            block=self.block_ms,
+        )
+        for key, messages in events or []:
+            if key not in self._stream_cursors:
+                continue  # Unsubscribed while blocked
+            for entry_id, data in messages:
+                self._dispatch(key, entry_id, data)
+            self._stream_cursors[key] = messages[-1][0]
+
+
+_fanout: Optional[EventFanout] = None
+
+
+async def get_event_fanout() -> EventFanout:
+    """
+    Get the event fan-out for the running event loop (one per process).
+    A fan-out left over from another loop is stopped first, so its reader
+    task does not keep polling Redis next to the new one.
+    """
+    global _fanout
+    loop = asyncio.get_running_loop()
+    if _fanout is not None and _fanout._loop is not loop:
+        stale_fanout, _fanout = _fanout, None
+        await _stop_stale_fanout(stale_fanout)
+    if _fanout is None:
+        _fanout = EventFanout(redis_client=get_async_redis_client())
+    return _fanout
+
+
+async def _stop_stale_fanout(fanout: EventFanout) -> None:
+    """Stop a fan-out that belongs to another event loop."""
+    try:
+        if fanout._loop.is_running():
+            # Its tasks can only be cancelled and awaited on their own loop
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(fanout.stop(), fanout._loop)
+            )
+        elif not fanout._loop.is_closed() and fanout._task is not None:
+            # Stopped loop: the cancellation lands when (if) it runs again
+            fanout._task.cancel()
+    except Exception as e:
+        logger.warning(f"Failed to stop the previous event fan-out: {e}")
+
+
+async def stop_event_fanout() -> None:
+    global _fanout
+    if _fanout is not None:
+        await _fanout.stop()
+        _fanout = None
@@ -0,0 +1,172 @@
+# src/core/execution_service.py
+import asyncio
+import contextvars
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Deque, Dict, Optional, TypeVar
+
+from loguru import logger
+from src.configs.config import get_app_settings
+from src.exceptions.execution_exceptions import (
+    ExecutionSaturatedError,
+    TenantExecutionLimitError,
+)
+
+T = TypeVar("T")
+
+
+class InProcessExecutionService:
+    """
+    Bounded in-process runner for API flow runs.
+
+    - At most `max_concurrency` flows execute at once in the API process.
+    - At most `max_queue` more wait for a slot, each for up to
+      `queue_timeout_seconds`.
+    - A tenant may hold at most `per_tenant_limit` running + queued runs, so
+      one noisy tenant cannot take the whole pool.
+
+    Tenant overflow raises TenantExecutionLimitError. Pool saturation raises
+    ExecutionSaturatedError so the caller can hand the run to Celery.
+
+    Admitted flows run on a dedicated thread pool, each on its own event loop,
+    so CPU-bound graph work and any blocking call left in a node cannot stall
+    the API loop. A run keeps its slot until its thread returns, even if the
+    request that started it goes away.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int,
+        per_tenant_limit: int,
+        queue_timeout_seconds: float,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.per_tenant_limit = per_tenant_limit
+        self.queue_timeout_seconds = queue_timeout_seconds
+
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="flow-run"
+        )
+        self._tenant_inflight: Dict[int, int] = {}
+        self._queued = 0
+        self._running = 0
+
+        # Metrics
+        self._queue_times: Deque[float] = deque(maxlen=1000)
+        self._completed = 0
+        self._rejected_tenant = 0
+        self._rejected_saturated = 0
+
+    async def run(
+        self, tenant_id: int, func: Callable[[], Coroutine[Any, Any, T]]
+    ) -> T:
+        """
+        Admit, wait for a slot, then run `func()` on an execution thread.
+
+        `func()` must not use clients bound to the calling event loop: database
+        sessions come from get_task_sessionmaker() (NullPool off the worker
+        loop), Redis clients from get_async_redis_client() (per loop).
+        """
+        self._admit(tenant_id)
+
+        enqueued_at = time.perf_counter()
+        self._queued += 1
+        try:
+            await asyncio.wait_for(
+                self._slots.acquire(), timeout=self.queue_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            self._rejected_saturated += 1
+            self._release_tenant(tenant_id)
+            raise ExecutionSaturatedError(
+                f"No execution slot within {self.queue_timeout_seconds}s"
+            )
+        except BaseException:
+            self._release_tenant(tenant_id)
+            raise
+        finally:
+            self._queued -= 1
+
+        queue_time = time.perf_counter() - enqueued_at
+        self._queue_times.append(queue_time)
+        if queue_time > 1:
+            logger.warning(f"Flow run waited {queue_time:.2f}s for a slot")
+
+        self._running += 1
+        context = contextvars.copy_context()
+        flow_run = asyncio.get_running_loop().run_in_executor(
+            self._executor, context.run, asyncio.run, func()
+        )
+        flow_run.add_done_callback(lambda _flow_run: self._finish(tenant_id))
+        return await asyncio.shield(flow_run)
+
+    def metrics(self) -> Dict[str, float]:
+        """Snapshot of pool usage and queue-time percentiles (ms)."""
+        queue_times = sorted(self._queue_times)
+
+        def percentile(p: float) -> float:
+            if not queue_times:
+                return 0.0
+            index = min(len(queue_times) - 1, int(p * len(queue_times)))
+            return round(queue_times[index] * 1000, 2)
+
+        return {
+            "running": self._running,
+            "queued": self._queued,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "completed": self._completed,
+            "rejected_tenant_limit": self._rejected_tenant,
+            "rejected_saturated": self._rejected_saturated,
+            "queue_time_p50_ms": percentile(0.50),
+            "queue_time_p95_ms": percentile(0.95),
+            "queue_time_max_ms": percentile(1.0),
+        }
+
+    def _admit(self, tenant_id: int) -> None:
+        if self._tenant_inflight.get(tenant_id, 0) >= self.per_tenant_limit:
+            self._rejected_tenant += 1
+            raise TenantExecutionLimitError(
+                f"Too many concurrent runs (limit {self.per_tenant_limit})"
+            )
+
+        # Only queue when a slot can be expected soon, otherwise offload now
+        if self._running >= self.max_concurrency and self._queued >= self.max_queue:
+            self._rejected_saturated += 1
+            raise ExecutionSaturatedError("Execution queue is full")
+
+        self._tenant_inflight[tenant_id] = self._tenant_inflight.get(tenant_id, 0) + 1
+
+    def _finish(self, tenant_id: int) -> None:
+        self._running -= 1
+        self._completed += 1
+        self._slots.release()
+        self._release_tenant(tenant_id)
+
+    def _release_tenant(self, tenant_id: int) -> None:
+        remaining = self._tenant_inflight.get(tenant_id, 1) - 1
+        if remaining > 0:
+            self._tenant_inflight[tenant_id] = remaining
+        else:
+            self._tenant_inflight.pop(tenant_id, None)
+
+
+_execution_service: Optional[InProcessExecutionService] = None
+
+
+def get_execution_service() -> InProcessExecutionService:
+    """Get the API process's in-process execution service."""
+    global _execution_service
+    if _execution_service is None:
+        app_settings = get_app_settings()
+        _execution_service = InProcessExecutionService(
+            max_concurrency=app_settings.EXECUTION_SERVICE_MAX_CONCURRENCY,
+            max_queue=app_settings.EXECUTION_SERVICE_MAX_QUEUE,
+            per_tenant_limit=app_settings.EXECUTION_SERVICE_PER_TENANT_LIMIT,
+            queue_timeout_seconds=app_settings.EXECUTION_SERVICE_QUEUE_TIMEOUT_SECONDS,
+        )
+    return _execution_service
@@ -0,0 +1,90 @@
+# src/core/flow_definition_cache.py
+import threading
+from typing import Optional
+
+from loguru import logger
+from src.configs.config import get_app_settings
+from src.consts.cache_consts import CACHE_PREFIX
+from src.core.cache import LocalLRUCache
+from src.core.invalidation import CacheInvalidationBus, get_invalidation_bus
+from src.dependencies.redis_dependency import get_redis_client
+from src.helpers.CacheHelper import CacheHelper
+from src.schemas.flows.flow_schemas import CachedFlowDefinition
+
+
+class FlowDefinitionCache:
+    """
+    Two-tier cache of flow definitions for the public run API.
+
+    Tier 1 is a process-local LRU, tier 2 is Redis. Writes to a flow call
+    `invalidate`, which drops both tiers and broadcasts the flow id on the
+    invalidation bus so every other process evicts its local copy as well.
+    """
+
+    CHANNEL = "flow-definition"
+
+    def __init__(
+        self,
+        cache_helper: CacheHelper,
+        invalidation_bus: CacheInvalidationBus,
+        local_size: int = 512,
+        local_ttl_seconds: int = 60,
+    ):
+        self.cache_helper = cache_helper
+        self.invalidation_bus = invalidation_bus
+        self.local = LocalLRUCache(max_size=local_size, ttl_seconds=local_ttl_seconds)
+
+        self.invalidation_bus.subscribe(self.CHANNEL, self._on_remote_invalidate)
+
+    @staticmethod
+    def _key(flow_id: str) -> str:
+        return f"{CACHE_PREFIX.FLOW_DEFINITION}:{flow_id}"
+
+    def get(self, flow_id: str) -> Optional[CachedFlowDefinition]:
+        """Look up a flow definition, local tier first then Redis."""
+        entry = self.local.get(flow_id)
+        if entry is not None:
+            return entry
+
+        entry = self.cache_helper.get(self._key(flow_id), CachedFlowDefinition)
+        if entry is not None:
+            self.local.set(flow_id, entry)
+        return entry
+
+    def set(self, entry: CachedFlowDefinition) -> None:
+        """Store a flow definition in both tiers."""
+        self.local.set(entry.flow_id, entry)
+        self.cache_helper.set(self._key(entry.flow_id), entry.model_dump())
+
+    def invalidate(self, flow_id: str) -> None:
+        """Drop a flow from every tier in every process."""
+        self.local.delete(flow_id)
+        self.cache_helper.delete(self._key(flow_id))
+        self.invalidation_bus.publish(self.CHANNEL, flow_id)
+        logger.debug(f"Invalidated cached flow definition {flow_id}")
+
+    def _on_remote_invalidate(self, flow_id: str) -> None:
+        self.local.delete(flow_id)
+
+
+_cache: Optional[FlowDefinitionCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_flow_definition_cache() -> FlowDefinitionCache:
+    """Get the process-wide flow definition cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                app_settings = get_app_settings()
+                _cache = FlowDefinitionCache(
+                    cache_helper=CacheHelper(
+                        get_redis_client(),
+                        ttl=app_settings.FLOW_DEFINITION_CACHE_TTL_SECONDS,
+                    ),
+                    invalidation_bus=get_invalidation_bus(),
+                    local_size=app_settings.FLOW_DEFINITION_CACHE_LOCAL_SIZE,
+                    local_ttl_seconds=app_settings.FLOW_DEFINITION_CACHE_LOCAL_TTL_SECONDS,
+                )
+    return _cache
@@ -0,0 +1,123 @@
+# src/core/invalidation.py
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+from loguru import logger
+from redis import Redis
+from redis.client import PubSub
+from src.dependencies.redis_dependency import get_redis_client
+
+INVALIDATION_CHANNEL_PREFIX = "flowuni:invalidate:"
+
+InvalidationHandler = Callable[[str], None]
+
+
+class CacheInvalidationBus:
+    """
+    Process-wide Redis pub/sub bus used to evict process-local caches.
+
+    A single background thread per process pattern-subscribes to every
+    invalidation channel and dispatches each message to the handlers
+    registered for that channel. Publishing goes through the regular client.
+    """
+
+    def __init__(self, redis_client: Redis):
+        self.redis = redis_client
+        self._handlers: Dict[str, List[InvalidationHandler]] = {}
+        self._lock = threading.Lock()
+        self._pubsub: Optional[PubSub] = None
+        self._thread = None
+        self._pid: Optional[int] = None
+
+    def subscribe(self, channel: str, handler: InvalidationHandler) -> None:
+        """
+        Register a handler for a channel (without prefix) and make sure the
+        listener is running in this process.
+        """
+        with self._lock:
+            self._handlers.setdefault(channel, []).append(handler)
+        self.ensure_started()
+
+    def publish(self, channel: str, message: str) -> None:
+        """Broadcast an invalidation message to every process."""
+        try:
+            self.redis.publish(f"{INVALIDATION_CHANNEL_PREFIX}{channel}", message)
+        except Exception as e:
+            logger.warning(f"Failed to publish invalidation [{channel}]: {e}")
+
+    def ensure_started(self) -> None:
+        """Start (or restart after fork/crash) the listener thread."""
+        with self._lock:
+            alive = self._thread is not None and self._thread.is_alive()
+            if alive and self._pid == os.getpid():
+                return
+
+            try:
+                self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+                self._pubsub.psubscribe(
+                    **{f"{INVALIDATION_CHANNEL_PREFIX}*": self._dispatch}
+                )
+                self._thread = self._pubsub.run_in_thread(
+                    sleep_time=1.0,
+                    daemon=True,
+                    exception_handler=self._on_listener_error,
+                )
+                self._pid = os.getpid()
+                logger.info("Cache invalidation listener started")
+            except Exception as e:
+                # Local caches still expire by TTL, so degrade instead of failing
+                logger.warning(f"Cache invalidation listener unavailable: {e}")
+                self._thread = None
+
+    def is_healthy(self) -> bool:
+        """Whether the listener is running in this process."""
+        return (
+            self._thread is not None
+            and self._thread.is_alive()
+            and self._pid == os.getpid()
+        )
+
+    def stop(self) -> None:
+        """Stop the listener thread (used on app shutdown)."""
+        with self._lock:
+            if self._thread is not None:
+                self._thread.stop()
+                self._thread = None
+            if self._pubsub is not None:
+                self._pubsub.close()
+                self._pubsub = None
+
+    def _dispatch(self, message: Dict) -> None:
+        channel = message.get("channel") or ""
+        data = message.get("data")
+        if isinstance(channel, bytes):
+            channel = channel.decode("utf-8")
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+
+        channel = channel[len(INVALIDATION_CHANNEL_PREFIX) :]
+        for handler in list(self._handlers.get(channel, [])):
+            try:
+                handler(data)
+            except Exception as e:
+                logger.warning(f"Invalidation handler error [{channel}]: {e}")
+
+    def _on_listener_error(self, exc: Exception, pubsub: PubSub, thread) -> None:
+        logger.warning(f"Cache invalidation listener stopped: {exc}")
+        thread.stop()
+        pubsub.close()
+
+
+_bus: Optional[CacheInvalidationBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_invalidation_bus() -> CacheInvalidationBus:
+    """Get the process-wide invalidation bus."""
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = CacheInvalidationBus(redis_client=get_redis_client())
+    return _bus
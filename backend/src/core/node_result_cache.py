@@ -0,0 +1,62 @@
+# src/core/node_result_cache.py
+import copy
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from src.configs.config import get_app_settings
+from src.core.cache import LocalLRUCache
+from src.nodes.core.NodeCachePolicy import NodeCachePolicy
+
+
+class NodeResultCache:
+    """
+    Process-local memo of node outputs for nodes whose spec opts in with a
+    cache policy, keyed by node type, parameters and input values.
+
+    Bounded (LRU) so hot flows keep their entries while one-off inputs age
+    out. Values are copied in and out: downstream nodes may mutate what they
+    receive.
+    """
+
+    def __init__(self, max_size: int):
+        self.local = LocalLRUCache(max_size=max_size)
+
+    @staticmethod
+    def make_key(
+        node_type: str, parameter_values: Dict[str, Any], input_values: Dict[str, Any]
+    ) -> Optional[str]:
+        """Cache key of a node call, None when its values are not JSON data."""
+        try:
+            data = json.dumps(
+                [node_type, parameter_values, input_values],
+                sort_keys=True,
+                separators=(",", ":"),
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        output_values = self.local.get(key)
+        return copy.deepcopy(output_values) if output_values is not None else None
+
+    def set(
+        self, key: str, output_values: Dict[str, Any], policy: NodeCachePolicy
+    ) -> None:
+        ttl_seconds = policy.ttl_seconds if policy.mode == "ttl" else None
+        self.local.set(key, copy.deepcopy(output_values), ttl_seconds=ttl_seconds)
+
+
+_node_result_cache: Optional[NodeResultCache] = None
+
+
+def get_node_result_cache() -> Optional[NodeResultCache]:
+    """Get the process-wide node result cache, None when it is disabled."""
+    global _node_result_cache
+    max_size = get_app_settings().NODE_RESULT_CACHE_SIZE
+    if max_size <= 0:
+        return None
+    if _node_result_cache is None:
+        _node_result_cache = NodeResultCache(max_size=max_size)
+    return _node_result_cache
@@ -0,0 +1,59 @@
+# src/core/run_cancellation.py
+import time
+from typing import Iterable, Optional
+
+from redis.asyncio import Redis as AsyncRedis
+from src.configs.config import get_app_settings
+from src.dependencies.redis_dependency import get_async_redis_client
+
+TEST_CANCEL_KEY = "test_cancel:runs"
+
+
+class RunCancellation:
+    """
+    Redis set of cancelled test run ids.
+
+    The cancel routes add ids here before touching the database, and running
+    executors check it between layers, so cancelled runs stop within one
+    layer even when they share a worker task (chunked batches) and cannot be
+    revoked on their own. Members are scored by their expiry (ms) and pruned
+    on write, so the set stays bounded without a key per run.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_ms = ttl_seconds * 1000
+
+    @staticmethod
+    def _redis() -> AsyncRedis:
+        return get_async_redis_client()
+
+    async def mark_cancelled(self, task_ids: Iterable[str]) -> None:
+        """Flag runs as cancelled (one round trip for any number of ids)."""
+        task_ids = list(task_ids)
+        if not task_ids:
+            return
+
+        now_ms = int(time.time() * 1000)
+        expires_at = now_ms + self.ttl_ms
+        async with self._redis().pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(TEST_CANCEL_KEY, "-inf", now_ms)
+            pipe.zadd(TEST_CANCEL_KEY, dict.fromkeys(task_ids, expires_at))
+            pipe.pexpire(TEST_CANCEL_KEY, self.ttl_ms)
+            await pipe.execute()
+
+    async def is_cancelled(self, task_id: str) -> bool:
+        expires_at = await self._redis().zscore(TEST_CANCEL_KEY, task_id)
+        return expires_at is not None and expires_at > time.time() * 1000
+
+
+_cancellation: Optional[RunCancellation] = None
+
+
+def get_run_cancellation() -> RunCancellation:
+    """Get the process-wide test run cancellation set."""
+    global _cancellation
+    if _cancellation is None:
+        _cancellation = RunCancellation(
+            ttl_seconds=get_app_settings().TEST_CANCEL_TTL_SECONDS
+        )
+    return _cancellation
@@ -0,0 +1,114 @@
+# src/core/run_result_writer.py
+import asyncio
+from typing import Any, Dict, Optional
+
+from loguru import logger
+from src.configs.config import get_app_settings
+from src.dependencies.db_dependency import get_task_sessionmaker
+from src.models.alchemy.flows.FlowTestCaseRunModel import TestCaseRunStatus
+from src.repositories.FlowTestRepository import FlowTestRepository
+from src.services.FlowTestService import FlowTestService
+
+TERMINAL_RUN_STATUSES = {
+    TestCaseRunStatus.PASSED,
+    TestCaseRunStatus.FAILED,
+    TestCaseRunStatus.CANCELLED,
+    TestCaseRunStatus.SYSTEM_ERROR,
+}
+
+
+class RunResultWriter:
+    """
+    Buffered writer for test case run status and results.
+
+    Updates are coalesced per run (later fields win) and written with one
+    `UPDATE ... FROM (VALUES ...)` per flush, so QUEUED -> RUNNING -> result
+    transitions of many concurrent cases cost a handful of statements instead
+    of a SELECT + UPDATE + commit each.
+
+    A flush happens after `flush_interval_ms`, when `batch_size` runs are
+    buffered, or immediately (awaited) when a run reaches a terminal status.
+    One writer per event loop; live progress is streamed through events, the
+    database only lags by at most one flush interval.
+    """
+
+    def __init__(self, flush_interval_ms: int, batch_size: int):
+        self.flush_interval = flush_interval_ms / 1000
+        self.batch_size = batch_size
+        self.service = FlowTestService(test_repository=FlowTestRepository())
+
+        self._buffer: Dict[str, Dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop = asyncio.get_running_loop()
+
+    async def update(self, run_id: str, **fields: Any) -> None:
+        """Buffer an update of a run (None values are ignored)."""
+        pending = self._buffer.setdefault(run_id, {})
+        pending.update({k: v for k, v in fields.items() if v is not None})
+
+        status = fields.get("status")
+        if status is not None and TestCaseRunStatus(status) in TERMINAL_RUN_STATUSES:
+            await self.flush()
+        elif len(self._buffer) >= self.batch_size:
+            await self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(
+                self.flush_interval, self._flush_later
+            )
+
+    async def flush(self) -> None:
+        """Write every buffered update now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        async with self._lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, {}
+
+            try:
+                async with get_task_sessionmaker()() as session:
+                    await self.service.bulk_update_test_case_runs(
+                        session=session, updates=batch
+                    )
+                    await session.commit()
+            except Exception:
+                # Put the batch back under anything buffered meanwhile
+                for run_id, fields in batch.items():
+                    self._buffer[run_id] = {**fields, **self._buffer.get(run_id, {})}
+                raise
+
+    def _flush_later(self) -> None:
+        self._flush_handle = None
+        task = self._loop.create_task(self.flush())
+        task.add_done_callback(self._log_flush_error)
+
+    @staticmethod
+    def _log_flush_error(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Failed to flush test run updates: {task.exception()}")
+
+
+_writer: Optional[RunResultWriter] = None
+
+
+def get_run_result_writer() -> RunResultWriter:
+    """Get the test run writer of the running event loop."""
+    global _writer
+    if _writer is None or _writer._loop is not asyncio.get_running_loop():
+        app_settings = get_app_settings()
+        _writer = RunResultWriter(
+            flush_interval_ms=app_settings.TEST_RUN_WRITE_FLUSH_INTERVAL_MS,
+            batch_size=app_settings.TEST_RUN_WRITE_BATCH_SIZE,
+        )
+    return _writer
+
+
+async def close_run_result_writer() -> None:
+    """Flush pending updates (used on worker shutdown)."""
+    global _writer
+    if _writer is not None:
+        await _writer.flush()
+        _writer = None
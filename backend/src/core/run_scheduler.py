@@ -0,0 +1,212 @@
+# src/core/run_scheduler.py
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+from redis import Redis
+from src.core.semaphore import (
+    SEMAPHORE_TTL,
+    USER_LIMIT,
+    get_user_slot_key,
+    release_user_slot_sync,
+)
+from src.dependencies.redis_dependency import get_redis_client
+
+TEST_SCHEDULER_PREFIX = "test_sched:"
+
+RunJob = Dict[str, Any]
+RunSender = Callable[[RunJob], None]
+
+# ==========================
+# Lua script (dispatch one job of a user)
+# ==========================
+# Pops the head of the user's FIFO queue only if the user has a free slot,
+# taking the slot in the same step, then moves the user to the tail of the
+# round-robin ring (or drops it when its queue is empty).
+LUA_DISPATCH_USER = """
+local queue_key = KEYS[1]
+local slot_key = KEYS[2]
+local users_key = KEYS[3]
+local jobs_key = KEYS[4]
+local seq_key = KEYS[5]
+local limit = tonumber(ARGV[1])
+local ttl_ms = tonumber(ARGV[2])
+local user_id = ARGV[3]
+
+local head = redis.call('ZRANGE', queue_key, 0, 0, 'WITHSCORES')
+if #head == 0 then
+  redis.call('ZREM', users_key, user_id)
+  return nil
+end
+
+-- Take a slot lease named after the task id (see core/semaphore.py)
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+redis.call('ZREMRANGEBYSCORE', slot_key, '-inf', now)
+if redis.call('ZCARD', slot_key) >= limit then
+  return nil
+end
+
+redis.call('ZADD', slot_key, now + ttl_ms, head[1])
+if redis.call('PTTL', slot_key) < ttl_ms then
+  redis.call('PEXPIRE', slot_key, ttl_ms)
+end
+redis.call('ZREM', queue_key, head[1])
+
+if redis.call('ZCARD', queue_key) == 0 then
+  redis.call('ZREM', users_key, user_id)
+else
+  redis.call('ZADD', users_key, redis.call('INCR', seq_key), user_id)
+end
+
+local payload = redis.call('HGET', jobs_key, head[1])
+if not payload then
+  -- Cancelled between enqueue and dispatch
+  redis.call('ZREM', slot_key, head[1])
+  return nil
+end
+redis.call('HDEL', jobs_key, head[1])
+return {payload, head[2]}
+"""
+
+
+class RunScheduler:
+    """
+    Fair scheduler for test runs backed by Redis sorted sets.
+
+    A dispatched run holds a slot lease whose id is its task id; the lease is
+    kept alive by run_flow_test's heartbeat and released when it finishes.
+
+    - Every user has a FIFO queue (`test_sched:queue:{user_id}`, scored by a
+      global sequence) of test runs waiting for one of their slots.
+    - Users with waiting work sit in a round-robin ring (`test_sched:users`);
+      each dispatch moves the served user to the tail, so a user with a large
+      batch cannot starve the others.
+    - Dispatch happens on enqueue and whenever a slot is released, instead of
+      tasks polling for a slot with retry countdowns.
+    """
+
+    def __init__(self, redis_client: Redis):
+        self.redis = redis_client
+        self.users_key = f"{TEST_SCHEDULER_PREFIX}users"
+        self.jobs_key = f"{TEST_SCHEDULER_PREFIX}jobs"
+        self.seq_key = f"{TEST_SCHEDULER_PREFIX}seq"
+        self.watchdog_key = f"{TEST_SCHEDULER_PREFIX}watchdog"
+        self._dispatch_script = redis_client.register_script(LUA_DISPATCH_USER)
+
+    def _queue_key(self, user_id: int) -> str:
+        return f"{TEST_SCHEDULER_PREFIX}queue:{user_id}"
+
+    def enqueue(self, job: RunJob) -> None:
+        """Append a test run to the end of its user's queue."""
+        task_id = job["task_id"]
+        user_id = job["user_id"]
+
+        seq = self.redis.incr(self.seq_key)
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(self.jobs_key, task_id, json.dumps(job))
+        pipe.zadd(self._queue_key(user_id), {task_id: seq})
+        pipe.zadd(self.users_key, {str(user_id): seq}, nx=True)
+        pipe.execute()
+
+    def cancel(self, task_id: str) -> bool:
+        """Drop a test run that is still waiting. Returns True if it was queued."""
+        return task_id in self.cancel_many([task_id])
+
+    def cancel_many(self, task_ids: List[str]) -> List[str]:
+        """
+        Drop the runs of task_ids that are still waiting, in two round trips
+        whatever their number. Returns the ids that were queued.
+        """
+        if not task_ids:
+            return []
+
+        queued = [
+            (task_id, json.loads(payload)["user_id"])
+            for task_id, payload in zip(
+                task_ids, self.redis.hmget(self.jobs_key, task_ids)
+            )
+            if payload is not None
+        ]
+        if not queued:
+            return []
+
+        pipe = self.redis.pipeline(transaction=True)
+        for task_id, user_id in queued:
+            pipe.zrem(self._queue_key(user_id), task_id)
+        pipe.hdel(self.jobs_key, *(task_id for task_id, _ in queued))
+        removed = pipe.execute()[:-1]
+        return [task_id for (task_id, _), hit in zip(queued, removed) if hit]
+
+    def is_queued(self, task_id: str) -> bool:
+        return bool(self.redis.hexists(self.jobs_key, task_id))
+
+    def has_waiting(self) -> bool:
+        return bool(self.redis.zcard(self.users_key))
+
+    def claim_watchdog(self, seconds: int) -> bool:
+        """Return True for at most one caller per `seconds` window."""
+        return bool(self.redis.set(self.watchdog_key, 1, nx=True, ex=seconds))
+
+    def release_watchdog(self) -> None:
+        self.redis.delete(self.watchdog_key)
+
+    def dispatch_user(self, user_id: int, send: RunSender) -> Optional[RunJob]:
+        """Dispatch the next queued run of a user if they have a free slot."""
+        result = self._dispatch_script(
+            keys=[
+                self._queue_key(user_id),
+                get_user_slot_key(user_id),
+                self.users_key,
+                self.jobs_key,
+                self.seq_key,
+            ],
+            args=[USER_LIMIT, SEMAPHORE_TTL * 1000, str(user_id)],
+        )
+        if not result:
+            return None
+
+        payload, score = result
+        job = json.loads(payload)
+        try:
+            send(job)
+        except Exception as e:
+            logger.error(f"Failed to dispatch test run {job['task_id']}: {e}")
+            release_user_slot_sync(user_id, job["task_id"])
+            self._requeue(job, float(score))
+            raise
+        return job
+
+    def dispatch_ready(self, send: RunSender) -> List[RunJob]:
+        """
+        Dispatch queued runs round-robin across users until every waiting user
+        is out of slots. Returns the dispatched jobs.
+        """
+        dispatched: List[RunJob] = []
+        while True:
+            progressed = False
+            for user_id in self.redis.zrange(self.users_key, 0, -1):
+                job = self.dispatch_user(int(user_id), send)
+                if job is not None:
+                    dispatched.append(job)
+                    progressed = True
+            if not progressed:
+                return dispatched
+
+    def _requeue(self, job: RunJob, score: float) -> None:
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(self.jobs_key, job["task_id"], json.dumps(job))
+        pipe.zadd(self._queue_key(job["user_id"]), {job["task_id"]: score})
+        pipe.zadd(self.users_key, {str(job["user_id"]): score}, nx=True)
+        pipe.execute()
+
+
+_run_scheduler: Optional[RunScheduler] = None
+
+
+def get_run_scheduler() -> RunScheduler:
+    """Get the process-wide test run scheduler."""
+    global _run_scheduler
+    if _run_scheduler is None:
+        _run_scheduler = RunScheduler(redis_client=get_redis_client())
+    return _run_scheduler
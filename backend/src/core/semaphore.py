@@ -1,81 +1,216 @@
-import redis
+import threading
+from typing import Optional
+
+from loguru import logger
 from src.configs.config import get_app_settings
+from src.dependencies.redis_dependency import get_async_redis_client, get_redis_client
+from src.exceptions.execution_exceptions import UserSlotUnavailableError
 
 app_settings = get_app_settings()
 
-REDIS_HOST = app_settings.REDIS_HOST
-REDIS_PORT = app_settings.REDIS_PORT
-REDIS_DB = app_settings.REDIS_DB
-
-REDIS_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
-
 USER_LIMIT = (
     app_settings.LIMIT_TEST_CASE_PER_USER
 )  # Mỗi user tối đa 3 slot chạy đồng thời
 SEMAPHORE_TTL = (
     app_settings.LIMIT_TTL_TEST_CASE_SEMAPHORE_PER_USER_SECONDS
-)  # 1 giờ, phòng trường hợp task chết đột ngột
+)  # Lease của task đã dispatch nhưng chưa bắt đầu chạy
+LEASE_TTL = (
+    app_settings.TEST_SLOT_LEASE_TTL_SECONDS
+)  # Lease của task đang chạy, được gia hạn bằng heartbeat
+HEARTBEAT_INTERVAL = app_settings.TEST_SLOT_HEARTBEAT_SECONDS
 
-redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+redis_client = get_redis_client()
 
 # ==========================
-# Lua script (semaphore)
+# Lua scripts (lease semaphore)
 # ==========================
+# Each user's slots are a sorted set of lease ids scored by their expiry
+# (ms, Redis server clock). Expired leases are purged before counting, so a
+# slot held by a crashed worker frees itself after at most one lease TTL.
 LUA_ACQUIRE = """
 local key = KEYS[1]
 local limit = tonumber(ARGV[1])
-local ttl = tonumber(ARGV[2])
+local ttl_ms = tonumber(ARGV[2])
+local lease_id = ARGV[3]
 
-local current_val = redis.call('INCR', key)
-if tonumber(current_val) > limit then
-  redis.call('DECR', key)
-  return 0
-else
-  -- Set TTL để tránh deadlock nếu worker chết
-  redis.call('EXPIRE', key, ttl)
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now)
+if redis.call('ZSCORE', key, lease_id) then
   return 1
 end
+if redis.call('ZCARD', key) >= limit then
+  return 0
+end
+redis.call('ZADD', key, now + ttl_ms, lease_id)
+if redis.call('PTTL', key) < ttl_ms then
+  redis.call('PEXPIRE', key, ttl_ms)
+end
+return 1
 """
 
-LUA_RELEASE = """
+# Extends a lease that is still held. `force` re-creates it even if it expired
+# (used when a dispatched task finally starts), but only while the user is
+# under its limit: the freed slot may have been taken by another run.
+LUA_RENEW = """
 local key = KEYS[1]
-local current_val = redis.call('DECR', key)
--- Nếu giảm xuống dưới 0 (hiếm khi xảy ra), reset về 0
-if tonumber(current_val) < 0 then
-    redis.call('SET', key, 0)
+local ttl_ms = tonumber(ARGV[1])
+local lease_id = ARGV[2]
+local force = ARGV[3] == '1'
+local limit = tonumber(ARGV[4])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local expires_at = redis.call('ZSCORE', key, lease_id)
+if not expires_at or tonumber(expires_at) <= now then
+  redis.call('ZREM', key, lease_id)
+  if not force then
+    return 0
+  end
+  redis.call('ZREMRANGEBYSCORE', key, '-inf', now)
+  if redis.call('ZCARD', key) >= limit then
+    return 0
+  end
+end
+redis.call('ZADD', key, now + ttl_ms, lease_id)
+if redis.call('PTTL', key) < ttl_ms then
+  redis.call('PEXPIRE', key, ttl_ms)
 end
 return 1
 """
 
-# Đăng ký script với Redis để tối ưu hoá
-# Redis sẽ cache script và trả về SHA hash, lần sau chỉ cần gọi bằng SHA
 acquire_script = redis_client.register_script(LUA_ACQUIRE)
-release_script = redis_client.register_script(LUA_RELEASE)
+renew_script = redis_client.register_script(LUA_RENEW)
+
+
+def get_user_slot_key(user_id: int) -> str:
+    return f"semaphore:user_leases:{user_id}"
 
 
 ### === Asynchronous version ===
-# async def acquire_user_slot(user_id: int) -> bool:
-#     """Cố gắng chiếm một slot cho user."""
-#     key = f"semaphore:user:{user_id}"
-#     result = await acquire_script(keys=[key], args=[USER_LIMIT, SEMAPHORE_TTL])
-#     return result == 1
+async def acquire_user_slot(user_id: int, lease_id: str) -> bool:
+    """Cố gắng chiếm một slot cho user (idempotent per lease_id)."""
+    result = await get_async_redis_client().eval(
+        LUA_ACQUIRE,
+        1,
+        get_user_slot_key(user_id),
+        USER_LIMIT,
+        SEMAPHORE_TTL * 1000,
+        lease_id,
+    )
+    return result == 1
 
 
-# async def release_user_slot(user_id: int):
-#     """Giải phóng một slot của user."""
-#     key = f"semaphore:user:{user_id}"
-#     await release_script(keys=[key])
+async def renew_user_slot(user_id: int, lease_id: str, force: bool = False) -> bool:
+    """
+    Gia hạn lease. Returns False if the lease had already expired (with
+    force: if it expired and the user has no free slot to take back).
+    """
+    result = await get_async_redis_client().eval(
+        LUA_RENEW,
+        1,
+        get_user_slot_key(user_id),
+        LEASE_TTL * 1000,
+        lease_id,
+        int(force),
+        USER_LIMIT,
+    )
+    return result == 1
+
 
+async def release_user_slot(user_id: int, lease_id: str) -> bool:
+    """Giải phóng slot. Safe to call more than once."""
+    removed = await get_async_redis_client().zrem(get_user_slot_key(user_id), lease_id)
+    return removed == 1
 
-def acquire_user_slot_sync(user_id: int) -> bool:
+
+### === Synchronous version ===
+def acquire_user_slot_sync(user_id: int, lease_id: str) -> bool:
     """Synchronous version of acquire_user_slot."""
-    key = f"semaphore:user:{user_id}"
-    # Use sync Redis client with the same Lua script
-    result = redis_client.eval(LUA_ACQUIRE, 1, key, USER_LIMIT, SEMAPHORE_TTL)
+    result = acquire_script(
+        keys=[get_user_slot_key(user_id)],
+        args=[USER_LIMIT, SEMAPHORE_TTL * 1000, lease_id],
+    )
+    return result == 1
+
+
+def renew_user_slot_sync(user_id: int, lease_id: str, force: bool = False) -> bool:
+    """Synchronous version of renew_user_slot."""
+    result = renew_script(
+        keys=[get_user_slot_key(user_id)],
+        args=[LEASE_TTL * 1000, lease_id, int(force), USER_LIMIT],
+    )
     return result == 1
 
 
-def release_user_slot_sync(user_id: int):
+def release_user_slot_sync(user_id: int, lease_id: str) -> bool:
     """Synchronous version of release_user_slot."""
-    key = f"semaphore:user:{user_id}"
-    redis_client.eval(LUA_RELEASE, 1, key)
+    return redis_client.zrem(get_user_slot_key(user_id), lease_id) == 1
+
+
+class UserSlotHeartbeat:
+    """
+    Keeps a slot lease alive from a background thread while a task runs.
+
+    The thread only talks to Redis, so it keeps beating while the task's own
+    thread is blocked on the worker event loop. Usage:
+
+        with UserSlotHeartbeat(user_id, lease_id):
+            ...
+    """
+
+    def __init__(self, user_id: int, lease_id: str):
+        self.user_id = user_id
+        self.lease_id = lease_id
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "UserSlotHeartbeat":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Raises:
+            UserSlotUnavailableError: The dispatch lease expired while the
+            task waited in the broker and the user's slots are all taken
+        """
+        # Re-establish the lease in case the task waited in the broker longer
+        # than its dispatch lease
+        if not renew_user_slot_sync(self.user_id, self.lease_id, force=True):
+            raise UserSlotUnavailableError(
+                f"User {self.user_id} has no free slot for {self.lease_id}"
+            )
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"slot-heartbeat-{self.lease_id}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(HEARTBEAT_INTERVAL):
+            try:
+                if not renew_user_slot_sync(self.user_id, self.lease_id):
+                    # Missed heartbeats (e.g. Redis blip): the task is still
+                    # running, so take the slot back if it is still free.
+                    # Otherwise keep trying on the next beats
+                    logger.warning(f"Slot lease {self.lease_id} expired, reclaiming")
+                    if not renew_user_slot_sync(
+                        self.user_id, self.lease_id, force=True
+                    ):
+                        logger.error(
+                            f"Slot of {self.lease_id} was taken by another run "
+                            f"of user {self.user_id}"
+                        )
+            except Exception as e:
+                logger.warning(f"Slot lease heartbeat failed for {self.lease_id}: {e}")
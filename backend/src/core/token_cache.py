@@ -0,0 +1,220 @@
+# src/core/token_cache.py
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from loguru import logger
+from redis import Redis
+from src.configs.config import get_app_settings
+from src.core.cache import LocalLRUCache
+from src.core.invalidation import CacheInvalidationBus, get_invalidation_bus
+from src.dependencies.redis_dependency import get_redis_client
+
+TOKEN_BLACKLIST_PREFIX = "blacklist:token:"
+
+
+class TokenClaimsCache:
+    """
+    Process-local cache of verified JWT claims, keyed by the raw token.
+
+    Entries live until the token's own `exp`, so a cached token can never be
+    accepted past its expiry.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.local = LocalLRUCache(max_size=max_size)
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return cached claims for a token that has not expired yet."""
+        claims = self.local.get(token)
+        if claims is None:
+            return None
+        if claims.get("exp") is not None and claims["exp"] <= time.time():
+            self.local.delete(token)
+            return None
+        return claims
+
+    def set(self, token: str, claims: Dict[str, Any]) -> None:
+        """Cache verified claims until the token expires."""
+        exp = claims.get("exp")
+        if exp is None:
+            return
+        ttl = float(exp) - time.time()
+        if ttl > 0:
+            self.local.set(token, claims, ttl_seconds=ttl)
+
+
+class TokenRevocationFilter:
+    """
+    In-process set of revoked token ids (jti), kept in sync with Redis.
+
+    Redis `blacklist:token:<jti>` keys stay the source of truth. A background
+    thread re-scans them every `resync_seconds` and new revocations arrive
+    over the invalidation bus, so checks never SCAN on the request path.
+    Entries are only dropped once their token would have expired anyway.
+
+    The filter is only trusted while both feeds are up: until the first sync,
+    after a failed sync, when the last sync is overdue or while the pub/sub
+    listener is down, checks fall back to a Redis EXISTS (fail secure).
+    """
+
+    CHANNEL = "token-revocation"
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        invalidation_bus: CacheInvalidationBus,
+        resync_seconds: int = 60,
+    ):
+        self.redis = redis_client
+        self.invalidation_bus = invalidation_bus
+        self.resync_seconds = resync_seconds
+        # jti -> monotonic expiry; not size-bounded so nothing revoked is
+        # evicted early (it holds as many entries as Redis does)
+        self._revoked: Dict[str, Optional[float]] = {}
+        self._revoked_lock = threading.Lock()
+        self._synced_at: Optional[float] = None
+        self._sync_failed = False
+        self._sync_lock = threading.Lock()
+        self._sync_thread: Optional[threading.Thread] = None
+        self._sync_pid: Optional[int] = None
+        self._stop_event = threading.Event()
+
+        self.invalidation_bus.subscribe(self.CHANNEL, self._on_revoked)
+
+    def revoke(self, jti: str, ttl_seconds: int) -> None:
+        """Persist a revocation in Redis and broadcast it to every process."""
+        self.redis.setex(f"{TOKEN_BLACKLIST_PREFIX}{jti}", ttl_seconds, "blacklisted")
+        self._add(jti, ttl_seconds)
+        self.invalidation_bus.publish(self.CHANNEL, f"{jti}:{ttl_seconds}")
+
+    def is_revoked(self, jti: str) -> bool:
+        """Check a token id against the local filter, or Redis if it is stale."""
+        self.ensure_sync_started()
+        if not self.invalidation_bus.is_healthy():
+            self.invalidation_bus.ensure_started()
+            return self._exists_in_redis(jti)
+        if not self.is_fresh():
+            return self._exists_in_redis(jti)
+
+        with self._revoked_lock:
+            if jti not in self._revoked:
+                return False
+            expires_at = self._revoked[jti]
+            return expires_at is None or expires_at > time.monotonic()
+
+    def is_fresh(self) -> bool:
+        """Whether the last sync succeeded and is not overdue."""
+        return (
+            not self._sync_failed
+            and self._synced_at is not None
+            and time.monotonic() - self._synced_at <= self.resync_seconds * 2
+        )
+
+    def ensure_sync_started(self) -> None:
+        """Start (or restart after fork/crash) the background sync thread."""
+        alive = self._sync_thread is not None and self._sync_thread.is_alive()
+        if alive and self._sync_pid == os.getpid():
+            return
+        with self._sync_lock:
+            alive = self._sync_thread is not None and self._sync_thread.is_alive()
+            if alive and self._sync_pid == os.getpid():
+                return
+            self._stop_event.clear()
+            self._sync_thread = threading.Thread(
+                target=self._sync_loop, name="token-revocation-sync", daemon=True
+            )
+            self._sync_pid = os.getpid()
+            self._sync_thread.start()
+
+    def stop(self) -> None:
+        """Stop the background sync thread."""
+        self._stop_event.set()
+
+    def sync(self) -> None:
+        """Reload all live revocations from Redis and drop the expired ones."""
+        try:
+            keys = list(
+                self.redis.scan_iter(match=f"{TOKEN_BLACKLIST_PREFIX}*", count=1000)
+            )
+            pipe = self.redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.ttl(key)
+            ttls = pipe.execute() if keys else []
+        except Exception as e:
+            self._sync_failed = True
+            logger.warning(f"Token revocation filter sync failed: {e}")
+            return
+
+        for key, ttl in zip(keys, ttls):
+            if isinstance(key, bytes):
+                key = key.decode("utf-8")
+            if ttl and ttl > 0:
+                self._add(key[len(TOKEN_BLACKLIST_PREFIX) :], ttl)
+
+        now = time.monotonic()
+        with self._revoked_lock:
+            expired = [
+                jti
+                for jti, expires_at in self._revoked.items()
+                if expires_at is not None and expires_at <= now
+            ]
+            for jti in expired:
+                del self._revoked[jti]
+
+        self._synced_at = now
+        self._sync_failed = False
+        logger.debug(f"Token revocation filter synced ({len(keys)} entries)")
+
+    def _sync_loop(self) -> None:
+        while not self._stop_event.is_set():
+            self.sync()
+            self._stop_event.wait(self.resync_seconds)
+
+    def _exists_in_redis(self, jti: str) -> bool:
+        return bool(self.redis.exists(f"{TOKEN_BLACKLIST_PREFIX}{jti}"))
+
+    def _add(self, jti: str, ttl_seconds: Optional[int]) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        with self._revoked_lock:
+            current = self._revoked.get(jti, 0.0)
+            # Keep the later expiry (None = no known expiry, kept)
+            if current is None or (expires_at is not None and expires_at < current):
+                return
+            self._revoked[jti] = expires_at
+
+    def _on_revoked(self, message: str) -> None:
+        jti, _, ttl = message.rpartition(":")
+        self._add(jti, int(ttl) if ttl.isdigit() else None)
+
+
+_claims_cache: Optional[TokenClaimsCache] = None
+_revocation_filter: Optional[TokenRevocationFilter] = None
+_lock = threading.Lock()
+
+
+def get_token_claims_cache() -> TokenClaimsCache:
+    """Get the process-wide JWT claims cache."""
+    global _claims_cache
+    if _claims_cache is None:
+        with _lock:
+            if _claims_cache is None:
+                _claims_cache = TokenClaimsCache(
+                    max_size=get_app_settings().AUTH_CLAIMS_CACHE_SIZE
+                )
+    return _claims_cache
+
+
+def get_token_revocation_filter() -> TokenRevocationFilter:
+    """Get the process-wide token revocation filter."""
+    global _revocation_filter
+    if _revocation_filter is None:
+        with _lock:
+            if _revocation_filter is None:
+                _revocation_filter = TokenRevocationFilter(
+                    redis_client=get_redis_client(),
+                    invalidation_bus=get_invalidation_bus(),
+                    resync_seconds=get_app_settings().AUTH_REVOCATION_RESYNC_SECONDS,
+                )
+    return _revocation_filter
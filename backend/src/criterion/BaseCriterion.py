@@ -4,9 +4,17 @@ from src.models.validators.PassCriteriaRunnerModels import CheckResult
 
 
 class Criterion(ABC):
+    # Relative evaluation cost: 0 = cheap and deterministic, higher = slower
+    # or billed (e.g. an LLM call). Cheap criteria are evaluated first.
+    cost: int = 0
+
     def __init__(self, id: str):
         self.id = id
 
     @abstractmethod
     def run(self) -> CheckResult:
         """Execute the check and return its result."""
+
+    async def arun(self) -> CheckResult:
+        """Async variant of run(); cheap criteria just run inline."""
+        return self.run()
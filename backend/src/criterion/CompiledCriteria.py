@@ -0,0 +1,66 @@
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel
+from src.configs.config import get_app_settings
+from src.core.cache import LocalLRUCache
+from src.models.parsers import LLMJudgeRuleParser, RegexRuleParser, StringRuleParser
+from src.models.validators.PassCriteriaValidator import PassCriteriaValidator
+
+_RULE_PARSERS = {
+    "llm_judge": LLMJudgeRuleParser,
+    "string": StringRuleParser,
+    "regex": RegexRuleParser,
+}
+
+
+class CompiledRule(BaseModel):
+    type: str
+    id: int
+    rule: Union[LLMJudgeRuleParser, RegexRuleParser, StringRuleParser]
+
+
+class CompiledCriteria(BaseModel):
+    """A case's pass_criteria, validated and parsed once. Treat as read-only."""
+
+    logics: Optional[List[str]] = None
+    rules: List[CompiledRule] = []
+
+
+_compiled_cache = LocalLRUCache(max_size=get_app_settings().PASS_CRITERIA_CACHE_SIZE)
+
+
+def criteria_hash(pass_criteria: Dict[str, Any]) -> str:
+    """Stable hash of a pass_criteria document."""
+    data = json.dumps(pass_criteria, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def compile_pass_criteria(pass_criteria: Dict[str, Any]) -> CompiledCriteria:
+    """
+    Validate and parse pass_criteria into typed rules, cached by criteria hash
+    so re-runs of a suite, and cases sharing rules, skip the pydantic work.
+    """
+    key = criteria_hash(pass_criteria)
+    compiled = _compiled_cache.get(key)
+    if compiled is not None:
+        return compiled
+
+    validated = PassCriteriaValidator.model_validate(pass_criteria)
+    rules: List[CompiledRule] = []
+    for rule_item in validated.rules or []:
+        parser = _RULE_PARSERS.get(rule_item.type)
+        if parser is None:
+            raise ValueError(f"Unknown rule type: {rule_item.type}")
+        rules.append(
+            CompiledRule(
+                type=rule_item.type,
+                id=rule_item.id,
+                rule=parser.model_validate(rule_item.config.model_dump()),
+            )
+        )
+
+    compiled = CompiledCriteria(logics=validated.logics, rules=rules)
+    _compiled_cache.set(key, compiled)
+    return compiled
@@ -1,3 +1,5 @@
+import asyncio
+
 from loguru import logger
 from pydantic import BaseModel, Field
 from src.components.llm.models.core import (
@@ -19,6 +21,8 @@ class JudgeResult(BaseModel):
 
 
 class LLMJudgeCriterion(Criterion):
+    cost = 10
+
     def __init__(self, id: str, input: str, rule: LLMJudgeRuleParser):
         super().__init__(id)
         self.input = input
@@ -69,6 +73,10 @@ class LLMJudgeCriterion(Criterion):
             logger.error(f"Error running LLM Judge criterion: {e}")
             return CheckResult(passed=False, reason="System error")
 
+    async def arun(self) -> CheckResult:
+        """Run the (blocking) judge call in a thread so judges can overlap."""
+        return await asyncio.to_thread(self.run)
+
     def _get_chat_content(self):
         INPUT = f"""<input>\n{self.input}\n</input>"""
         NO_CRITERIA = """<criteria>\nNO CRITERIA\n</criteria>"""
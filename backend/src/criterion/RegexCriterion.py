@@ -1,10 +1,31 @@
 import re
+from functools import lru_cache
+from typing import Tuple
 
 from src.criterion.BaseCriterion import Criterion
 from src.models.parsers.RegexRuleParser import RegexRuleParser
 from src.models.validators.PassCriteriaRunnerModels import CheckResult
 
 
+FLAG_MAP = {
+    "IGNORECASE": re.IGNORECASE,
+    "MULTILINE": re.MULTILINE,
+    "DOTALL": re.DOTALL,
+    "UNICODE": re.UNICODE,
+    "ASCII": re.ASCII,
+    "VERBOSE": re.VERBOSE,
+}
+
+
+@lru_cache(maxsize=1024)
+def compile_regex(pattern: str, flags: Tuple[str, ...]) -> re.Pattern:
+    """Compile a rule's pattern once per (pattern, flags); raises re.error."""
+    re_flags = 0
+    for f in flags:
+        re_flags |= FLAG_MAP.get(f.upper(), 0)
+    return re.compile(pattern, re_flags)
+
+
 class RegexCriterion(Criterion):
     def __init__(self, id: str, input: str, rule: RegexRuleParser):
         super().__init__(id)
@@ -12,22 +33,8 @@ class RegexCriterion(Criterion):
         self.rule = rule
 
     def run(self) -> CheckResult:
-        flag_map = {
-            "IGNORECASE": re.IGNORECASE,
-            "MULTILINE": re.MULTILINE,
-            "DOTALL": re.DOTALL,
-            "UNICODE": re.UNICODE,
-            "ASCII": re.ASCII,
-            "VERBOSE": re.VERBOSE,
-        }
-
-        # Build combined flags from rule
-        re_flags = 0
-        for f in self.rule.flags or []:
-            re_flags |= flag_map.get(f.upper(), 0)
-
         try:
-            compiled = re.compile(self.rule.pattern, re_flags)
+            compiled = compile_regex(self.rule.pattern, tuple(self.rule.flags or []))
             matched = compiled.search(self.input) is not None
         except re.error as e:
             return CheckResult(passed=False, reason=f"Invalid regex: {e}")
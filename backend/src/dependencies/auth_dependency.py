@@ -10,7 +10,7 @@ from fastapi import (
 from loguru import logger
 from src.configs.config import get_app_settings
 from src.dependencies.redis_dependency import get_redis_client
-from src.exceptions.user_exceptions import TokenInvalidError
+from src.exceptions.user_exceptions import TokenInvalidError, TokenRevokedError
 from src.services.AuthService import AuthService
 
 
@@ -48,19 +48,17 @@ async def auth_through_url_param(
         if not token:
             raise credentials_exception
 
-        # Verify token (this raises if invalid/expired)
-        user_id = await auth_service.verify_token(token)
-
-        # Check if blacklisted
-        if await auth_service.is_token_blacklisted(token):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token has been revoked (logged out)",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # Verify token and check blacklist (raises if invalid/expired/revoked)
+        user_id = await auth_service.authenticate_token(token)
 
         return user_id  # Can be used in route
 
+    except TokenRevokedError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked (logged out)",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     except TokenInvalidError:
         raise credentials_exception
     except Exception as e:
@@ -92,19 +90,17 @@ async def get_current_user(
         if not token:
             raise credentials_exception
 
-        # Verify token (this raises if invalid/expired)
-        user_id = await auth_service.verify_token(token)
-
-        # Check if blacklisted
-        if await auth_service.is_token_blacklisted(token):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token has been revoked (logged out)",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # Verify token and check blacklist (raises if invalid/expired/revoked)
+        user_id = await auth_service.authenticate_token(token)
 
         return user_id  # Can be used in route
 
+    except TokenRevokedError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked (logged out)",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     except TokenInvalidError:
         raise credentials_exception
     except Exception as e:
@@ -52,6 +52,19 @@ AsyncNullPoolSessionLocal = async_sessionmaker(
 )
 
 
+def get_task_sessionmaker() -> async_sessionmaker:
+    """
+    Session factory for code running off the API event loop (Celery tasks,
+    flow runs on the API execution threads).
+
+    On the persistent worker loop the pooled engine is reused across tasks.
+    On a throwaway loop connections cannot outlive the loop, so NullPool.
+    """
+    from src.utils.async_utils import in_worker_loop
+
+    return AsyncSessionLocal if in_worker_loop() else AsyncNullPoolSessionLocal
+
+
 # Asynchronous function to get a database session
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -1,6 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.dependencies.db_dependency import get_async_db
+from src.dependencies.redis_dependency import get_redis_client
 from src.repositories.FlowRepositories import FlowRepository
 from src.repositories.FlowSnapshotRepository import FlowSnapshotRepository
 from src.repositories.SessionRepository import SessionRepository
@@ -21,11 +22,14 @@ def get_flow_session_repository() -> SessionRepository:
     return SessionRepository()
 
 
-def get_flow_service(flow_repository: FlowRepository = Depends(get_flow_repository)):
+def get_flow_service(
+    flow_repository: FlowRepository = Depends(get_flow_repository),
+    redis_client=Depends(get_redis_client),
+):
     """
     Dependency that returns FlowService instance.
     """
-    return FlowService(flow_repository=flow_repository)
+    return FlowService(flow_repository=flow_repository, redis_client=redis_client)
 
 
 def get_flow_snapshot_service(
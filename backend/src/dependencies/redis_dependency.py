@@ -1,13 +1,78 @@
-from redis import Redis
+import asyncio
+import threading
+import weakref
+from typing import Optional
+
+from redis import BlockingConnectionPool, Redis
+from redis.asyncio import BlockingConnectionPool as AsyncBlockingConnectionPool
+from redis.asyncio import Redis as AsyncRedis
 from src.configs.config import get_app_settings
 
+# Shared connection pools. redis-py resets a sync pool after fork on its own;
+# asyncio connections are bound to an event loop, so async pools are kept per
+# loop (Celery tasks may run each call on a fresh loop).
+_sync_pool: Optional[BlockingConnectionPool] = None
+_async_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncBlockingConnectionPool]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
 
-def get_redis_client() -> Redis:
+
+def _pool_kwargs(max_connections: int) -> dict:
     app_settings = get_app_settings()
 
-    return Redis(
+    return dict(
         host=app_settings.REDIS_HOST,
-        port=app_settings.REDIS_PORT,
-        db=app_settings.REDIS_DB,
+        port=int(app_settings.REDIS_PORT),
+        db=int(app_settings.REDIS_DB),
         decode_responses=True,
+        max_connections=max_connections,
+        timeout=app_settings.REDIS_POOL_TIMEOUT_SECONDS,
+        health_check_interval=app_settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+        socket_connect_timeout=app_settings.REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+        socket_keepalive=True,
+        retry_on_timeout=True,
     )
+
+
+def get_redis_pool() -> BlockingConnectionPool:
+    """Get the process-wide sync Redis connection pool."""
+    global _sync_pool
+    if _sync_pool is None:
+        with _lock:
+            if _sync_pool is None:
+                _sync_pool = BlockingConnectionPool(
+                    **_pool_kwargs(get_app_settings().REDIS_MAX_CONNECTIONS)
+                )
+    return _sync_pool
+
+
+def get_redis_client() -> Redis:
+    """Sync Redis client backed by the shared connection pool."""
+    return Redis(connection_pool=get_redis_pool())
+
+
+def get_async_redis_client() -> AsyncRedis:
+    """
+    Asyncio Redis client backed by a connection pool shared by everything
+    running on the current event loop.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _async_pools.get(loop)
+    if pool is None:
+        pool = AsyncBlockingConnectionPool(
+            **_pool_kwargs(get_app_settings().REDIS_ASYNC_MAX_CONNECTIONS)
+        )
+        _async_pools[loop] = pool
+    return AsyncRedis(connection_pool=pool)
+
+
+async def close_redis_pools() -> None:
+    """Disconnect the shared pools (used on app shutdown)."""
+    global _sync_pool
+    pool = _async_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.disconnect()
+
+    with _lock:
+        if _sync_pool is not None:
+            _sync_pool.disconnect()
+            _sync_pool = None
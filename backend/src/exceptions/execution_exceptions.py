@@ -6,3 +6,39 @@ class GraphExecutorError(Exception):
 
 class NotEnoughUserInformation(Exception):
     pass
+
+
+class ExecutionSaturatedError(Exception):
+    """Raised when the in-process execution pool has no capacity left."""
+
+    pass
+
+
+class TenantExecutionLimitError(Exception):
+    """Raised when a tenant already has too many flow runs in flight."""
+
+    pass
+
+
+class ExecutionCancelledError(Exception):
+    """Raised inside a graph execution once its run has been cancelled."""
+
+    pass
+
+
+class ExecutionTimedOutError(ExecutionCancelledError):
+    """Raised inside a graph execution once it has run past its deadline."""
+
+    pass
+
+
+class NodeTimeoutError(Exception):
+    """Raised when a single node runs past its timeout."""
+
+    pass
+
+
+class UserSlotUnavailableError(Exception):
+    """Raised when a dispatched test run finds all of its user's slots taken."""
+
+    pass
@@ -39,3 +39,10 @@ class TokenInvalidError(Exception):
 
     def __init__(self, message="Invalid or expired token."):
         super().__init__(message)
+
+
+class TokenRevokedError(TokenInvalidError):
+    """Exception raised for tokens that have been revoked (logged out)."""
+
+    def __init__(self, message="Token has been revoked."):
+        super().__init__(message)
@@ -0,0 +1,188 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Coroutine, Optional, TypeVar
+
+from loguru import logger
+from src.configs.config import get_app_settings
+from src.consts.node_consts import NODE_EXECUTION_STATUS
+from src.exceptions.execution_exceptions import (
+    ExecutionCancelledError,
+    ExecutionTimedOutError,
+    NodeTimeoutError,
+)
+
+T = TypeVar("T")
+
+CancelCheck = Callable[[], Awaitable[bool]]
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation and deadlines for one graph execution.
+
+    - `cancel()` (or an external `cancel_check`, polled in the background
+      every `poll_interval_seconds`) stops the run: in-flight nodes are
+      cancelled, queued layers are not started.
+    - The run deadline (`run_timeout_seconds`) stops the run the same way,
+      with TIMED_OUT as the reason.
+    - Every node gets at most `node_timeout_seconds` (bounded by what is left
+      of the run deadline); a node running past it fails with
+      NodeTimeoutError.
+
+    Cancelling a node cancels its asyncio task. This only takes effect while
+    the loop is free, so blocking provider/HTTP/DB calls are run on worker
+    threads (Agent._structured_completion, Node.blocking_io). A call already
+    in flight in its thread is not aborted: it runs to the end (the provider
+    request is still billed) and its result is discarded, but the node makes
+    no further calls.
+    """
+
+    def __init__(
+        self,
+        run_timeout_seconds: Optional[float] = None,
+        node_timeout_seconds: Optional[float] = None,
+        cancel_check: Optional[CancelCheck] = None,
+        poll_interval_seconds: float = 1.0,
+    ):
+        self.run_timeout_seconds = run_timeout_seconds
+        self.node_timeout_seconds = node_timeout_seconds
+        self.cancel_check = cancel_check
+        self.poll_interval_seconds = poll_interval_seconds
+
+        # Either NODE_EXECUTION_STATUS.CANCELLED or NODE_EXECUTION_STATUS.TIMED_OUT
+        self.reason: Optional[str] = None
+
+        self._event: Optional[asyncio.Event] = None
+        self._deadline: Optional[float] = None
+        self._watcher: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_settings(
+        cls,
+        run_timeout_seconds: Optional[float] = None,
+        cancel_check: Optional[CancelCheck] = None,
+    ) -> "CancellationToken":
+        """Token with the configured default deadlines."""
+        app_settings = get_app_settings()
+        return cls(
+            run_timeout_seconds=run_timeout_seconds
+            or app_settings.FLOW_RUN_TIMEOUT_SECONDS,
+            node_timeout_seconds=app_settings.FLOW_NODE_TIMEOUT_SECONDS,
+            cancel_check=cancel_check,
+            poll_interval_seconds=app_settings.FLOW_CANCEL_POLL_INTERVAL_MS / 1000,
+        )
+
+    # === LIFECYCLE ===
+    def start(self) -> None:
+        """Start the run clock (and the cancel_check poller) on this loop."""
+        loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+        if self.reason is not None:
+            self._event.set()
+        if self.run_timeout_seconds:
+            self._deadline = loop.time() + self.run_timeout_seconds
+        if self._deadline is not None or self.cancel_check is not None:
+            self._watcher = loop.create_task(self._watch())
+
+    async def stop(self) -> None:
+        if self._watcher is not None:
+            self._watcher.cancel()
+            await asyncio.gather(self._watcher, return_exceptions=True)
+            self._watcher = None
+
+    async def _watch(self) -> None:
+        while self.reason is None:
+            remaining = self.remaining()
+            if remaining is not None and remaining <= 0:
+                self.cancel(NODE_EXECUTION_STATUS.TIMED_OUT)
+                return
+
+            delay = self.poll_interval_seconds
+            if remaining is not None:
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+
+            if self.cancel_check is not None:
+                try:
+                    if await self.cancel_check():
+                        self.cancel()
+                except Exception as e:
+                    logger.warning(f"Cancellation check failed: {e}")
+
+    # === STATE ===
+    def cancel(self, reason: str = NODE_EXECUTION_STATUS.CANCELLED) -> None:
+        """Request the run to stop. The first reason wins."""
+        if self.reason is None:
+            self.reason = reason
+            if self._event is not None:
+                self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.reason is not None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the run deadline, None without one."""
+        if self._deadline is None:
+            return None
+        return self._deadline - asyncio.get_running_loop().time()
+
+    def raise_if_cancelled(self) -> None:
+        remaining = self.remaining()
+        if self.reason is None and remaining is not None and remaining <= 0:
+            self.cancel(NODE_EXECUTION_STATUS.TIMED_OUT)
+
+        if self.reason == NODE_EXECUTION_STATUS.TIMED_OUT:
+            raise ExecutionTimedOutError(
+                f"Execution exceeded its {self.run_timeout_seconds}s deadline"
+            )
+        if self.reason is not None:
+            raise ExecutionCancelledError("Execution was cancelled")
+
+    async def check(self) -> None:
+        """Poll cancel_check once, then raise if the run has to stop."""
+        if self.reason is None and self.cancel_check is not None:
+            if await self.cancel_check():
+                self.cancel()
+        self.raise_if_cancelled()
+
+    # === NODE GUARD ===
+    def node_budget(self) -> Optional[float]:
+        budgets = [
+            budget
+            for budget in (self.node_timeout_seconds, self.remaining())
+            if budget is not None
+        ]
+        return max(0.0, min(budgets)) if budgets else None
+
+    async def run_node(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Await a node's coroutine within its time budget, cancelling it as
+        soon as the run is cancelled or times out.
+
+        Raises:
+            ExecutionCancelledError / ExecutionTimedOutError: The run stopped
+            NodeTimeoutError: The node alone ran past its timeout
+        """
+        self.raise_if_cancelled()
+        budget = self.node_budget()
+
+        node_task = asyncio.ensure_future(coro)
+        stop_waiter = asyncio.ensure_future(self._event.wait())
+        try:
+            async with asyncio.timeout(budget):
+                await asyncio.wait(
+                    {node_task, stop_waiter}, return_when=asyncio.FIRST_COMPLETED
+                )
+        except TimeoutError:
+            pass
+        finally:
+            stop_waiter.cancel()
+            if not node_task.done():
+                node_task.cancel()
+                await asyncio.wait({node_task}, timeout=1)
+
+        if node_task.done() and not node_task.cancelled():
+            return node_task.result()
+
+        self.raise_if_cancelled()
+        raise NodeTimeoutError(f"Node timed out after {budget:.1f}s")
@@ -0,0 +1,112 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from loguru import logger
+from src.configs.config import get_app_settings
+from src.dependencies.redis_dependency import get_async_redis_client
+from src.schemas.flowbuilder.flow_graph_schemas import NodeData
+
+EXECUTION_CHECKPOINT_PREFIX = "exec_ckpt:"
+PLAN_FIELD = "__plan__"
+
+
+def get_plan_fingerprint(execution_plan: List[List[str]]) -> str:
+    """Identifies the plan checkpoints were taken for."""
+    return hashlib.sha1(json.dumps(execution_plan).encode()).hexdigest()
+
+
+class ExecutionCheckpointStore(ABC):
+    """
+    Storage for the NodeData of completed nodes of a run, keyed by run id.
+
+    Checkpoints are tied to the execution plan they were taken for; loading
+    them for a different plan (e.g. the flow was edited before the retry)
+    returns nothing.
+    """
+
+    @abstractmethod
+    async def save(
+        self, run_id: str, plan_fingerprint: str, node_id: str, node_data: NodeData
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def load(self, run_id: str, plan_fingerprint: str) -> Dict[str, NodeData]:
+        pass
+
+    @abstractmethod
+    async def clear(self, run_id: str) -> None:
+        pass
+
+
+class RedisExecutionCheckpointStore(ExecutionCheckpointStore):
+    """Checkpoints of a run in one Redis hash (node_id -> NodeData JSON)."""
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(run_id: str) -> str:
+        return f"{EXECUTION_CHECKPOINT_PREFIX}{run_id}"
+
+    async def save(
+        self, run_id: str, plan_fingerprint: str, node_id: str, node_data: NodeData
+    ) -> None:
+        key = self._key(run_id)
+        async with get_async_redis_client().pipeline(transaction=True) as pipe:
+            pipe.hset(
+                key,
+                mapping={
+                    PLAN_FIELD: plan_fingerprint,
+                    node_id: node_data.model_dump_json(),
+                },
+            )
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def load(self, run_id: str, plan_fingerprint: str) -> Dict[str, NodeData]:
+        raw = await get_async_redis_client().hgetall(self._key(run_id))
+        if not raw:
+            return {}
+
+        fields = {
+            (k.decode() if isinstance(k, bytes) else k): v for k, v in raw.items()
+        }
+        stored_fingerprint = fields.pop(PLAN_FIELD, None)
+        if isinstance(stored_fingerprint, bytes):
+            stored_fingerprint = stored_fingerprint.decode()
+        if stored_fingerprint != plan_fingerprint:
+            logger.info(f"Discarding checkpoints of run {run_id} for another plan")
+            await self.clear(run_id)
+            return {}
+
+        return {
+            node_id: NodeData.model_validate_json(value)
+            for node_id, value in fields.items()
+        }
+
+    async def clear(self, run_id: str) -> None:
+        await get_async_redis_client().delete(self._key(run_id))
+
+
+_checkpoint_store: Optional[ExecutionCheckpointStore] = None
+
+
+def get_execution_checkpoint_store() -> Optional[ExecutionCheckpointStore]:
+    """The configured checkpoint store, or None when checkpointing is off."""
+    global _checkpoint_store
+    app_settings = get_app_settings()
+    if app_settings.EXECUTION_CHECKPOINT_STORE == "none":
+        return None
+    if _checkpoint_store is None:
+        if app_settings.EXECUTION_CHECKPOINT_STORE != "redis":
+            raise ValueError(
+                "Unknown EXECUTION_CHECKPOINT_STORE "
+                f"'{app_settings.EXECUTION_CHECKPOINT_STORE}'"
+            )
+        _checkpoint_store = RedisExecutionCheckpointStore(
+            ttl_seconds=app_settings.EXECUTION_CHECKPOINT_TTL_SECONDS
+        )
+    return _checkpoint_store
@@ -1,10 +1,12 @@
+import asyncio
 import json
 from datetime import datetime
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 import redis
 from loguru import logger
 from pydantic import BaseModel, Field
+from src.configs.config import get_app_settings
 from src.models.events.RedisEvents import (
     RedisFlowRunEndEvent,
     RedisFlowRunNodeEvent,
@@ -17,9 +19,29 @@ from src.schemas.flowbuilder.flow_graph_schemas import (
 )
 
 
+EXECUTION_EVENT_STREAM_PREFIX = "exec_events:"
+
+
+def get_execution_stream_name(task_id: str) -> str:
+    """Redis Stream holding the node/run events of one execution."""
+    return f"{EXECUTION_EVENT_STREAM_PREFIX}{task_id}"
+
+
+def get_execution_values_key(task_id: str) -> str:
+    """Redis Hash holding the full values truncated out of node events."""
+    return f"{EXECUTION_EVENT_STREAM_PREFIX}{task_id}:values"
+
+
+# Field of the values hash naming the run's flow (for the owner check);
+# value refs always contain ':' so they cannot collide with it
+EXECUTION_VALUES_FLOW_FIELD = "flow_id"
+
+
 class ExecutionControl(BaseModel):
     start_node: Optional[str] = None
     scope: Optional[Literal["node_only", "downstream"]] = Field(default="downstream")
+    # Reuse stored results of unchanged nodes (see RunIncrementalStrategy)
+    incremental: bool = False
 
 
 class ExecutionEventPublisher:
@@ -29,15 +51,106 @@ class ExecutionEventPublisher:
         task_id: str,
         redis_client: redis.Redis,
         is_test: bool = False,
+        flow_id: Optional[str] = None,
     ):
         self.task_id = task_id
         self.redis: redis.Redis = redis_client
         self.is_test = is_test
         self.user_id = user_id
+        self.flow_id = flow_id
 
         self.seq = 0
 
+        app_settings = get_app_settings()
+        self.stream_name = get_execution_stream_name(task_id)
+        self.stream_maxlen = app_settings.EXECUTION_EVENT_STREAM_MAXLEN
+        self.stream_ttl = app_settings.EXECUTION_EVENT_STREAM_TTL_SECONDS
+        self.completed_stream_ttl = app_settings.EXECUTION_EVENT_COMPLETED_TTL_SECONDS
+        self._stream_ttl_set = False
+
+        # Node event values above this size are replaced by a reference
+        self.values_key = get_execution_values_key(task_id)
+        self.value_max_bytes = app_settings.EXECUTION_EVENT_VALUE_MAX_BYTES
+        self.value_preview_chars = app_settings.EXECUTION_EVENT_VALUE_PREVIEW_CHARS
+        self._truncated_values: Dict[str, str] = {}
+
+        # Buffered (async) node events, flushed in pipelined batches
+        self.flush_interval = app_settings.EXECUTION_EVENT_FLUSH_INTERVAL_MS / 1000
+        self.flush_batch_size = app_settings.EXECUTION_EVENT_FLUSH_BATCH_SIZE
+        self._buffer: List[dict] = []
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flush_timer: Optional[asyncio.Task] = None
+        # Set once the timer is past its sleep and writing; it must not be
+        # cancelled from then on (its write would continue in its thread)
+        self._timer_flushing = False
+
     # === NON-TEST EVENT PUBLISH ===
+    def _append_execution_events(
+        self,
+        redis_messages: List[dict],
+        ttl: Optional[int] = None,
+        truncated_values: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Append events to the capped per-run stream in one round trip. The TTL
+        is set with the first event and shortened once the run completes.
+        """
+        with self.redis.pipeline(transaction=False) as pipe:
+            for redis_message in redis_messages:
+                pipe.xadd(
+                    self.stream_name,
+                    {"data": json.dumps(redis_message)},
+                    maxlen=self.stream_maxlen,
+                    approximate=True,
+                )
+            if truncated_values:
+                if self.flow_id:
+                    truncated_values = {
+                        **truncated_values,
+                        EXECUTION_VALUES_FLOW_FIELD: self.flow_id,
+                    }
+                pipe.hset(self.values_key, mapping=truncated_values)
+                pipe.expire(self.values_key, ttl or self.stream_ttl)
+            elif ttl is not None:
+                pipe.expire(self.values_key, ttl)
+            if ttl is not None or not self._stream_ttl_set:
+                pipe.expire(self.stream_name, ttl or self.stream_ttl)
+            pipe.execute()
+        self._stream_ttl_set = True
+
+    def _cap_event_values(self, node_id: str, data: dict) -> dict:
+        """
+        Replace input/output values larger than the size cap by a truncation
+        reference. The full value is kept in the run's values hash so the UI
+        can fetch it on demand.
+        """
+        for section in ("input_values", "output_values"):
+            values = data.get(section)
+            if not values:
+                continue
+
+            capped = {}
+            for name, value in values.items():
+                serialized = json.dumps(value, default=str)
+                if len(serialized) <= self.value_max_bytes:
+                    capped[name] = value
+                    continue
+
+                ref = f"{node_id}:{section}:{name}"
+                self._truncated_values[ref] = serialized
+                capped[name] = {
+                    "truncated": True,
+                    "size": len(serialized),
+                    "preview": serialized[: self.value_preview_chars],
+                    "ref": ref,
+                }
+            data[section] = capped
+        return data
+
+    def _take_truncated_values(self) -> Dict[str, str]:
+        truncated_values, self._truncated_values = self._truncated_values, {}
+        return truncated_values
+
     def end(self, data: dict = {}):
         # Publish DONE event to Redis
         redis_message = {
@@ -46,7 +159,8 @@ class ExecutionEventPublisher:
             "timestamp": datetime.utcnow().isoformat(),
         }
         redis_message = RedisFlowRunEndEvent(**redis_message).model_dump()
-        self.redis.rpush(self.task_id, json.dumps(redis_message))
+        # Completed runs only stay around long enough for viewers to catch up
+        self._append_execution_events([redis_message], ttl=self.completed_stream_ttl)
 
     def publish_node_event(self, node_id: str, event: str, data: dict):
         # Publish node event to Redis
@@ -57,9 +171,91 @@ class ExecutionEventPublisher:
             "timestamp": datetime.utcnow().isoformat(),
         }
         redis_message = RedisFlowRunNodeEvent(**redis_message).model_dump()
+        self._cap_event_values(node_id, redis_message["data"])
+
+        self._append_execution_events(
+            [redis_message], truncated_values=self._take_truncated_values()
+        )
+
+    # === BUFFERED (ASYNC) EVENT PUBLISH ===
+    async def publish_node_event_buffered(self, node_id: str, event: str, data: dict):
+        """
+        Queue a node event and flush once the batch is full or the flush
+        interval elapses. Events of a run are written in the order queued.
+        """
+        self._buffer.append(
+            {
+                "node_id": node_id,
+                "event": event,
+                "data": self._cap_event_values(node_id, data),
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+        )
+
+        if len(self._buffer) >= self.flush_batch_size:
+            await self.flush()
+        elif self._flush_timer is None or self._flush_timer.done():
+            self._flush_timer = asyncio.create_task(self._flush_later())
+
+    async def end_buffered(self, data: dict = {}):
+        """Queue the DONE event and flush everything still buffered."""
+        redis_message = RedisFlowRunEndEvent(
+            event="DONE", data=data, timestamp=datetime.utcnow().isoformat()
+        ).model_dump()
+        await self.flush(final_message=redis_message)
+
+    async def flush(self, final_message: Optional[dict] = None):
+        """Write buffered events in a single pipelined batch."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        # Only a timer still sleeping can be dropped; one already flushing
+        # holds the lock, so this flush waits for its batch below
+        timer = self._flush_timer
+        if (
+            timer is not None
+            and timer is not asyncio.current_task()
+            and not self._timer_flushing
+        ):
+            timer.cancel()
+            self._flush_timer = None
+
+        # The lock keeps batches (and so events) in order across flushes
+        async with self._flush_lock:
+            batch, self._buffer = self._buffer, []
+            truncated_values = self._take_truncated_values()
+            ttl = None
+            if final_message is not None:
+                batch.append(final_message)
+                ttl = self.completed_stream_ttl
+            if not batch:
+                return
+
+            write = asyncio.ensure_future(
+                asyncio.to_thread(
+                    self._append_execution_events, batch, ttl, truncated_values
+                )
+            )
+            try:
+                await asyncio.shield(write)
+            except asyncio.CancelledError:
+                # Keep holding the lock until the thread is done writing, so
+                # no later batch (or DONE) can overtake this one
+                await asyncio.wait({write})
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Failed to publish {len(batch)} execution events "
+                    f"for task {self.task_id}: {e}"
+                )
 
-        # Push to a Redis list keyed by task_id
-        self.redis.rpush(self.task_id, json.dumps(redis_message))
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        self._timer_flushing = True
+        try:
+            await self.flush()
+        finally:
+            self._timer_flushing = False
 
     # === TEST EVENT PUBLISH ===
     def publish_test_run_event(
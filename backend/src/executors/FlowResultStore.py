@@ -0,0 +1,171 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+import networkx as nx
+from src.configs.config import get_app_settings
+from src.consts.node_consts import NODE_LABEL_CONSTS
+from src.dependencies.redis_dependency import get_async_redis_client
+from src.nodes.core.NodeSpec import NodeSpec
+from src.schemas.flowbuilder.flow_graph_schemas import NodeData
+
+FLOW_RESULT_PREFIX = "flow_results:"
+
+
+def get_result_values(node_data: NodeData) -> Dict[str, Any]:
+    """
+    The part of a node's result an incremental run needs: its outputs, plus
+    the inputs of Chat Output nodes (the message they show). Parameters and
+    other inputs (API keys, large upstream payloads) are never stored; they
+    are identical in the graph whenever the fingerprint matches.
+    """
+    fields = {"output_values"}
+    if node_data.node_type == NODE_LABEL_CONSTS.CHAT_OUTPUT:
+        fields.add("input_values")
+    return node_data.model_dump(mode="json", include=fields)
+
+
+def compute_node_fingerprints(graph: nx.MultiDiGraph) -> Dict[str, str]:
+    """
+    Fingerprint every node of a graph from its spec, mode, parameters, tool
+    configs and static input values, chained with the fingerprints of its
+    predecessors (and the handles connecting them).
+
+    Editing a node therefore changes its fingerprint and the fingerprint of
+    every descendant, while the rest of the graph keeps theirs. Inputs fed by
+    an edge are left out: they are covered by the upstream fingerprint.
+
+    Must be called before execution, which writes upstream outputs into
+    input_values.
+    """
+    fingerprints: Dict[str, str] = {}
+
+    def fingerprint(node_id: str) -> str:
+        if node_id in fingerprints:
+            return fingerprints[node_id]
+
+        g_node = graph.nodes[node_id]
+        node_spec: Optional[NodeSpec] = g_node.get("spec")
+        node_data: NodeData = g_node.get("data") or NodeData()
+
+        upstream = []
+        fed_inputs = set()
+        for pred_id, _, edge_data in graph.in_edges(node_id, data=True):
+            fed_inputs.add(edge_data.get("target_handle"))
+            upstream.append(
+                [
+                    fingerprint(pred_id),
+                    edge_data.get("source_handle"),
+                    edge_data.get("target_handle"),
+                ]
+            )
+
+        payload = {
+            "spec": node_spec.name if node_spec else None,
+            "mode": node_data.mode,
+            "parameters": node_data.parameter_values,
+            "tool_configs": node_data.tool_configs.model_dump(mode="json")
+            if node_data.tool_configs
+            else None,
+            "inputs": {
+                key: value
+                for key, value in (node_data.input_values or {}).items()
+                if key not in fed_inputs
+            },
+            "upstream": sorted(upstream, key=lambda edge: json.dumps(edge)),
+        }
+        fingerprints[node_id] = hashlib.sha1(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return fingerprints[node_id]
+
+    for node_id in graph.nodes:
+        fingerprint(node_id)
+    return fingerprints
+
+
+class FlowResultStore(ABC):
+    """
+    Latest result values (see get_result_values) of every node of a flow,
+    with the fingerprint they were produced for. Incremental runs reuse the
+    results whose fingerprint still matches instead of re-executing the node.
+    """
+
+    @abstractmethod
+    async def save(
+        self, flow_id: str, node_id: str, fingerprint: str, node_data: NodeData
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def load(
+        self, flow_id: str, fingerprints: Dict[str, str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Result values of the nodes whose stored fingerprint matches."""
+        pass
+
+
+class RedisFlowResultStore(FlowResultStore):
+    """
+    Results of a flow in one Redis hash (node_id -> fingerprint and result
+    values JSON), expiring `ttl_seconds` after the flow last ran.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(flow_id: str) -> str:
+        return f"{FLOW_RESULT_PREFIX}{flow_id}"
+
+    async def save(
+        self, flow_id: str, node_id: str, fingerprint: str, node_data: NodeData
+    ) -> None:
+        key = self._key(flow_id)
+        value = json.dumps(
+            {"fingerprint": fingerprint, "values": get_result_values(node_data)}
+        )
+        async with get_async_redis_client().pipeline(transaction=True) as pipe:
+            pipe.hset(key, node_id, value)
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def load(
+        self, flow_id: str, fingerprints: Dict[str, str]
+    ) -> Dict[str, Dict[str, Any]]:
+        node_ids = list(fingerprints)
+        if not node_ids:
+            return {}
+
+        values = await get_async_redis_client().hmget(self._key(flow_id), node_ids)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for node_id, value in zip(node_ids, values):
+            if value is None:
+                continue
+            stored = json.loads(value)
+            # Entries without "values" predate this format: re-execute
+            if "values" in stored and stored["fingerprint"] == fingerprints[node_id]:
+                results[node_id] = stored["values"]
+        return results
+
+
+_flow_result_store: Optional[FlowResultStore] = None
+
+
+def get_flow_result_store() -> Optional[FlowResultStore]:
+    """The configured flow result store, or None when it is disabled."""
+    global _flow_result_store
+    app_settings = get_app_settings()
+    if app_settings.FLOW_RESULT_STORE == "none":
+        return None
+    if _flow_result_store is None:
+        if app_settings.FLOW_RESULT_STORE != "redis":
+            raise ValueError(
+                f"Unknown FLOW_RESULT_STORE '{app_settings.FLOW_RESULT_STORE}'"
+            )
+        _flow_result_store = RedisFlowResultStore(
+            ttl_seconds=app_settings.FLOW_RESULT_STORE_TTL_SECONDS
+        )
+    return _flow_result_store
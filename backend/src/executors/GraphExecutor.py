@@ -3,25 +3,37 @@ import json
 import threading
 import time
 import traceback
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 import networkx as nx
 from loguru import logger
 from src.consts.node_consts import (
     NODE_DATA_MODE,
     NODE_EXECUTION_STATUS,
+    NODE_LABEL_CONSTS,
     NODE_TAGS_CONSTS,
 )
-from src.exceptions.execution_exceptions import GraphExecutorError
+from src.exceptions.execution_exceptions import (
+    ExecutionCancelledError,
+    GraphExecutorError,
+    NodeTimeoutError,
+)
+from src.executors.CancellationToken import CancellationToken
+from src.executors.ExecutionCheckpointStore import (
+    ExecutionCheckpointStore,
+    get_plan_fingerprint,
+)
 from src.executors.ExecutionEventPublisher import (
     ExecutionControl,
     ExecutionEventPublisher,
 )
+from src.executors.FlowResultStore import FlowResultStore, compute_node_fingerprints
 from src.executors.GraphExecutionUtil import GraphExecutionUtil
 from src.executors.MultiDiGraphUtils import MultiDiGraphUtils
 from src.executors.NodeDataFlowAdapter import NodeDataFlowAdapter
 from src.executors.strategies.RunFromNodeStrategy import RunFromNodeStrategy
 from src.executors.strategies.RunFullStrategy import RunFullStrategy
+from src.executors.strategies.RunIncrementalStrategy import RunIncrementalStrategy
 from src.nodes.core import NodeInput, NodeOutput
 
 # Special imports
@@ -57,6 +69,9 @@ class GraphExecutor:
         enable_debug: bool = True,
         execution_context: Optional["ExecutionContext"] = None,
         execution_event_publisher: Optional[ExecutionEventPublisher] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        checkpoint_store: Optional[ExecutionCheckpointStore] = None,
+        result_store: Optional[FlowResultStore] = None,
     ):
         """
         Initialize the GraphExecutor.
@@ -65,6 +80,14 @@ class GraphExecutor:
             graph: The directed graph containing node specifications and data
             execution_plan: List of layers, where each layer contains nodes that can execute in parallel
             max_workers: Maximum number of threads for parallel execution
+            cancellation_token: Cancellation and run/node deadlines of this run
+                (defaults to the configured deadlines, without external cancel)
+            checkpoint_store: When set (and an execution context is given),
+                every completed node is checkpointed under the run id, and a
+                run that finds checkpoints resumes after them
+            result_store: When set (and the execution context has a flow id),
+                the result of every completed node is stored for the flow with
+                its fingerprint, for incremental runs to reuse
         """  # noqa: E501
         self.graph: nx.MultiDiGraph = graph
         self.execution_context: Optional["ExecutionContext"] = execution_context
@@ -75,6 +98,29 @@ class GraphExecutor:
         # Flag and class for execution context
         self.enable_debug = enable_debug
         self.execution_event_publisher = execution_event_publisher
+        self.cancellation_token = (
+            cancellation_token or CancellationToken.from_settings()
+        )
+
+        self.checkpoint_store = (
+            checkpoint_store if execution_context is not None else None
+        )
+        self._plan_fingerprint = get_plan_fingerprint(execution_plan)
+
+        self.result_store = (
+            result_store
+            if execution_context is not None and execution_context.flow_id
+            else None
+        )
+        # Computed up front: execution writes upstream outputs into inputs
+        self._node_fingerprints: Dict[str, str] = (
+            compute_node_fingerprints(graph) if self.result_store else {}
+        )
+
+        # Nodes that completed, failed, were skipped or got a stop event
+        self._settled_nodes: Set[str] = set()
+        # Nodes whose outputs came from the node result cache
+        self._cache_hits: Set[str] = set()
 
         # Thread safety for updating graph
         self._update_lock = threading.Lock()
@@ -85,18 +131,137 @@ class GraphExecutor:
         # Initialize execution strategies
         self._run_full_strategy = RunFullStrategy(self)
         self._run_from_node_strategy = RunFromNodeStrategy(self)
+        self._run_incremental_strategy = RunIncrementalStrategy(self)
 
     async def push_event(self, node_id: str, event: str, data: Any = {}):
         # Publish node event to Redis
         if self.execution_event_publisher and self.enable_debug:
-            self.execution_event_publisher.publish_node_event(
+            await self.execution_event_publisher.publish_node_event_buffered(
                 node_id=node_id, event=event, data=data
             )
 
     async def end_event(self, data: Dict = {}):
         # Publish DONE event to Redis
         if self.execution_event_publisher and self.enable_debug:
-            self.execution_event_publisher.end(data=data)
+            await self.execution_event_publisher.end_buffered(data=data)
+
+    @staticmethod
+    def _node_event_delta(
+        node_data: NodeData,
+        execution_time: Optional[float] = None,
+        cache_hit: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Compact node event payload: the node's new outputs and timing only.
+        Inputs and parameters (API keys, large upstream payloads) are left
+        out, except the message shown by Chat Output nodes.
+        """
+        delta: Dict[str, Any] = {
+            "node_type": node_data.node_type,
+            "output_values": node_data.output_values or {},
+        }
+        if node_data.node_type == NODE_LABEL_CONSTS.CHAT_OUTPUT:
+            delta["input_values"] = node_data.input_values or {}
+        if execution_time is not None:
+            delta["duration_ms"] = round(execution_time * 1000, 2)
+        if cache_hit:
+            delta["cache_hit"] = True
+        return delta
+
+    async def raise_if_cancelled(self) -> None:
+        """Stop the run if it was cancelled or ran past its deadline."""
+        await self.cancellation_token.check()
+
+    async def _record_completed_node(self, node_id: str, node_data: NodeData) -> None:
+        await asyncio.gather(
+            self._checkpoint_node(node_id, node_data),
+            self._store_flow_result(node_id, node_data),
+        )
+
+    async def _checkpoint_node(self, node_id: str, node_data: NodeData) -> None:
+        if self.checkpoint_store is None:
+            return
+        try:
+            await self.checkpoint_store.save(
+                self.execution_context.run_id,
+                self._plan_fingerprint,
+                node_id,
+                node_data,
+            )
+        except Exception as e:
+            # A missing checkpoint only costs a re-run on resume
+            logger.warning(f"Failed to checkpoint node {node_id}: {e}")
+
+    async def _load_checkpoints(self) -> Dict[str, NodeData]:
+        if self.checkpoint_store is None:
+            return {}
+        try:
+            checkpoints = await self.checkpoint_store.load(
+                self.execution_context.run_id, self._plan_fingerprint
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load checkpoints, running from scratch: {e}")
+            return {}
+        return {
+            node_id: node_data
+            for node_id, node_data in checkpoints.items()
+            if node_id in self.graph.nodes
+        }
+
+    async def _clear_checkpoints(self) -> None:
+        if self.checkpoint_store is None:
+            return
+        try:
+            await self.checkpoint_store.clear(self.execution_context.run_id)
+        except Exception as e:
+            logger.warning(f"Failed to clear checkpoints: {e}")
+
+    async def _store_flow_result(self, node_id: str, node_data: NodeData) -> None:
+        if self.result_store is None:
+            return
+        try:
+            await self.result_store.save(
+                self.execution_context.flow_id,
+                node_id,
+                self._node_fingerprints[node_id],
+                node_data,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store the result of node {node_id}: {e}")
+
+    async def _load_flow_results(self) -> Dict[str, NodeData]:
+        """
+        NodeData of the nodes whose fingerprint did not change: their current
+        graph data with the stored result values applied.
+        """
+        if self.result_store is None:
+            return {}
+        try:
+            stored_values = await self.result_store.load(
+                self.execution_context.flow_id, self._node_fingerprints
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load stored node results: {e}")
+            return {}
+
+        return {
+            node_id: (self.graph.nodes[node_id].get("data") or NodeData()).model_copy(
+                update=values, deep=True
+            )
+            for node_id, values in stored_values.items()
+        }
+
+    async def _publish_aborted_nodes(self) -> None:
+        """Emit CANCELLED/TIMED_OUT for every node the aborted run never settled."""
+        for layer_nodes in self.execution_plan:
+            for node_id in layer_nodes:
+                if node_id not in self._settled_nodes:
+                    self._settled_nodes.add(node_id)
+                    await self.push_event(
+                        node_id=node_id,
+                        event=self.cancellation_token.reason,
+                        data={},
+                    )
 
     async def execute(self) -> FlowExecutionResult:
         """
@@ -119,14 +284,38 @@ class GraphExecutor:
             )
             return execute_result
 
-        # Check if we should start execution from a specific node
-        if self.execution_control.start_node is not None:
-            return await self._run_from_node_strategy.execute(
-                self.execution_control.start_node
-            )
+        self.cancellation_token.start()
+        try:
+            # Check if we should start execution from a specific node
+            if self.execution_control.start_node is not None:
+                return await self._run_from_node_strategy.execute(
+                    self.execution_control.start_node
+                )
+
+            # Re-execute only the nodes that changed since the flow last ran
+            if self.execution_control.incremental and self.result_store is not None:
+                return await self._run_incremental_strategy.execute()
 
-        # Otherwise, execute from the beginning
-        return await self._run_full_strategy.execute()
+            # Resume after the nodes a previous attempt of this run completed
+            checkpoints = await self._load_checkpoints()
+            if checkpoints:
+                result = await self._run_from_node_strategy.resume(checkpoints)
+            else:
+                # Otherwise, execute from the beginning
+                result = await self._run_full_strategy.execute()
+
+            await self._clear_checkpoints()
+            return result
+        except ExecutionCancelledError as e:
+            logger.warning(f"Graph execution stopped: {e}")
+            await self._publish_aborted_nodes()
+            raise
+        finally:
+            await self.cancellation_token.stop()
+
+            # Don't leave buffered events behind when the run ends or fails
+            if self.execution_event_publisher:
+                await self.execution_event_publisher.flush()
 
     async def _execute_layer_parallel(  # noqa
         self, layer_nodes: List[str], layer_index: int
@@ -138,6 +327,8 @@ class GraphExecutor:
             logger.warning(f"Layer {layer_index} is empty")
             return []
 
+        await self.raise_if_cancelled()
+
         # Filter out nodes that should be skipped based on their predecessors
         executable_nodes = []
         skipped_results = []
@@ -150,6 +341,7 @@ class GraphExecutor:
             else:
                 # Create a skipped result for this node
                 node_data = self.graph.nodes[node_id].get("data", NodeData())
+                self._settled_nodes.add(node_id)
                 await self.push_event(
                     node_id=node_id,
                     event=NODE_EXECUTION_STATUS.SKIPPED,
@@ -221,6 +413,8 @@ class GraphExecutor:
 
             except Exception as e:
                 logger.error(f"Error in TaskGroup for layer {layer_index}: {str(e)}")
+                # Surface a stopped run as such rather than as an ExceptionGroup
+                self.cancellation_token.raise_if_cancelled()
                 raise
 
         # Combine execution results with skipped results
@@ -243,6 +437,8 @@ class GraphExecutor:
                 )
                 logger.debug(f"Completed node {node_id} execution in TaskGroup")
                 return result
+            except ExecutionCancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Failed to execute node {node_id} in TaskGroup: {str(e)}")
                 # Return a failure result instead of raising to avoid failing the entire group
@@ -282,10 +478,11 @@ class GraphExecutor:
             # Check for skipping
             if node_data.execution_status == NODE_EXECUTION_STATUS.SKIPPED:
                 logger.info(f"Node {node_id} is skipped")
+                self._settled_nodes.add(node_id)
                 await self.push_event(
                     node_id=node_id,
                     event=NODE_EXECUTION_STATUS.SKIPPED,
-                    data=node_data.model_dump(),
+                    data={"node_type": node_data.node_type},
                 )
                 return NodeExecutionResult(
                     node_id=node_id,
@@ -311,26 +508,46 @@ class GraphExecutor:
 
             logger.info(f"Executing node [{layer_index}]: {node_spec.name}")
 
-            # Execute the node
-            executed_data: NodeData = await node_instance.run(
-                node_id=node_id,
-                node_data=node_data,
-                exec_context=self.execution_context,
+            # Execute the node within its time budget, stopping it on cancel
+            executed_data: NodeData = await self.cancellation_token.run_node(
+                node_instance.run(
+                    node_id=node_id,
+                    node_data=node_data,
+                    exec_context=self.execution_context,
+                )
             )
+            execution_time = time.time() - start_time
+            if node_instance.cache_hit:
+                logger.info(f"Node {node_id} outputs reused from the result cache")
+                self._cache_hits.add(node_id)
+
+            self._settled_nodes.add(node_id)
+            await self._record_completed_node(node_id, executed_data)
             await self.push_event(
                 node_id=node_id,
                 event=NODE_EXECUTION_STATUS.COMPLETED,
-                data=executed_data.model_dump(),
+                data=self._node_event_delta(
+                    executed_data, execution_time, node_instance.cache_hit
+                ),
             )
 
-            execution_time = time.time() - start_time
-
             return NodeExecutionResult(
                 node_id=node_id,
                 success=True,
                 data=executed_data,
                 execution_time=execution_time,
+                cache_hit=node_instance.cache_hit,
+            )
+
+        except ExecutionCancelledError:
+            execution_time = time.time() - start_time
+            self._settled_nodes.add(node_id)
+            await self.push_event(
+                node_id=node_id,
+                event=self.cancellation_token.reason,
+                data={"duration_ms": round(execution_time * 1000, 2)},
             )
+            raise
 
         except Exception as e:
             execution_time = time.time() - start_time
@@ -339,10 +556,13 @@ class GraphExecutor:
                 f"❌ Node {node_id} execution failed 🛑: {str(e)}\n🔍 Trace: {trace}"
             )
 
+            self._settled_nodes.add(node_id)
             await self.push_event(
                 node_id=node_id,
-                event=NODE_EXECUTION_STATUS.FAILED,
-                data={"error": str(e)},
+                event=NODE_EXECUTION_STATUS.TIMED_OUT
+                if isinstance(e, NodeTimeoutError)
+                else NODE_EXECUTION_STATUS.FAILED,
+                data={"error": str(e), "duration_ms": round(execution_time * 1000, 2)},
             )
 
             return NodeExecutionResult(
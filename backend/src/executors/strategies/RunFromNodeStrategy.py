@@ -3,7 +3,10 @@ from typing import TYPE_CHECKING, Any, Dict, List
 
 from loguru import logger
 from src.consts.node_consts import NODE_EXECUTION_STATUS
-from src.exceptions.execution_exceptions import GraphExecutorError
+from src.exceptions.execution_exceptions import (
+    ExecutionCancelledError,
+    GraphExecutorError,
+)
 from src.executors.NodeDataFlowAdapter import NodeDataFlowAdapter
 from src.nodes.core import NodeInput, NodeOutput
 from src.schemas.flowbuilder.flow_graph_schemas import (
@@ -102,6 +105,65 @@ class RunFromNodeStrategy:
             modified_execution_plan, ancestors_to_execute
         )
 
+    async def resume(self, checkpoints: Dict[str, NodeData]) -> FlowExecutionResult:
+        """
+        Resume a run from the frontier of the nodes a previous attempt
+        completed, re-executing only the rest of the plan.
+
+        Args:
+            checkpoints: NodeData of the completed nodes, by node ID
+
+        Returns:
+            FlowExecutionResult of the resumed run
+        """
+        execution_plan = self.graph_executor.execution_plan
+        pending = {
+            node_id
+            for layer in execution_plan
+            for node_id in layer
+            if node_id not in checkpoints
+        }
+        if not pending:
+            # Every node was checkpointed: re-run the final layer so the run
+            # still produces its results and end event
+            pending = set(execution_plan[-1])
+
+        restored = [node_id for node_id in checkpoints if node_id not in pending]
+        logger.info(
+            f"Resuming execution with {len(restored)} checkpointed nodes, "
+            f"{len(pending)} left to execute"
+        )
+
+        for node_id in restored:
+            node_data = checkpoints[node_id]
+            self.graph_executor.graph.nodes[node_id]["data"] = node_data
+            self.graph_executor._settled_nodes.add(node_id)
+            await self.graph_executor.push_event(
+                node_id=node_id,
+                event=NODE_EXECUTION_STATUS.COMPLETED,
+                data=self.graph_executor._node_event_delta(node_data),
+            )
+
+        # Feed the outputs of the restored nodes to the ones left to execute
+        for node_id in restored:
+            successors = [
+                successor_id
+                for successor_id in self.graph_executor.graph.successors(node_id)
+                if successor_id in pending
+            ]
+            if successors:
+                self.graph_executor._update_successors(
+                    node_id, successors, checkpoints[node_id]
+                )
+
+        modified_execution_plan = [
+            [node_id for node_id in layer if node_id in pending]
+            for layer in execution_plan
+        ]
+        modified_execution_plan = [layer for layer in modified_execution_plan if layer]
+
+        return await self._execute_modified_plan(modified_execution_plan, restored)
+
     def _find_ancestors_to_execute(self, start_node: str) -> List[str]:
         """
         Find all ancestors of the start node that need to be executed.
@@ -489,6 +551,7 @@ class RunFromNodeStrategy:
                         "data": result.data.model_dump() if result.data else None,
                         "error": result.error,
                         "execution_time": result.execution_time,
+                        "cache_hit": result.cache_hit,
                     }
                     for result in layer_results
                 ]
@@ -513,13 +576,16 @@ class RunFromNodeStrategy:
                     "results": final_layer_results,
                     "chat_output": chat_output_node_data.model_dump(),
                     "ancestors": ancestors,  # Include ancestors in the result
+                    "cache_hits": sorted(self.graph_executor._cache_hits),
                 }
             )
 
-            self.graph_executor.end_event(data=execute_result.model_dump())
+            await self.graph_executor.end_event(data=execute_result.model_dump())
 
             return execute_result
 
+        except ExecutionCancelledError:
+            raise
         except Exception as e:
             raise GraphExecutorError(f"Execution failed: {str(e)}.") from e
 
@@ -640,6 +706,7 @@ class RunFromNodeStrategy:
                     "data": result.data.model_dump() if result.data else None,
                     "error": result.error,
                     "execution_time": result.execution_time,
+                    "cache_hit": result.cache_hit,
                 }
                 for result in layer_results
             ]
@@ -653,13 +720,16 @@ class RunFromNodeStrategy:
                     "execution_time": total_time,
                     "results": final_layer_results,
                     "ancestors": [],  # No ancestors for standalone node
+                    "cache_hits": sorted(self.graph_executor._cache_hits),
                     "chat_output": FlowChatOutputResult(content=None).model_dump(),
                 }
             )
 
-            self.graph_executor.end_event(data=execute_result.model_dump())
+            await self.graph_executor.end_event(data=execute_result.model_dump())
 
             return execute_result
 
+        except ExecutionCancelledError:
+            raise
         except Exception as e:
             raise GraphExecutorError(f"Execution failed: {str(e)}.") from e
@@ -3,7 +3,10 @@ from typing import TYPE_CHECKING
 
 from loguru import logger
 from src.consts.node_consts import NODE_EXECUTION_STATUS
-from src.exceptions.execution_exceptions import GraphExecutorError
+from src.exceptions.execution_exceptions import (
+    ExecutionCancelledError,
+    GraphExecutorError,
+)
 from src.schemas.flowbuilder.flow_graph_schemas import (
     FlowChatOutputResult,
     FlowExecutionResult,
@@ -106,6 +109,7 @@ class RunFullStrategy:
                         "data": result.data.model_dump() if result.data else None,
                         "error": result.error,
                         "execution_time": result.execution_time,
+                        "cache_hit": result.cache_hit,
                     }
                     for result in layer_results
                 ]
@@ -130,12 +134,15 @@ class RunFullStrategy:
                     "results": final_layer_results,
                     "chat_output": chat_output_node_data.model_dump(),
                     "ancestors": [],
+                    "cache_hits": sorted(self.graph_executor._cache_hits),
                 }
             )
 
-            self.graph_executor.end_event(data=execute_result.model_dump())
+            await self.graph_executor.end_event(data=execute_result.model_dump())
 
             return execute_result
 
+        except ExecutionCancelledError:
+            raise
         except Exception as e:
             raise GraphExecutorError(f"Execution failed: {str(e)}.") from e
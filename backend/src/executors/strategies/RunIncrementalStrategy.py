@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from src.schemas.flowbuilder.flow_graph_schemas import FlowExecutionResult
+
+if TYPE_CHECKING:
+    from src.executors.GraphExecutor import GraphExecutor
+
+
+class RunIncrementalStrategy:
+    """
+    Strategy for re-executing only what changed since the flow last ran.
+
+    Nodes whose fingerprint (spec, parameters, static inputs and upstream
+    fingerprints) matches a result in the flow result store are restored
+    from it; the changed nodes and their descendants are executed.
+    """
+
+    def __init__(self, graph_executor: "GraphExecutor"):
+        """
+        Initialize the RunIncrementalStrategy.
+
+        Args:
+            graph_executor: The GraphExecutor instance that owns this strategy
+        """
+        self.graph_executor: "GraphExecutor" = graph_executor
+
+    async def execute(self) -> FlowExecutionResult:
+        """
+        Execute the nodes whose results cannot be reused.
+        """
+        cached_results = await self.graph_executor._load_flow_results()
+        if not cached_results:
+            logger.info("No reusable node results, executing the full graph")
+            return await self.graph_executor._run_full_strategy.execute()
+
+        logger.info(f"Reusing the results of {len(cached_results)} unchanged nodes")
+        return await self.graph_executor._run_from_node_strategy.resume(cached_results)
@@ -6,7 +6,10 @@ from fastapi.middleware.gzip import GZipMiddleware
 from loguru import logger
 from src.configs.config import get_app_settings
 from src.configs.LoggingConfig import setup_logger
-from src.dependencies.redis_dependency import get_redis_client
+from src.core.api_key_usage import get_api_key_usage_tracker
+from src.core.event_fanout import stop_event_fanout
+from src.core.invalidation import get_invalidation_bus
+from src.dependencies.redis_dependency import close_redis_pools, get_redis_client
 from src.routes.api_key_routes import api_key_router
 from src.routes.auth_routes import auth_router
 from src.routes.common_routes import common_router
@@ -37,8 +40,17 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to clear node catalog cache on startup: {str(e)}")
 
+    api_key_usage_tracker = get_api_key_usage_tracker()
+    api_key_usage_tracker.start()
+
     yield
 
+    # Shutdown logic
+    await api_key_usage_tracker.stop()
+    await stop_event_fanout()
+    get_invalidation_bus().stop()
+    await close_redis_pools()
+
 
 app = FastAPI(
     title="AI Service",
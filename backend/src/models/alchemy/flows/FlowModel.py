@@ -2,7 +2,7 @@
 # This id is treated as database-level unique. All kind of id currently defined
 # is for app logic which may looks confusing at first but it does serve a purpose.
 
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from src.models.alchemy.shared.AppBaseModel import AppBaseModel
@@ -33,5 +33,15 @@ class FlowModel(AppBaseModel):
     )
     user = relationship("UserModel", back_populates="flows")
 
+    __table_args__ = (
+        # Supports keyset pagination of a user's flows on (modified_at, flow_id)
+        Index(
+            "idx_flows_user_id_modified_at_flow_id",
+            "user_id",
+            "modified_at",
+            "flow_id",
+        ),
+    )
+
     def __repr__(self):
         return f"<FlowModel(flow_id={self.flow_id}, name={self.name}, description={self.description}, is_active={self.is_active})>"  # noqa: E501
@@ -9,6 +9,7 @@ from sqlalchemy import (
     Column,
     Float,
     ForeignKey,
+    Index,
     String,
     Text,
 )
@@ -30,6 +31,7 @@ class FlowTestCaseModel(AppBaseModel):
     """
 
     __tablename__ = "flow_test_cases"
+    __table_args__ = (Index("idx_flow_test_cases_suite_id", "suite_id"),)
 
     suite_id = Column(
         BigInteger,
@@ -53,6 +55,19 @@ class FlowTestCaseModel(AppBaseModel):
         Float, nullable=True, default=300
     )  # Upper-bound (TODO: Use in future)
 
+    # Denormalized pointer to the most recently queued run, set in the same
+    # transaction that queues it, so previews don't scan the run history
+    latest_run_id = Column(
+        BigInteger,
+        ForeignKey(
+            "flow_test_case_runs.id",
+            ondelete="SET NULL",
+            use_alter=True,
+            name="fk_flow_test_cases_latest_run_id",
+        ),
+        nullable=True,
+    )
+
     # relationships
     test_suite = relationship("FlowTestSuiteModel", back_populates="test_cases")
 
@@ -61,6 +76,7 @@ class FlowTestCaseModel(AppBaseModel):
         back_populates="test_case",
         cascade="all, delete-orphan",
         lazy="dynamic",
+        foreign_keys="FlowTestCaseRunModel.test_case_id",
     )
 
     def __repr__(self) -> str:
@@ -4,7 +4,16 @@
 
 from enum import Enum
 
-from sqlalchemy import BigInteger, Column, DateTime, Float, ForeignKey, String, Text
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+)
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
@@ -26,6 +35,14 @@ class TestCaseRunStatus(str, Enum):
 
 class FlowTestCaseRunModel(AppBaseModel):
     __tablename__ = "flow_test_case_runs"
+    __table_args__ = (
+        Index(
+            "idx_flow_test_case_runs_test_case_id_created_at",
+            "test_case_id",
+            "created_at",
+        ),
+        Index("idx_flow_test_case_runs_task_run_id", "task_run_id"),
+    )
 
     # Khóa ngoại trỏ về test case mà nó thuộc về
     test_case_id = Column(
@@ -59,4 +76,6 @@ class FlowTestCaseRunModel(AppBaseModel):
     finished_at = Column(DateTime, nullable=True)
 
     # Quan hệ ngược lại để từ một Run có thể truy cập Test Case
-    test_case = relationship("FlowTestCaseModel", back_populates="runs")
+    test_case = relationship(
+        "FlowTestCaseModel", back_populates="runs", foreign_keys=[test_case_id]
+    )
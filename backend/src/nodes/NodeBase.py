@@ -1,10 +1,12 @@
 # node_base.py
+import asyncio
 import json
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Type, Union, get_args
 
 from pydantic import BaseModel
 from src.consts.node_consts import NODE_DATA_MODE, NODE_EXECUTION_STATUS
+from src.core.node_result_cache import get_node_result_cache
 from src.exceptions.node_exceptions import NodeValidationError
 from src.executors.ExecutionContext import ExecutionContext
 from src.helpers.PydanticSchemaConverter import PydanticSchemaConverter
@@ -28,6 +30,10 @@ class Node(ABC):
     id: Optional[str] = None  # Late initialization (When graph is run)
     spec: NodeSpec
     context: Optional[ExecutionContext] = None
+    cache_hit: bool = False  # Set by execute() when outputs came from the memo
+    # process() makes blocking calls (sync HTTP/DB clients): run it on a
+    # worker thread so it does not stall the event loop
+    blocking_io: bool = False
 
     # ============================================================================
     # CLASS SETUP AND VALIDATION
@@ -199,6 +205,33 @@ class Node(ABC):
         if extra:
             raise NodeValidationError(f"Unexpected output keys: {sorted(extra)}")
 
+    # ============================================================================
+    # MEMOIZATION
+    # ============================================================================
+
+    def _result_cache_key(
+        self, input_values: Dict[str, Any], parameter_values: Dict[str, Any]
+    ) -> Optional[str]:
+        """Memo key of this call, None when the node's spec does not opt in."""
+        if not self.spec.cache_policy.enabled or get_node_result_cache() is None:
+            return None
+        return get_node_result_cache().make_key(
+            self.spec.name, parameter_values, input_values
+        )
+
+    def _get_cached_outputs(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        if cache_key is None:
+            return None
+        return get_node_result_cache().get(cache_key)
+
+    def _cache_outputs(
+        self, cache_key: Optional[str], output_values: Dict[str, Any]
+    ) -> None:
+        if cache_key is not None:
+            get_node_result_cache().set(
+                cache_key, output_values, self.spec.cache_policy
+            )
+
     # ============================================================================
     # CORE EXECUTION
     # ============================================================================
@@ -275,8 +308,15 @@ class Node(ABC):
         if node_data.mode == NODE_DATA_MODE.NORMAL:
             input_values = self._extract_input_values(node_data)
             parameter_values = self._extract_parameter_values(node_data)
-            output_results = await self.process(input_values, parameter_values)
-            output_values = self._build_output_mapping(output_results)
+
+            # Reuse the outputs of an identical earlier call when the spec allows
+            cache_key = self._result_cache_key(input_values, parameter_values)
+            output_values = self._get_cached_outputs(cache_key)
+            self.cache_hit = output_values is not None
+            if output_values is None:
+                output_results = await self._run_process(input_values, parameter_values)
+                output_values = self._build_output_mapping(output_results)
+                self._cache_outputs(cache_key, output_values)
 
             return self._create_result_node_data(
                 original=node_data, outputs=output_values
@@ -301,6 +341,16 @@ class Node(ABC):
                 original=node_data, outputs=output_values
             )
 
+    async def _run_process(
+        self, input_values: Dict[str, Any], parameter_values: Dict[str, Any]
+    ) -> Any:
+        if not self.blocking_io:
+            return await self.process(input_values, parameter_values)
+        # Own loop in the thread: blocking nodes hold no loop-bound resources
+        return await asyncio.to_thread(
+            asyncio.run, self.process(input_values, parameter_values)
+        )
+
     def _create_result_node_data(
         self, original: "NodeData", outputs: Dict[str, Any]
     ) -> "NodeData":
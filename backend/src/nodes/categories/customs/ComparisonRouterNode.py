@@ -1,6 +1,7 @@
 from typing import Any, Dict, Union
 
 from loguru import logger
+from src.nodes.core.NodeCachePolicy import NodeCachePolicy
 from src.nodes.core.NodeIcon import NodeIconIconify
 from src.nodes.core.NodeInput import NodeInput
 from src.nodes.core.NodeOutput import NodeOutput
@@ -68,6 +69,7 @@ class ComparisonRouterNode(Node):
         ],
         parameters=[],
         can_be_tool=False,
+        cache_policy=NodeCachePolicy(mode="pure"),
         icon=NodeIconIconify(icon_value="tabler:route-alt-right"),
     )
 
@@ -39,6 +39,7 @@ from src.schemas.nodes.node_data_parsers import BuildToolResult
 
 
 class HttpRequestNode(Node):
+    blocking_io = True  # Sync client calls
     spec: NodeSpec = NodeSpec(
         name="HTTP Request",
         description="HTTP Request node perform request.",
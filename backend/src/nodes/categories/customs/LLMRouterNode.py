@@ -1,3 +1,4 @@
+import asyncio
 import json
 from typing import Any, Dict, List, Union
 
@@ -105,7 +106,9 @@ class LLMRouterNode(Node):
             system_prompt=self._get_routing_system_prompt(additional_instruction),
             tools=[],
         )
-        route_decision_structured_output = agent.chat_structured(
+        # Blocking provider call: keep it off the event loop
+        route_decision_structured_output = await asyncio.to_thread(
+            agent.chat_structured,
             message=chat_message,
             prev_histories=[],
             output_schema=self._get_routing_structured_schema(),
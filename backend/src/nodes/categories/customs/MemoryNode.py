@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Union
 
 from loguru import logger
 from src.consts.node_consts import NODE_GROUP_CONSTS, NODE_TAGS_CONSTS
-from src.dependencies.db_dependency import AsyncSessionLocal
+from src.dependencies.db_dependency import get_task_sessionmaker
 from src.models.parsers.SessionChatHistoryParser import (
     SessionChatHistoryListParser,
     SessionChatHistoryParser,
@@ -77,8 +77,10 @@ class MemoryNode(Node):
 
         logger.info(f"Context: {self.context.to_dict()}")
 
-        # Properly manage database session to avoid resource leaks
-        async with AsyncSessionLocal() as db_session:
+        # Properly manage database session to avoid resource leaks. Flows run
+        # on worker loops and API execution threads, never on the API loop, so
+        # the pooled API engine must not be used here
+        async with get_task_sessionmaker()() as db_session:
             playground_service = PlaygroundService(
                 flow_repository=FlowRepositories(),
                 flow_session_repository=SessionRepository(),
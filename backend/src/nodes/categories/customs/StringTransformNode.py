@@ -1,4 +1,7 @@
+import asyncio
+
 from loguru import logger
+from src.nodes.core.NodeCachePolicy import NodeCachePolicy
 from src.nodes.core.NodeInput import NodeInput
 from src.nodes.core.NodeOutput import NodeOutput
 from src.nodes.core.NodeParameterSpec import ParameterSpec
@@ -40,6 +43,7 @@ class StringTransformNode(Node):
             )
         ],
         can_be_tool=False,
+        cache_policy=NodeCachePolicy(mode="pure"),
     )
 
     async def process(self, input_values, parameter_values):
@@ -50,9 +54,7 @@ class StringTransformNode(Node):
 
         logger.info(f"👉 parameter_values: {parameter_values}")
 
-        import time
-
-        time.sleep(1)
+        await asyncio.sleep(1)
 
         if not input_string:
             return {"output": ""}
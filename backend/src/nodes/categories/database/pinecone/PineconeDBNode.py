@@ -38,6 +38,7 @@ from src.schemas.nodes.node_data_parsers import BuildToolResult
 class PineconeDBNode(Node):
     """Node for interacting with Pinecone vector database."""
 
+    blocking_io = True  # Sync client calls
     spec: NodeSpec = NodeSpec(
         name="Pinecone Database",
         description="Connect to Pinecone vector database for vector operations.",
@@ -64,6 +64,7 @@ def extract_table_names_from_query(query: str) -> set:
 class PostgresDBNode(Node):
     """Node for executing PostgreSQL queries with optional embedding support."""
 
+    blocking_io = True  # Sync client calls
     spec: NodeSpec = NodeSpec(
         name="PostgreSQL Database",
         description="Execute PostgreSQL queries with optional embedding support.",
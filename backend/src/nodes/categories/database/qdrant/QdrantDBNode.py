@@ -39,6 +39,7 @@ from src.schemas.nodes.node_data_parsers import BuildToolResult
 class QdrantDBNode(Node):
     """Node for interacting with Qdrant vector database."""
 
+    blocking_io = True  # Sync client calls
     spec: NodeSpec = NodeSpec(
         name="Qdrant Database",
         description="Connect to Qdrant vector database for vector operations.",
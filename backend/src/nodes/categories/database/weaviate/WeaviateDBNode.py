@@ -44,6 +44,7 @@ except ImportError:
 class WeaviateDBNode(Node):
     """Node for interacting with Weaviate vector database."""
 
+    blocking_io = True  # Sync client calls
     spec: NodeSpec = NodeSpec(
         name="Weaviate Database",
         description="Connect to Weaviate vector database for vector operations.",
@@ -1,9 +1,11 @@
+import asyncio
 import json
 from typing import Any, Dict
 
 import requests
 from loguru import logger
 from pydantic import BaseModel, Field
+from src.nodes.core.NodeCachePolicy import NodeCachePolicy
 from src.nodes.core.NodeIcon import NodeIconIconify
 from src.nodes.core.NodeInput import NodeInput
 from src.nodes.core.NodeOutput import NodeOutput
@@ -47,6 +49,7 @@ class TavilySearchNode(Node):
         ],
         parameters=[],
         can_be_tool=True,
+        cache_policy=NodeCachePolicy(mode="ttl", ttl_seconds=900),
         icon=NodeIconIconify(icon_value="hugeicons:global-search"),
     )
 
@@ -84,7 +87,10 @@ class TavilySearchNode(Node):
         payload = {"query": search_query}
 
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            # Blocking HTTP call: keep it off the event loop
+            response = await asyncio.to_thread(
+                requests.post, url, headers=headers, json=payload, timeout=30
+            )
         except requests.exceptions.Timeout:
             logger.error("Tavily API request timed out")
             raise ValueError("Request timed out")
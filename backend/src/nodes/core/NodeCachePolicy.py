@@ -0,0 +1,27 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class NodeCachePolicy(BaseModel):
+    """Whether a node's results may be reused across runs (memoization)."""
+
+    mode: Literal["never", "pure", "ttl"] = Field(
+        default="never",
+        description="'pure': same inputs and parameters always give the same "
+        "outputs. 'ttl': results stay valid for ttl_seconds (idempotent "
+        "external calls). 'never': always execute.",
+    )
+    ttl_seconds: Optional[int] = Field(
+        default=None, description="How long results are reused in 'ttl' mode"
+    )
+
+    @model_validator(mode="after")
+    def validate_ttl(self) -> "NodeCachePolicy":
+        if self.mode == "ttl" and not self.ttl_seconds:
+            raise ValueError("Cache policy 'ttl' requires a positive ttl_seconds")
+        return self
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "never"
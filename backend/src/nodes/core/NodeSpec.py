@@ -2,6 +2,7 @@ from typing import List
 
 from pydantic import BaseModel, Field, model_validator
 from src.consts.node_consts import NODE_GROUP_CONSTS
+from src.nodes.core.NodeCachePolicy import NodeCachePolicy
 from src.nodes.core.NodeIcon import NodeIcon
 from src.nodes.core.NodeInput import NodeInput
 from src.nodes.core.NodeOutput import NodeOutput
@@ -21,6 +22,10 @@ class NodeSpec(BaseModel):
     can_be_tool: bool = Field(
         default=False, description="Whether node can be used as a tool"
     )
+    cache_policy: NodeCachePolicy = Field(
+        default_factory=NodeCachePolicy,
+        description="Whether results of the node can be reused across runs",
+    )
 
     # Metadata fields (Mostly for decorational purposes)
     group: str = Field(
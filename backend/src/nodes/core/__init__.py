@@ -1,8 +1,10 @@
+from .NodeCachePolicy import NodeCachePolicy
 from .NodeInput import NodeInput
 from .NodeOutput import NodeOutput
 from .NodeSpec import NodeSpec
 
 __all__ = [
+    "NodeCachePolicy",
     "NodeInput",
     "NodeOutput",
     "NodeSpec",
@@ -1,9 +1,9 @@
 import hashlib
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.alchemy.auth.ApiKey import ApiKeyModel
 from src.repositories.BaseRepository import BaseRepository
@@ -133,6 +133,78 @@ class ApiKeyRepository(BaseRepository[ApiKeyModel]):
             logger.error(f"Error validating API key: {e}")
             raise e
 
+    async def find_valid_api_key_by_hash(
+        self, session: AsyncSession, key_hash: str
+    ) -> Optional[ApiKeyModel]:
+        """
+        Read-only lookup of an active, non-expired API key by its hash
+        """
+        try:
+            current_time = datetime.utcnow()
+            result = await session.execute(
+                select(ApiKeyModel).where(
+                    ApiKeyModel.key_hash == key_hash,
+                    ApiKeyModel.is_active == True,
+                    (ApiKeyModel.expires_at.is_(None))
+                    | (ApiKeyModel.expires_at > current_time),
+                )
+            )
+            return result.scalar_one_or_none()
+        except Exception as e:
+            logger.error(f"Error looking up API key by hash: {e}")
+            raise e
+
+    async def get_key_hash_by_key_id(
+        self, session: AsyncSession, key_id: str
+    ) -> Optional[str]:
+        """
+        Get the stored hash of an API key by key_id
+        """
+        try:
+            result = await session.execute(
+                select(ApiKeyModel.key_hash).where(ApiKeyModel.key_id == key_id)
+            )
+            return result.scalar_one_or_none()
+        except Exception as e:
+            logger.error(f"Error retrieving API key hash for key_id {key_id}: {e}")
+            raise e
+
+    async def bulk_update_last_used_at(
+        self, session: AsyncSession, usages: Dict[str, datetime]
+    ) -> int:
+        """
+        Update last_used_at for many keys in one executemany round trip.
+        Timestamps never move backwards.
+
+        Args:
+            usages: Mapping of key_id -> last used time
+        """
+        if not usages:
+            return 0
+        try:
+            table = ApiKeyModel.__table__
+            stmt = (
+                table.update()
+                .where(table.c.key_id == bindparam("b_key_id"))
+                .where(
+                    (table.c.last_used_at.is_(None))
+                    | (table.c.last_used_at < bindparam("b_last_used_at"))
+                )
+                .values(last_used_at=bindparam("b_last_used_at"))
+            )
+            await session.execute(
+                stmt,
+                [
+                    {"b_key_id": key_id, "b_last_used_at": used_at}
+                    for key_id, used_at in usages.items()
+                ],
+            )
+            logger.info(f"Bulk updated usage timestamp for {len(usages)} API key(s)")
+            return len(usages)
+        except Exception as e:
+            logger.error(f"Error bulk updating API key usage timestamps: {e}")
+            raise e
+
     async def get_api_key_by_hash(
         self, session: AsyncSession, key_hash: str
     ) -> Optional[ApiKeyModel]:
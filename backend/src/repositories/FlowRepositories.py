@@ -5,7 +5,7 @@ from typing import List, Optional, Tuple
 from uuid import uuid4
 
 from loguru import logger
-from sqlalchemy import func, select
+from sqlalchemy import Row, Select, func, select, tuple_
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.alchemy.flows.FlowModel import FlowModel
@@ -43,16 +43,43 @@ class FlowRepository(BaseRepository):
             )
             raise e
 
+    @staticmethod
+    def _apply_keyset(
+        query: Select, cursor: Optional[Tuple[datetime, str]], limit: int
+    ) -> Select:
+        """
+        Order by (modified_at, flow_id) descending and seek past the cursor.
+        Backed by idx_flows_user_id_modified_at_flow_id so no rows are skipped-scanned.
+        """
+        if cursor is not None:
+            cursor_modified_at, cursor_flow_id = cursor
+            query = query.where(
+                tuple_(FlowModel.modified_at, FlowModel.flow_id)
+                < tuple_(cursor_modified_at, cursor_flow_id)
+            )
+        return query.order_by(
+            FlowModel.modified_at.desc(), FlowModel.flow_id.desc()
+        ).limit(limit)
+
     async def get_all_paged(
-        self, session: AsyncSession, page: int = 1, per_page: int = 10
+        self,
+        session: AsyncSession,
+        page: int = 1,
+        per_page: int = 10,
+        cursor: Optional[Tuple[datetime, str]] = None,
     ) -> List[FlowModel]:
         """
-        Get all flows
+        Get all flows.
+        When a keyset cursor is given it takes precedence over page (no OFFSET scan).
         """
         try:
-            result = await session.execute(
-                select(FlowModel).offset((page - 1) * per_page).limit(per_page)
-            )
+            query = select(FlowModel)
+            if cursor is not None:
+                query = self._apply_keyset(query=query, cursor=cursor, limit=per_page)
+            else:
+                query = query.offset((page - 1) * per_page).limit(per_page)
+
+            result = await session.execute(query)
             flows = result.scalars().all()
             logger.info(
                 f"Retrieved {len(flows)} flows for page {page}, per_page {per_page}."
@@ -82,6 +109,28 @@ class FlowRepository(BaseRepository):
             await session.rollback()
             raise e
 
+    async def get_definition_by_id(
+        self, session: AsyncSession, flow_id: str
+    ) -> Optional[Row]:
+        """
+        Get the columns needed to run a flow (no relationships, no full ORM row).
+        """
+        try:
+            result = await session.execute(
+                select(
+                    FlowModel.flow_id,
+                    FlowModel.user_id,
+                    FlowModel.is_active,
+                    FlowModel.flow_definition,
+                    FlowModel.modified_at,
+                ).filter_by(flow_id=flow_id)
+            )
+            return result.one_or_none()
+        except Exception as e:
+            logger.error(f"Error retrieving flow definition by ID {flow_id}: {e}")
+            await session.rollback()
+            raise e
+
     async def get_by_user_id(
         self, session: AsyncSession, user_id: int
     ) -> List[FlowModel]:
@@ -98,6 +147,20 @@ class FlowRepository(BaseRepository):
             await session.rollback()
             raise e
 
+    async def count_by_user_id(self, session: AsyncSession, user_id: int) -> int:
+        """
+        Count flows owned by a user
+        """
+        try:
+            count_result = await session.execute(
+                select(func.count(FlowModel.flow_id)).filter_by(user_id=user_id)
+            )
+            return count_result.scalar() or 0
+        except Exception as e:
+            logger.error(f"Error counting flows for user ID {user_id}: {e}")
+            await session.rollback()
+            raise
+
     async def get_by_user_id_paged(
         self,
         session: AsyncSession,
@@ -105,16 +168,18 @@ class FlowRepository(BaseRepository):
         page: int = 1,
         per_page: int = 10,
         sort_by_time_created: bool = True,
+        total_items: Optional[int] = None,
     ) -> Tuple[List[FlowModel], int]:
         """
-        Returns a tuple of (flows on this page, total matching flows)
+        Returns a tuple of (flows on this page, total matching flows).
+        Pass total_items (e.g. from a cached counter) to skip the COUNT query.
         """
         try:
             # 1) total count
-            count_result = await session.execute(
-                select(func.count(FlowModel.flow_id)).filter_by(user_id=user_id)
-            )
-            total_items = count_result.scalar()
+            if total_items is None:
+                total_items = await self.count_by_user_id(
+                    session=session, user_id=user_id
+                )
 
             # 2) paged items
             result = await session.execute(
@@ -143,6 +208,46 @@ class FlowRepository(BaseRepository):
             await session.rollback()
             raise
 
+    async def get_by_user_id_keyset(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        limit: int = 10,
+        cursor: Optional[Tuple[datetime, str]] = None,
+    ) -> Tuple[List[FlowModel], Optional[Tuple[datetime, str]]]:
+        """
+        Cursor-based page of a user's flows ordered by (modified_at, flow_id) desc.
+
+        Returns:
+            (flows, next_cursor) where next_cursor is None on the last page.
+        """
+        try:
+            # Fetch one extra row to know whether another page exists
+            query = self._apply_keyset(
+                query=select(FlowModel).filter_by(user_id=user_id),
+                cursor=cursor,
+                limit=limit + 1,
+            )
+            result = await session.execute(query)
+            flows = list(result.scalars().all())
+
+            next_cursor = None
+            if len(flows) > limit:
+                flows = flows[:limit]
+                last = flows[-1]
+                next_cursor = (last.modified_at, last.flow_id)
+
+            logger.info(
+                f"User {user_id} – keyset page: returned {len(flows)} flows "
+                f"(has_more={next_cursor is not None})."
+            )
+            return flows, next_cursor
+
+        except Exception as e:
+            logger.error(f"Error retrieving keyset flows by user ID {user_id}: {e}")
+            await session.rollback()
+            raise
+
     async def create_empty_flow(self, session: AsyncSession, user_id: int) -> FlowModel:
         """
         Create a new flow with auto-incremented name like 'New Flow', 'New Flow (1)', etc.,
@@ -358,9 +463,9 @@ class FlowRepository(BaseRepository):
             logger.error(f"Error updating flow with ID {flow.flow_id}: {e}")
             raise e
 
-    async def delete_flow(self, session: AsyncSession, flow_id: str) -> None:
+    async def delete_flow(self, session: AsyncSession, flow_id: str) -> FlowModel:
         """
-        Delete flow
+        Delete flow. Returns the deleted (now detached) flow.
         """
         try:
             result = await session.execute(select(FlowModel).filter_by(flow_id=flow_id))
@@ -373,6 +478,7 @@ class FlowRepository(BaseRepository):
             await session.delete(flow)
             await session.flush()
             logger.info(f"Deleted flow with ID: {flow_id}")
+            return flow
         except NoResultFound as e:
             await session.rollback()
             logger.error(
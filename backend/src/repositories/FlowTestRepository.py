@@ -1,8 +1,23 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from loguru import logger
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import (
+    Column,
+    String,
+    and_,
+    any_,
+    bindparam,
+    case,
+    cast,
+    column,
+    func,
+    or_,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.alchemy.flows.FlowTestCaseModel import FlowTestCaseModel
@@ -371,33 +386,9 @@ class FlowTestRepository(BaseRepository):
 
             suite_ids = [row.id for row in suites]
 
-            # 2) Build a subquery that picks the latest run per test_case using a window function
-            #    ROW_NUMBER() OVER (PARTITION BY test_case_id ORDER BY created_at DESC) = 1
-            latest_runs_sq = select(
-                FlowTestCaseRunModel.test_case_id.label("case_id"),
-                FlowTestCaseRunModel.id.label("run_id"),
-                FlowTestCaseRunModel.task_run_id.label("task_run_id"),
-                FlowTestCaseRunModel.status.label("latest_status"),
-                FlowTestCaseRunModel.actual_output.label("actual_output"),
-                FlowTestCaseRunModel.error_message.label("error_message"),
-                FlowTestCaseRunModel.execution_time_ms.label("execution_time_ms"),
-                FlowTestCaseRunModel.run_detail.label("run_detail"),
-                FlowTestCaseRunModel.criteria_results.label("criteria_results"),
-                FlowTestCaseRunModel.trigger_type.label("trigger_type"),
-                FlowTestCaseRunModel.triggered_by.label("triggered_by"),
-                FlowTestCaseRunModel.started_at.label("started_at"),
-                FlowTestCaseRunModel.finished_at.label("finished_at"),
-                FlowTestCaseRunModel.created_at.label("created_at"),
-                func.row_number()
-                .over(
-                    partition_by=FlowTestCaseRunModel.test_case_id,
-                    order_by=FlowTestCaseRunModel.created_at.desc(),
-                )
-                .label("rn"),
-            ).subquery("latest_runs_sq")
-
-            # 3) Fetch all cases for all suites in one go, left-joining the "rn=1" row for latest status
-            #    Note: put rn=1 in the join condition to keep it an OUTER join.
+            # 2) Fetch all cases for all suites in one go, left-joining the latest run
+            #    through the denormalized latest_run_id pointer (a primary key lookup
+            #    per case, independent of how many runs a case has)
             cases_result = await session.execute(
                 select(
                     FlowTestCaseModel.id.label("id"),
@@ -406,37 +397,24 @@ class FlowTestRepository(BaseRepository):
                     FlowTestCaseModel.name.label("name"),
                     FlowTestCaseModel.description.label("description"),
                     FlowTestCaseModel.is_active.label("is_active"),
-                    latest_runs_sq.c.latest_status.label("latest_run_status"),
-                    latest_runs_sq.c.run_id.label("latest_run_id"),
-                    latest_runs_sq.c.task_run_id.label("latest_run_task_run_id"),
-                    latest_runs_sq.c.actual_output.label("latest_run_actual_output"),
-                    latest_runs_sq.c.error_message.label("latest_run_error_message"),
-                    latest_runs_sq.c.execution_time_ms.label(
-                        "latest_run_execution_time_ms"
+                    FlowTestCaseRunModel.status.label("latest_run_status"),
+                    FlowTestCaseRunModel.actual_output.label(
+                        "latest_run_actual_output"
                     ),
-                    latest_runs_sq.c.run_detail.label("latest_run_run_detail"),
-                    latest_runs_sq.c.criteria_results.label(
-                        "latest_run_criteria_results"
+                    FlowTestCaseRunModel.error_message.label(
+                        "latest_run_error_message"
                     ),
-                    latest_runs_sq.c.trigger_type.label("latest_run_trigger_type"),
-                    latest_runs_sq.c.triggered_by.label("latest_run_triggered_by"),
-                    latest_runs_sq.c.started_at.label("latest_run_started_at"),
-                    latest_runs_sq.c.finished_at.label("latest_run_finished_at"),
-                    latest_runs_sq.c.created_at.label("latest_run_created_at"),
                 )
                 .filter(FlowTestCaseModel.suite_id.in_(suite_ids))
                 .outerjoin(
-                    latest_runs_sq,
-                    and_(
-                        latest_runs_sq.c.case_id == FlowTestCaseModel.id,
-                        latest_runs_sq.c.rn == 1,
-                    ),
+                    FlowTestCaseRunModel,
+                    FlowTestCaseRunModel.id == FlowTestCaseModel.latest_run_id,
                 )
                 .order_by(FlowTestCaseModel.id)  # Consistent ordering by ID
             )
             cases_rows = cases_result.all()
 
-            # 4) Group cases by suite_id
+            # 3) Group cases by suite_id
             cases_by_suite = {}
             for r in cases_rows:
                 cases_by_suite.setdefault(r.suite_id, []).append(
@@ -458,7 +436,7 @@ class FlowTestRepository(BaseRepository):
                     }
                 )
 
-            # 5) Assemble final structure
+            # 4) Assemble final structure
             result = []
             for suite in suites:
                 result.append(
@@ -534,6 +512,24 @@ class FlowTestRepository(BaseRepository):
             )
             session.add(test_case_run)
             await session.flush()
+
+            # Move the case's latest-run pointer in the same transaction. Run ids
+            # come from a sequence, so the guard keeps concurrent queues monotonic.
+            await session.execute(
+                update(FlowTestCaseModel)
+                .where(
+                    FlowTestCaseModel.id == test_case_id,
+                    or_(
+                        FlowTestCaseModel.latest_run_id.is_(None),
+                        FlowTestCaseModel.latest_run_id < test_case_run.id,
+                    ),
+                )
+                .values(
+                    latest_run_id=test_case_run.id,
+                    modified_at=FlowTestCaseModel.modified_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
             logger.info(
                 f"Successfully queued test case with ID {test_case_id} for execution"
             )
@@ -687,34 +683,17 @@ class FlowTestRepository(BaseRepository):
             if not test_case_ids:
                 return {}
 
-            # Query to get the latest run for each test case
-            # Subquery to get the latest created_at for each test case
-            latest_run_subquery = (
-                select(
-                    FlowTestCaseRunModel.test_case_id,
-                    func.max(FlowTestCaseRunModel.created_at).label("max_created_at"),
-                )
-                .filter(FlowTestCaseRunModel.test_case_id.in_(test_case_ids))
-                .group_by(FlowTestCaseRunModel.test_case_id)
-                .subquery("latest_run_subquery")
-            )
-
-            # Query to get the status of the latest run for each test case
+            # Follow each test case's latest_run_id pointer to its run
             latest_run_query = await session.execute(
                 select(
-                    FlowTestCaseRunModel.test_case_id,
+                    FlowTestCaseModel.id,
                     FlowTestCaseRunModel.status,
-                ).join(
-                    latest_run_subquery,
-                    (
-                        FlowTestCaseRunModel.test_case_id
-                        == latest_run_subquery.c.test_case_id
-                    )
-                    & (
-                        FlowTestCaseRunModel.created_at
-                        == latest_run_subquery.c.max_created_at
-                    ),
                 )
+                .join(
+                    FlowTestCaseRunModel,
+                    FlowTestCaseRunModel.id == FlowTestCaseModel.latest_run_id,
+                )
+                .filter(FlowTestCaseModel.id.in_(test_case_ids))
             )
             latest_runs = latest_run_query.all()
 
@@ -749,10 +728,13 @@ class FlowTestRepository(BaseRepository):
         try:
             # Query to get the latest run for the test case
             result = await session.execute(
-                select(FlowTestCaseRunModel)
-                .filter_by(test_case_id=test_case_id)
-                .order_by(desc(FlowTestCaseRunModel.created_at))
-                .limit(1)
+                select(FlowTestCaseRunModel).join(
+                    FlowTestCaseModel,
+                    and_(
+                        FlowTestCaseModel.id == test_case_id,
+                        FlowTestCaseModel.latest_run_id == FlowTestCaseRunModel.id,
+                    ),
+                )
             )
             latest_run = result.scalar_one_or_none()
 
@@ -839,3 +821,142 @@ class FlowTestRepository(BaseRepository):
         except Exception as e:
             logger.error(f"Error retrieving test case runs by task_run_ids: {e}")
             raise e
+
+    # Columns a run update may set, used by bulk_update_test_case_runs
+    BULK_RUN_UPDATE_COLUMNS: List[str] = [
+        "status",
+        "actual_output",
+        "error_message",
+        "execution_time_ms",
+        "run_detail",
+        "criteria_results",
+        "started_at",
+        "finished_at",
+    ]
+
+    async def bulk_update_test_case_runs(
+        self, session: AsyncSession, updates: Dict[str, Dict[str, Any]]
+    ) -> int:
+        """
+        Apply many partial run updates in one statement:
+        UPDATE flow_test_case_runs ... FROM (VALUES ...) AS v WHERE task_run_id = v.task_run_id
+
+        Missing/None fields keep their current value (same semantics as
+        update_test_case_run). A run that was already CANCELLED keeps that
+        status, so a late buffered RUNNING cannot resurrect it.
+
+        Args:
+            updates: {task_run_id: {column: value, ...}}
+
+        Returns:
+            Number of rows updated
+        """
+        try:
+            if not updates:
+                return 0
+
+            model_columns = {
+                name: getattr(FlowTestCaseRunModel, name)
+                for name in self.BULK_RUN_UPDATE_COLUMNS
+            }
+
+            def value_type(model_column: Column):
+                # JSON null would overwrite the current value, SQL NULL keeps it
+                if isinstance(model_column.type, JSONB):
+                    return JSONB(none_as_null=True)
+                return model_column.type
+
+            rows = values(
+                column("task_run_id", String),
+                *(
+                    column(name, value_type(model_column))
+                    for name, model_column in model_columns.items()
+                ),
+                name="v",
+            ).data(
+                [
+                    (
+                        task_run_id,
+                        *(fields.get(name) for name in self.BULK_RUN_UPDATE_COLUMNS),
+                    )
+                    for task_run_id, fields in updates.items()
+                ]
+            )
+
+            new_values = {
+                name: func.coalesce(cast(rows.c[name], model_column.type), model_column)
+                for name, model_column in model_columns.items()
+            }
+            new_values["status"] = case(
+                (
+                    FlowTestCaseRunModel.status == TestCaseRunStatus.CANCELLED,
+                    FlowTestCaseRunModel.status,
+                ),
+                else_=new_values["status"],
+            )
+
+            result = await session.execute(
+                update(FlowTestCaseRunModel)
+                .where(FlowTestCaseRunModel.task_run_id == rows.c.task_run_id)
+                .values(**new_values)
+                .execution_options(synchronize_session=False)
+            )
+            await session.flush()
+            logger.info(
+                f"Bulk updated {result.rowcount} of {len(updates)} test case runs"
+            )
+            return result.rowcount
+
+        except Exception as e:
+            logger.error(f"Error bulk updating test case runs: {e}")
+            raise e
+
+    CANCELLABLE_RUN_STATUSES = (
+        TestCaseRunStatus.PENDING,
+        TestCaseRunStatus.QUEUED,
+        TestCaseRunStatus.RUNNING,
+    )
+
+    async def cancel_test_case_runs(
+        self, session: AsyncSession, task_run_ids: List[str]
+    ) -> List[str]:
+        """
+        Cancel every still-running test case run of task_run_ids in a single
+        `UPDATE ... WHERE task_run_id = ANY(...) RETURNING` statement.
+
+        Args:
+            task_run_ids: Task run IDs to cancel
+
+        Returns:
+            The task run IDs that were cancelled (runs that are unknown or
+            already in a terminal status are left out)
+        """
+        try:
+            if not task_run_ids:
+                return []
+
+            result = await session.execute(
+                update(FlowTestCaseRunModel)
+                .where(
+                    FlowTestCaseRunModel.task_run_id
+                    == any_(
+                        bindparam(
+                            "task_run_ids", list(task_run_ids), type_=ARRAY(String)
+                        )
+                    ),
+                    FlowTestCaseRunModel.status.in_(self.CANCELLABLE_RUN_STATUSES),
+                )
+                .values(status=TestCaseRunStatus.CANCELLED, finished_at=datetime.now())
+                .returning(FlowTestCaseRunModel.task_run_id)
+                .execution_options(synchronize_session=False)
+            )
+            cancelled = list(result.scalars().all())
+            await session.flush()
+            logger.info(
+                f"Cancelled {len(cancelled)} of {len(task_run_ids)} test case runs"
+            )
+            return cancelled
+
+        except Exception as e:
+            logger.error(f"Error cancelling test case runs: {e}")
+            raise e
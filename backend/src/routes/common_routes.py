@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from src.core.execution_service import get_execution_service
+from src.dependencies.auth_dependency import get_current_user
 
 common_router = APIRouter()
 
@@ -6,3 +8,8 @@ common_router = APIRouter()
 @common_router.get("/health")
 def health():
     return {"status": "ok"}
+
+
+@common_router.get("/health/execution")
+def execution_health(_user_id: int = Depends(get_current_user)):
+    return get_execution_service().metrics()
@@ -1,5 +1,6 @@
 import math
 import traceback
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from loguru import logger
@@ -24,6 +25,7 @@ from src.schemas.flows.flow_schemas import (
     Pagination,
 )
 from src.services.FlowService import FlowService
+from src.utils.pagination_utils import decode_flow_cursor, encode_flow_cursor
 
 flow_router = APIRouter(
     prefix="/api/flows",
@@ -86,12 +88,22 @@ async def get_by_user_id(
     user_id: int = Query(..., description="User ID"),
     page: int = Query(1, description="Page number", ge=1),
     per_page: int = Query(10, description="Number of items per page", ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from a previous response. Enables keyset paging.",
+    ),
+    include_total: bool = Query(
+        True, description="Include the (approximate) total count in cursor mode"
+    ),
     auth_user_id: int = Depends(get_current_user),
     flow_service: FlowService = Depends(get_flow_service),
     session: AsyncSession = Depends(get_async_db),
 ):
     """
-    Get flows by user id
+    Get flows by user id.
+
+    Pass `cursor` (an empty string requests the first page) to page with a
+    keyset on (modified_at, flow_id) instead of OFFSET.
     """
     try:
         if auth_user_id != user_id:
@@ -101,6 +113,35 @@ async def get_by_user_id(
             )
             raise UNAUTHORIZED_EXCEPTION
 
+        if cursor is not None:
+            try:
+                decoded_cursor = decode_flow_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            flows, next_cursor, total_items = await flow_service.get_by_user_id_keyset(
+                session=session,
+                user_id=user_id,
+                limit=per_page,
+                cursor=decoded_cursor,
+                include_total=include_total,
+            )
+
+            return GetFlowResponse(
+                data=flows,
+                pagination=Pagination(
+                    page=page,
+                    page_size=per_page,
+                    total_pages=math.ceil(total_items / per_page)
+                    if total_items is not None
+                    else None,
+                    total_items=total_items,
+                    next_cursor=encode_flow_cursor(*next_cursor)
+                    if next_cursor
+                    else None,
+                ),
+            )
+
         flows, total_items = await flow_service.get_by_user_id_paged(
             session=session, user_id=user_id, page=page, per_page=per_page
         )
@@ -1,14 +1,14 @@
-import asyncio
 import json
 import traceback
 from datetime import datetime
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import JSONResponse, StreamingResponse
 from loguru import logger
-from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.celery_worker.tasks.flow_execution_tasks import compile_flow, run_flow
+from src.core.event_fanout import get_event_fanout
 from src.dependencies.api_key_dependency import get_api_key_service
 from src.dependencies.auth_dependency import (
     auth_through_url_param,
@@ -16,13 +16,21 @@ from src.dependencies.auth_dependency import (
 )
 from src.dependencies.db_dependency import get_async_db
 from src.dependencies.flow_dep import get_flow_service
-from src.dependencies.redis_dependency import get_redis_client
+from src.dependencies.redis_dependency import get_async_redis_client
+from src.exceptions.auth_exceptions import UNAUTHORIZED_EXCEPTION
+from src.exceptions.shared_exceptions import NOT_FOUND_EXCEPTION
+from src.executors.ExecutionEventPublisher import (
+    EXECUTION_VALUES_FLOW_FIELD,
+    get_execution_stream_name,
+    get_execution_values_key,
+)
 from src.schemas.flowbuilder.flow_graph_schemas import (
     ApiFlowRunRequest,
     CanvasFlowRunRequest,
 )
 from src.services.ApiKeyService import ApiKeyService
 from src.services.FlowService import FlowService
+from src.utils.user_events_utils import _normalize_since_id
 from src.workers.FlowAsyncWorker import FlowAsyncWorker
 
 flow_execution_router = APIRouter(
@@ -126,70 +134,102 @@ async def execute_flow_endpoint(
 
 
 @flow_execution_router.get("/stream/{task_id}")
-async def stream_execution(  # noqa
+async def stream_execution(
     task_id: str,
     request: Request,
     _auth_user_id: int = Depends(auth_through_url_param),
-    redis_client: Redis = Depends(get_redis_client),
     token: str = Query(None),
+    last_event_id: Optional[str] = Query(None),
 ):
     """
-    Streams events for a specific task_id using Redis List (BLPOP).
-    SSE format is used for real-time updates.
+    Streams events for a specific task_id from its Redis Stream, read through
+    the process-wide event fan-out. SSE format is used for real-time updates.
+
+    Every event carries its stream id, so a reconnecting client resumes after
+    the `Last-Event-ID` header (or `last_event_id` query param) without loss.
     """
 
     if not token:
         raise HTTPException(status_code=403, detail="Missing access token")
 
-    queue_name = task_id  # Optionally: f"task:{task_id}"
+    stream_name = get_execution_stream_name(task_id)
+    since_id = _normalize_since_id(
+        request.headers.get("Last-Event-ID") or last_event_id
+    )
 
-    async def event_generator():
-        # First, get all existing messages (if any) in correct order
-        existing_messages = redis_client.lrange(queue_name, 0, -1)
+    def is_done(message: str) -> bool:
+        try:
+            return json.loads(message).get("event") == "DONE"
+        except (json.JSONDecodeError, AttributeError):
+            return message == "DONE"  # Fallback for non-JSON messages
 
-        for raw_data in existing_messages:
-            message = (
-                raw_data.decode("utf-8") if isinstance(raw_data, bytes) else raw_data
-            )
-            yield f"data: {message}\n\n"
+    fanout = await get_event_fanout()
 
-            # Check if this was the DONE message
-            try:
-                parsed = json.loads(message)
-                if parsed.get("event") == "DONE":
-                    redis_client.delete(queue_name)
-                    return
-            except json.JSONDecodeError:
-                if message == "DONE":  # Fallback for non-JSON messages
-                    redis_client.delete(queue_name)
-                    return
-
-        # Clear the list since we've sent all existing messages
-        redis_client.delete(queue_name)
-
-        # Now continue with blocking pop for new messages
-        while not await request.is_disconnected():
-            result = await asyncio.to_thread(redis_client.blpop, queue_name, timeout=5)
-            if result:
-                _, raw_data = result
-                message = (
-                    raw_data.decode("utf-8")
-                    if isinstance(raw_data, bytes)
-                    else raw_data
-                )
+    async def event_generator():
+        # Subscribed in the generator so the finally below always closes it,
+        # even when the client leaves before the body starts streaming
+        subscription = await fanout.subscribe_stream(stream_name, since_id)
+        try:
+            while not await request.is_disconnected():
+                entry = await subscription.get(timeout=5)
+                if entry is None:
+                    continue
+                message_id, data = entry
+                message = data.get("data", "{}")
+                yield f"id: {message_id}\n"
                 yield f"data: {message}\n\n"
+                if is_done(message):
+                    break
+        finally:
+            subscription.close()
 
-                try:
-                    parsed = json.loads(message)
-                    if parsed.get("event") == "DONE":
-                        break
-                except json.JSONDecodeError:
-                    if message == "DONE":
-                        break
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
 
-        redis_client.delete(queue_name)
 
-    return StreamingResponse(event_generator(), media_type="text/event-stream")
+@flow_execution_router.get("/stream/{task_id}/values/{ref:path}")
+async def get_truncated_event_value(
+    task_id: str,
+    ref: str,
+    flow_service: FlowService = Depends(get_flow_service),
+    auth_user_id: int = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_db),
+):
+    """
+    Returns the full value behind a truncated node event value (`ref`).
+    Values are kept as long as the run's event stream. Only the owner of the
+    run's flow may read them.
+    """
+    redis_client = get_async_redis_client()
+    try:
+        raw_value, flow_id = await redis_client.hmget(
+            get_execution_values_key(task_id), [ref, EXECUTION_VALUES_FLOW_FIELD]
+        )
+    finally:
+        await redis_client.aclose()
+
+    if flow_id is None:
+        raise HTTPException(status_code=404, detail="Value not found or expired")
+    if isinstance(flow_id, bytes):
+        flow_id = flow_id.decode("utf-8")
+
+    flow = await flow_service.get_flow_detail_by_id(session=session, flow_id=flow_id)
+    if not flow:
+        logger.warning(f"Flow with ID {flow_id} not found.")
+        raise NOT_FOUND_EXCEPTION
+
+    if auth_user_id != flow.user_id:
+        logger.warning(
+            f"User ID mismatch: flow owner is {flow.user_id}, "
+            f"but requester is {auth_user_id}"
+        )
+        raise UNAUTHORIZED_EXCEPTION
+
+    if raw_value is None:
+        raise HTTPException(status_code=404, detail="Value not found or expired")
+
+    return JSONResponse(
+        status_code=200, content={"ref": ref, "value": json.loads(raw_value)}
+    )
 
 
 # --- Main flow Run API ---
@@ -2,21 +2,27 @@ import asyncio
 import json
 import time
 import traceback
+from typing import Optional
 from uuid import uuid4
 
 from celery import current_app
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from loguru import logger
-from redis import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.celery_worker.tasks.flow_test_tasks import (
     dispatch_run_test,
+    dispatch_run_test_chunk,
 )
+from src.configs.config import get_app_settings
+from src.core.batch_plan import get_batch_plan_store
+from src.core.event_fanout import get_event_fanout
+from src.core.run_cancellation import get_run_cancellation
+from src.core.run_scheduler import get_run_scheduler
 from src.dependencies.auth_dependency import auth_through_url_param, get_current_user
 from src.dependencies.db_dependency import get_async_db
+from src.dependencies.flow_dep import get_flow_service
 from src.dependencies.flow_test_dep import get_flow_test_service
-from src.dependencies.redis_dependency import get_redis_client
 from src.models.alchemy.flows.FlowTestCaseRunModel import TestCaseRunStatus
 from src.schemas.flows.flow_test_schemas import (
     FlowBatchTestCancelRequest,
@@ -28,7 +34,9 @@ from src.schemas.flows.flow_test_schemas import (
     FlowTestRunRequest,
     FlowTestRunResponse,
 )
+from src.services.FlowService import FlowService
 from src.services.FlowTestService import FlowTestService
+from src.utils.user_events_utils import _normalize_since_id
 
 flow_test_run_router = APIRouter(
     prefix="/api/flow-test-runs",
@@ -119,6 +127,7 @@ async def run_batch_test(
     request: FlowBatchTestRunRequest,
     session: AsyncSession = Depends(get_async_db),
     flow_test_service: FlowTestService = Depends(get_flow_test_service),
+    flow_service: FlowService = Depends(get_flow_service),
     auth_user_id: int = Depends(get_current_user),
 ):
     """
@@ -170,6 +179,11 @@ async def run_batch_test(
                 flow_id=request.flow_id,
             )
 
+        # Compile the flow once and pin the plan for every case of the batch
+        batch_id = await _pin_batch_plan(
+            flow_id=request.flow_id, flow_service=flow_service, session=session
+        )
+
         # NOTE: This to generate a unique task ID instead of using from celery to avoid race conditions of accessing the TestCaseRun with task_id may not be exist yet # noqa
 
         # Generate unique task IDs for valid cases and queue them
@@ -182,12 +196,30 @@ async def run_batch_test(
                 session=session, test_case_id=case_id, task_run_id=generated_task_id
             )
 
-            dispatch_run_test.delay(
-                generated_task_id=generated_task_id,
-                user_id=auth_user_id,
-                flow_id=request.flow_id,
-                case_id=case_id,
-            )
+        chunk_size = get_app_settings().TEST_BATCH_CHUNK_SIZE
+        if batch_id and chunk_size > 1:
+            # Run cases in chunks, each chunk concurrently inside one worker task
+            cases = [
+                {"task_id": task_id, "case_id": case_id}
+                for task_id, case_id in zip(generated_task_ids, valid_case_ids)
+            ]
+            for start in range(0, len(cases), chunk_size):
+                dispatch_run_test_chunk.delay(
+                    chunk_task_id=str(uuid4()),
+                    user_id=auth_user_id,
+                    flow_id=request.flow_id,
+                    batch_id=batch_id,
+                    cases=cases[start : start + chunk_size],
+                )
+        else:
+            for task_id, case_id in zip(generated_task_ids, valid_case_ids):
+                dispatch_run_test.delay(
+                    generated_task_id=task_id,
+                    user_id=auth_user_id,
+                    flow_id=request.flow_id,
+                    case_id=case_id,
+                    batch_id=batch_id,
+                )
 
         logger.info(
             f"Batch flow test tasks submitted to Celery. (submitted_by u_id: {auth_user_id}). Task IDs: {generated_task_ids}. Cases: {valid_case_ids}."  # noqa
@@ -214,74 +246,95 @@ async def run_batch_test(
         )
 
 
+async def _pin_batch_plan(
+    flow_id: str, flow_service: FlowService, session: AsyncSession
+) -> Optional[str]:
+    """
+    Compile the flow once for a batch run and pin the plan under a new batch id.
+    Returns None when the flow cannot be pinned; the cases then load and
+    compile the flow themselves and report the error per case as before.
+    """
+    try:
+        flow = await flow_service.get_cached_flow_definition(
+            session=session, flow_id=flow_id
+        )
+        if not flow or not flow.is_active or not flow.flow_definition:
+            return None
+
+        batch_id = str(uuid4())
+        await get_batch_plan_store().pin(batch_id=batch_id, flow=flow)
+        return batch_id
+    except Exception as e:
+        logger.warning(f"Could not pin execution plan for flow {flow_id}: {e}")
+        return None
+
+
 @flow_test_run_router.get("/stream/{task_id}/events")
 async def stream_events(
     request: Request,
     task_id: str,
     since_id: str = "0",
     _auth_user_id: int = Depends(auth_through_url_param),
-    redis_client: Redis = Depends(get_redis_client),
     token: str = Query(None),
 ):
     if not token:
         raise HTTPException(status_code=403, detail="Missing access token")
 
     stream_name = f"test_run_events:{task_id}"
+    fanout = await get_event_fanout()
 
-    async def event_generator():
-        nonlocal since_id
-
-        # Now continue with blocking read for new messages (like BLPOP)
-        while not await request.is_disconnected():
-            events = await asyncio.to_thread(
-                redis_client.xread,
-                streams={stream_name: since_id},
-                count=5,
-                block=5000,  # Match the working endpoint's 5-second timeout
-            )
+    terminal_statuses = [
+        "PASSED",
+        "FAILED",
+        "CANCELLED",
+        "SYSTEM_ERROR",
+    ]
 
-            if events:
-                for _, messages in events:
-                    for message_id, data in messages:
-                        since_id = message_id
-
-                        # Parse the inner data to check for terminal status
-                        inner_data = json.loads(data.get("data", "{}"))
-                        status = inner_data.get("payload", {}).get("status")
-
-                        # Send regular update
-                        payload = {
-                            "event": "UPDATE",
-                            "id": message_id,
-                            "task_id": task_id,
-                            "data": data,
-                            "timestamp": time.time(),
-                        }
-                        yield f"id: {message_id}\n"
-                        yield f"data: {json.dumps(payload)}\n\n"
-
-                        # Check if this is a terminal status and send done event
-                        terminal_statuses = [
-                            "PASSED",
-                            "FAILED",
-                            "CANCELLED",
-                            "SYSTEM_ERROR",
-                        ]
-                        if status in terminal_statuses:
-                            # Send done event
-                            done_payload = {
-                                "event": "DONE",
-                                "id": f"{message_id}:done",
-                                "task_id": task_id,
-                                "status": status,
-                                "timestamp": time.time(),
-                            }
-                            yield f"id: {message_id}:done\n"
-                            yield f"data: {json.dumps(done_payload)}\n\n"
-
-                            # Exit the loop to stop streaming
-                            redis_client.expire(stream_name, 10)
-                            return
+    async def event_generator():
+        # Subscribed here so the finally below always closes it
+        subscription = await fanout.subscribe_stream(
+            stream_name, _normalize_since_id(since_id)
+        )
+        try:
+            while not await request.is_disconnected():
+                entry = await subscription.get(timeout=5)
+                if entry is None:
+                    continue
+
+                message_id, data = entry
+
+                # Parse the inner data to check for terminal status
+                inner_data = json.loads(data.get("data", "{}"))
+                status = inner_data.get("payload", {}).get("status")
+
+                # Send regular update
+                payload = {
+                    "event": "UPDATE",
+                    "id": message_id,
+                    "task_id": task_id,
+                    "data": data,
+                    "timestamp": time.time(),
+                }
+                yield f"id: {message_id}\n"
+                yield f"data: {json.dumps(payload)}\n\n"
+
+                # Check if this is a terminal status and send done event
+                if status in terminal_statuses:
+                    done_payload = {
+                        "event": "DONE",
+                        "id": f"{message_id}:done",
+                        "task_id": task_id,
+                        "status": status,
+                        "timestamp": time.time(),
+                    }
+                    yield f"id: {message_id}:done\n"
+                    yield f"data: {json.dumps(done_payload)}\n\n"
+
+                    # Exit the loop to stop streaming
+                    await fanout.redis.expire(stream_name, 10)
+                    return
+        finally:
+            subscription.close()
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -328,6 +381,16 @@ async def cancel_single_test(
                 cancelled=False,
             )
 
+        # Flag it first so an executor that is already running stops at its
+        # next layer (chunked batch runs cannot be revoked on their own)
+        await get_run_cancellation().mark_cancelled([request.task_id])
+
+        # Drop it from the scheduler if it is still waiting for a slot
+        try:
+            await asyncio.to_thread(get_run_scheduler().cancel, request.task_id)
+        except Exception as e:
+            logger.error(f"Failed to unqueue test task {request.task_id}: {e}")
+
         # Revoke the Celery task
         try:
             current_app.control.revoke(request.task_id, terminate=True)
@@ -396,48 +459,38 @@ async def cancel_batch_tests(
                 total_failed=0,
             )
 
-        # Get all test case runs to verify they exist
-        test_case_runs = (
-            await flow_test_service.test_repository.get_test_case_runs_by_task_ids(
-                session=session, task_run_ids=request.task_ids
-            )
-        )
+        task_ids = list(dict.fromkeys(request.task_ids))
 
-        # Separate valid and invalid task IDs
-        valid_task_ids = []
-        invalid_task_ids = []
+        # Flag the runs first so executors that are already running stop at
+        # their next layer (chunked batch runs cannot be revoked on their own)
+        await get_run_cancellation().mark_cancelled(task_ids)
 
-        for task_id in request.task_ids:
-            if task_id in test_case_runs:
-                valid_task_ids.append(task_id)
-            else:
-                invalid_task_ids.append(task_id)
-                logger.warning(f"Test case run with task_id {task_id} not found")
+        # Drop the runs still waiting for a slot
+        try:
+            await asyncio.to_thread(get_run_scheduler().cancel_many, task_ids)
+        except Exception as e:
+            logger.error(f"Failed to unqueue test tasks: {e}")
 
-        # Cancel valid test case runs
+        # One set-based UPDATE; unknown and already finished runs come back False
         cancellation_results = await flow_test_service.cancel_test_case_runs(
-            session=session, task_run_ids=valid_task_ids
+            session=session, task_run_ids=task_ids
         )
-
-        # Revoke Celery tasks for successfully cancelled tests
-        cancelled_task_ids = []
-        failed_task_ids = []
-
-        for task_id, success in cancellation_results.items():
-            if success:
-                try:
-                    current_app.control.revoke(task_id, terminate=True)
-                    cancelled_task_ids.append(task_id)
-                    logger.info(f"Successfully cancelled test with task_id {task_id}")
-                except Exception as e:
-                    logger.error(f"Failed to revoke Celery task {task_id}: {e}")
-                    failed_task_ids.append(task_id)
-            else:
-                failed_task_ids.append(task_id)
-                logger.warning(f"Failed to cancel test with task_id {task_id}")
-
-        # Add invalid task IDs to failed list
-        failed_task_ids.extend(invalid_task_ids)
+        cancelled_task_ids = [
+            task_id for task_id in task_ids if cancellation_results.get(task_id)
+        ]
+        failed_task_ids = [
+            task_id for task_id in task_ids if not cancellation_results.get(task_id)
+        ]
+
+        # Revoke the Celery tasks with a single broadcast
+        if cancelled_task_ids:
+            try:
+                await asyncio.to_thread(
+                    current_app.control.revoke, cancelled_task_ids, terminate=True
+                )
+            except Exception as e:
+                logger.error(f"Failed to revoke {len(cancelled_task_ids)} tasks: {e}")
+                # The runs are already cancelled in the database and flagged
 
         total_cancelled = len(cancelled_task_ids)
         total_failed = len(failed_task_ids)
@@ -66,3 +66,20 @@ class ApiKeyListResponse(BaseModel):
     """
 
     api_keys: list[ApiKeyInfoResponse]
+
+
+class CachedApiKey(BaseModel):
+    """
+    Minimal projection of a validated API key kept in the validation cache
+    """
+
+    key_id: str
+    user_id: int
+    name: str
+    expires_at: Optional[datetime] = None
+
+    def is_expired(self) -> bool:
+        """Check if the API key is expired"""
+        if self.expires_at is None:
+            return False
+        return datetime.utcnow() > self.expires_at
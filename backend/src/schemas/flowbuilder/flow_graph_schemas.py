@@ -76,6 +76,12 @@ class CanvasFlowRunRequest(BaseModel):
         "If 'node_only', the flow will execute only the selected node. "
         "If 'downstream', the flow will execute the selected node and its downstream nodes.",  # noqa: E501
     )
+    incremental: bool = Field(
+        default=False,
+        description="Re-execute only the nodes whose spec, parameters or inputs "
+        "changed since the flow last ran (and their descendants), reusing the "
+        "stored results of the others.",
+    )
 
     session_id: Optional[str] = Field(
         default=None,
@@ -127,6 +133,7 @@ class NodeExecutionResult(BaseModel):
     data: Optional[NodeData] = None
     error: Optional[str] = None
     execution_time: float = 0.0
+    cache_hit: bool = False  # Outputs reused from the node result cache
 
 
 class FlowExecutionResult(BaseModel):
@@ -138,3 +145,4 @@ class FlowExecutionResult(BaseModel):
     results: List[NodeExecutionResult]
     chat_output: FlowChatOutputResult
     ancestors: List[str]
+    cache_hits: List[str] = []  # Nodes whose outputs came from the result cache
@@ -16,13 +16,21 @@ class GetFlowResponseItem(BaseModel):
     description: str = Field("", description="Flow description")
     is_active: bool = Field(..., description="Flow status")
     created_at: datetime = Field(..., description="Flow creation date")
+    modified_at: Optional[datetime] = Field(
+        None, description="Flow last modification date"
+    )
 
 
 class Pagination(BaseModel):
     page: int = Field(..., description="Page number")
     page_size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
-    total_items: int = Field(..., description="Total number of items")
+    total_pages: Optional[int] = Field(None, description="Total number of pages")
+    total_items: Optional[int] = Field(
+        None, description="Total number of items (approximate in cursor mode)"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page (cursor mode only)"
+    )
 
 
 class GetFlowResponse(BaseModel):
@@ -75,6 +83,26 @@ class FlowActivationResponse(BaseModel):
 # --- Flow Run ---
 
 
+class CachedFlowDefinition(BaseModel):
+    """Minimal flow projection cached for the public run API."""
+
+    flow_id: str = Field(..., description="Flow ID")
+    user_id: int = Field(..., description="Owner user ID")
+    is_active: bool = Field(..., description="Flow status")
+    flow_definition: Optional[Dict] = Field(None, description="Flow definition")
+    version: str = Field(..., description="Version stamp (flow modified_at)")
+
+
+class PinnedExecutionPlan(BaseModel):
+    """Flow snapshot and execution plan compiled once for a batch test run."""
+
+    batch_id: str = Field(..., description="Batch ID")
+    flow_id: str = Field(..., description="Flow ID")
+    version: str = Field(..., description="Version stamp of the compiled flow")
+    flow_definition: Dict = Field(..., description="Resolved flow definition")
+    execution_plan: List[List[str]] = Field(..., description="Compiled layers")
+
+
 class FlowRunResult(BaseModel):
     """
     Represents the result of a flow execution run, including summary
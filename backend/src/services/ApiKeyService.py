@@ -5,10 +5,15 @@ from typing import Optional
 
 from fastapi import HTTPException
 from loguru import logger
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.configs.config import get_app_settings
+from src.core.api_key_cache import get_api_key_validation_cache
+from src.core.api_key_usage import get_api_key_usage_tracker
 from src.models.alchemy.auth.ApiKey import ApiKeyModel
 from src.repositories.ApiKeyRepository import ApiKeyRepository
+from src.schemas.api_keys.api_key_schemas import CachedApiKey
+from src.utils.hashing_utils import hash_sha256
 
 
 class ApiKeyServiceInterface(ABC):
@@ -55,9 +60,9 @@ class ApiKeyServiceInterface(ABC):
     @abstractmethod
     async def validate_key(
         self, session: AsyncSession, api_key_value: str
-    ) -> Optional[ApiKeyModel]:
+    ) -> Optional[CachedApiKey]:
         """
-        Validate an API key and return the key model if valid
+        Validate an API key and return the cached key projection if valid
         """
         pass
 
@@ -77,6 +82,13 @@ class ApiKeyServiceInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def record_usage(self, key_id: str) -> None:
+        """
+        Buffer a last-used update for an API key (flushed in batches)
+        """
+        pass
+
 
 class ApiKeyService(ApiKeyServiceInterface):
     """
@@ -88,6 +100,28 @@ class ApiKeyService(ApiKeyServiceInterface):
         Initialize API key service with repository
         """
         self.api_key_repository = api_key_repository or ApiKeyRepository()
+        self.validation_cache = get_api_key_validation_cache()
+        self.usage_tracker = get_api_key_usage_tracker()
+
+    async def _invalidate_key_cache(self, session: AsyncSession, key_id: str) -> None:
+        """
+        Drop any cached validation result of a key (all processes) now, and
+        once more after the transaction commits so a concurrent validation
+        cannot re-cache the old row.
+        """
+        key_hash = await self.api_key_repository.get_key_hash_by_key_id(
+            session=session, key_id=key_id
+        )
+        if not key_hash:
+            return
+        validation_cache = self.validation_cache
+        validation_cache.invalidate(key_hash)
+        event.listen(
+            session.sync_session,
+            "after_commit",
+            lambda _session: validation_cache.invalidate(key_hash),
+            once=True,
+        )
 
     async def issue_new_key(
         self,
@@ -133,6 +167,8 @@ class ApiKeyService(ApiKeyServiceInterface):
         """
         try:
             async with asyncio.timeout(get_app_settings().QUERY_TIMEOUT):
+                # Resolve the hash before the row is gone
+                await self._invalidate_key_cache(session=session, key_id=key_id)
                 success = await self.api_key_repository.delete_api_key(session, key_id)
                 if success:
                     logger.info(f"Successfully deleted API key with key_id: {key_id}")
@@ -158,6 +194,7 @@ class ApiKeyService(ApiKeyServiceInterface):
                 success = await self.api_key_repository.deactivate_api_key(
                     session, key_id
                 )
+                await self._invalidate_key_cache(session=session, key_id=key_id)
                 if success:
                     logger.info(
                         f"Successfully deactivated API key with key_id: {key_id}"
@@ -184,6 +221,8 @@ class ApiKeyService(ApiKeyServiceInterface):
                 success = await self.api_key_repository.activate_api_key(
                     session, key_id
                 )
+                # Clears a possible negative entry for this key
+                await self._invalidate_key_cache(session=session, key_id=key_id)
                 if success:
                     logger.info(f"Successfully activated API key with key_id: {key_id}")
                 else:
@@ -201,24 +240,47 @@ class ApiKeyService(ApiKeyServiceInterface):
 
     async def validate_key(
         self, session: AsyncSession, api_key_value: str
-    ) -> Optional[ApiKeyModel]:
+    ) -> Optional[CachedApiKey]:
         """
-        Validate an API key and return the key model if valid
+        Validate an API key and return the cached key projection if valid.
+        Results (including invalid keys) are cached briefly by key hash, so hot
+        keys are validated without a database round trip. Successful
+        validations are recorded as key usage (buffered last_used_at).
         """
         try:
-            async with asyncio.timeout(get_app_settings().QUERY_TIMEOUT):
-                # This is a read operation with a write (update last_used_at), so we need a transaction
+            key_hash = hash_sha256(api_key_value)
+            hit, cached_api_key = self.validation_cache.get(key_hash)
+            if hit:
+                if not cached_api_key:
+                    logger.warning("API key validation failed - invalid or expired key")
+                else:
+                    self.record_usage(key_id=cached_api_key.key_id)
+                return cached_api_key
 
-                api_key_model = await self.api_key_repository.validate_api_key(
-                    session=session, api_key_value=api_key_value
-                )
-                if api_key_model:
-                    logger.info(
-                        f"Successfully validated API key for user {api_key_model.user_id}"
+            async with asyncio.timeout(get_app_settings().QUERY_TIMEOUT):
+                api_key_model = (
+                    await self.api_key_repository.find_valid_api_key_by_hash(
+                        session=session, key_hash=key_hash
                     )
-                else:
-                    logger.warning("API key validation failed - invalid or expired key")
-                return api_key_model
+                )
+
+            if not api_key_model:
+                self.validation_cache.set_invalid(key_hash)
+                logger.warning("API key validation failed - invalid or expired key")
+                return None
+
+            cached_api_key = CachedApiKey(
+                key_id=api_key_model.key_id,
+                user_id=api_key_model.user_id,
+                name=api_key_model.name,
+                expires_at=api_key_model.expires_at,
+            )
+            self.validation_cache.set_valid(key_hash, cached_api_key)
+            self.record_usage(key_id=cached_api_key.key_id)
+            logger.info(
+                f"Successfully validated API key for user {api_key_model.user_id}"
+            )
+            return cached_api_key
         except asyncio.TimeoutError:
             raise HTTPException(status_code=503, detail="Database operation timed out")
         except Exception as e:
@@ -288,3 +350,10 @@ class ApiKeyService(ApiKeyServiceInterface):
             raise HTTPException(
                 status_code=500, detail=f"Failed to update API key usage: {str(e)}"
             )
+
+    def record_usage(self, key_id: str) -> None:
+        """
+        Buffer a last-used update for an API key. The usage tracker flushes
+        buffered timestamps to the database in batches, off the request path.
+        """
+        self.usage_tracker.record(key_id=key_id)
@@ -1,14 +1,19 @@
 import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Tuple
+from typing import Any, Dict, Tuple
 from uuid import uuid4
 
 import redis
 from jose import JWTError, jwt
 from loguru import logger
 from src.configs.config import get_app_settings
-from src.exceptions.user_exceptions import TokenInvalidError
+from src.core.token_cache import (
+    TOKEN_BLACKLIST_PREFIX,
+    get_token_claims_cache,
+    get_token_revocation_filter,
+)
+from src.exceptions.user_exceptions import TokenInvalidError, TokenRevokedError
 
 
 class AuthServiceInterface(ABC):
@@ -20,6 +25,10 @@ class AuthServiceInterface(ABC):
     async def verify_token(self, token: str) -> int:
         pass
 
+    @abstractmethod
+    async def authenticate_token(self, token: str) -> int:
+        pass
+
 
 class AuthService(AuthServiceInterface):
     def __init__(
@@ -43,7 +52,9 @@ class AuthService(AuthServiceInterface):
         if not self.redis:
             raise ValueError("Redis client is required for AuthService")
 
-        self.token_blacklist_prefix = "blacklist:token:"
+        self.token_blacklist_prefix = TOKEN_BLACKLIST_PREFIX
+        self.claims_cache = get_token_claims_cache()
+        self.revocation_filter = get_token_revocation_filter()
 
     async def generate_tokens(self, user_id: int) -> Tuple[str, str]:
         """Generate JWT token for user
@@ -91,15 +102,23 @@ class AuthService(AuthServiceInterface):
             logger.error(f"Token generation failed: {str(e)}")
             raise TokenInvalidError("Failed to generate token") from e
 
+    def _decode_access_token(self, access_token: str) -> Dict[str, Any]:
+        """Decode and verify a JWT, reusing claims already verified in-process"""
+        payload = self.claims_cache.get(access_token)
+        if payload is not None:
+            return payload
+
+        payload = jwt.decode(access_token, self.secret_key, algorithms=[self.algorithm])
+        self.claims_cache.set(access_token, payload)
+        return payload
+
     async def verify_token(self, access_token: str) -> int:
         """Verify JWT token and return user ID
         Returns user ID if valid, raises TokenInvalidError otherwise
         """
         try:
             async with asyncio.timeout(get_app_settings().QUERY_TIMEOUT):
-                payload = jwt.decode(
-                    access_token, self.secret_key, algorithms=[self.algorithm]
-                )
+                payload = self._decode_access_token(access_token)
                 user_id = int(payload.get("sub"))
                 if not user_id:
                     logger.warning("Token missing subject claim")
@@ -111,6 +130,29 @@ class AuthService(AuthServiceInterface):
             logger.error(f"Token verification failed: {str(e)}")
             raise TokenInvalidError("Invalid or expired token") from e
 
+    async def authenticate_token(self, access_token: str) -> int:
+        """Verify JWT token and check revocation with a single decode
+        Returns user ID if valid, raises TokenRevokedError if logged out
+        and TokenInvalidError otherwise
+        """
+        try:
+            async with asyncio.timeout(get_app_settings().QUERY_TIMEOUT):
+                payload = self._decode_access_token(access_token)
+                user_id = int(payload.get("sub"))
+                if not user_id:
+                    logger.warning("Token missing subject claim")
+                    raise TokenInvalidError("Invalid token structure")
+
+                jti = payload.get("jti")
+                if jti and self.revocation_filter.is_revoked(jti):
+                    raise TokenRevokedError()
+                return user_id
+        except asyncio.TimeoutError:
+            raise TokenInvalidError("Token verification timed out")
+        except JWTError as e:
+            logger.error(f"Token verification failed: {str(e)}")
+            raise TokenInvalidError("Invalid or expired token") from e
+
     async def verify_refresh_token(self, refresh_token: str) -> int:
         """Verify JWT refresh token and return user ID
         Returns user ID if valid, raises TokenInvalidError otherwise
@@ -155,8 +197,7 @@ class AuthService(AuthServiceInterface):
                 if ttl <= 0:
                     return False
 
-                key = f"{self.token_blacklist_prefix}{jti}"
-                self.redis.setex(key, ttl, "blacklisted")
+                self.revocation_filter.revoke(jti, ttl)
                 logger.info(f"Token {jti} blacklisted with TTL: {ttl}s")
                 return True
         except asyncio.TimeoutError:
@@ -179,8 +220,7 @@ class AuthService(AuthServiceInterface):
                 jti = payload.get("jti")
                 if not jti:
                     return False
-                key = f"{self.token_blacklist_prefix}{jti}"
-                return bool(self.redis.exists(key))
+                return self.revocation_filter.is_revoked(jti)
         except asyncio.TimeoutError:
             logger.error("Token blacklist check timed out")
             return True  # Fail secure
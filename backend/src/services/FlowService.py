@@ -1,18 +1,25 @@
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 from fastapi import HTTPException
 from loguru import logger
+from redis import Redis
+from sqlalchemy import event
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.configs.config import get_app_settings
+from src.consts.cache_consts import CACHE_PREFIX, CACHE_TTL
+from src.core.flow_definition_cache import get_flow_definition_cache
 from src.exceptions.shared_exceptions import MISMATCH_EXCEPTION, NOT_FOUND_EXCEPTION
+from src.helpers.CacheHelper import CacheHelper
 from src.models.alchemy.flows.FlowModel import FlowModel
 from src.nodes.GraphLoader import GraphLoader
 from src.repositories.FlowRepositories import FlowRepository
 from src.schemas.flowbuilder.flow_crud_schemas import FlowCreateRequest
 from src.schemas.flows.flow_schemas import (
+    CachedFlowDefinition,
     FlowPatchRequest,
     GetFlowResponseItem,
 )
@@ -30,6 +37,20 @@ class FlowServiceInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_by_user_id_keyset(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        limit: int,
+        cursor: Optional[Tuple[datetime, str]],
+        include_total: bool,
+    ) -> Tuple:
+        """
+        Get flows by user id using cursor-based pagination
+        """
+        pass
+
     @abstractmethod
     async def create_empty_flow(self, session: AsyncSession, user_id: int) -> str:
         """
@@ -55,6 +76,15 @@ class FlowServiceInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_cached_flow_definition(
+        self, session: AsyncSession, flow_id: str
+    ) -> Optional[CachedFlowDefinition]:
+        """
+        Get the runnable flow definition, served from cache when possible
+        """
+        pass
+
     @abstractmethod
     async def delete_flow(self, session: AsyncSession, flow_id: str):
         """
@@ -95,8 +125,74 @@ class FlowService(FlowServiceInterface):
     Flow service
     """
 
-    def __init__(self, flow_repository: FlowRepository = None):
+    def __init__(
+        self,
+        flow_repository: FlowRepository = None,
+        redis_client: Optional[Redis] = None,
+    ):
         self.flow_repository = flow_repository or FlowRepository()
+        self.redis_client = redis_client
+        self.count_cache_helper = CacheHelper(redis_client, ttl=CACHE_TTL.FLOW_COUNT)
+
+    async def _get_flow_count(self, session: AsyncSession, user_id: int) -> int:
+        """
+        Get the number of flows owned by a user, served from the per-user cached
+        counter when possible. Falls back to a COUNT query on cache miss.
+        """
+        cache_key = f"{CACHE_PREFIX.FLOW_COUNT}:{user_id}"
+        cached_count = self.count_cache_helper.get(cache_key)
+        if isinstance(cached_count, int):
+            return cached_count
+
+        total_items = await self.flow_repository.count_by_user_id(
+            session=session, user_id=user_id
+        )
+        self.count_cache_helper.set(cache_key, total_items)
+        return total_items
+
+    def _invalidate_flow_count(self, session: AsyncSession, user_id: int) -> None:
+        """
+        Drop the cached flow counter of a user after create/delete, once the
+        transaction commits: dropped earlier, a concurrent count could re-cache
+        the old total.
+        """
+        count_cache_helper = self.count_cache_helper
+        cache_key = f"{CACHE_PREFIX.FLOW_COUNT}:{user_id}"
+        event.listen(
+            session.sync_session,
+            "after_commit",
+            lambda _session: count_cache_helper.delete(cache_key),
+            once=True,
+        )
+
+    def _invalidate_flow_definition(self, session: AsyncSession, flow_id: str) -> None:
+        """
+        Drop the cached definition of a flow now, and once more after the
+        transaction commits so a concurrent reader cannot re-cache the old row.
+        """
+        flow_definition_cache = get_flow_definition_cache()
+        flow_definition_cache.invalidate(flow_id)
+        event.listen(
+            session.sync_session,
+            "after_commit",
+            lambda _session: flow_definition_cache.invalidate(flow_id),
+            once=True,
+        )
+
+    @staticmethod
+    def _to_response_items(flows: List[FlowModel]) -> List[GetFlowResponseItem]:
+        """Map flow models to list response items."""
+        return [
+            GetFlowResponseItem(
+                flow_id=flow.flow_id,
+                name=flow.name,
+                description=flow.description,
+                is_active=flow.is_active,
+                created_at=flow.created_at,
+                modified_at=flow.modified_at,
+            )
+            for flow in flows
+        ]
 
     async def get_by_user_id_paged(
         self, session: AsyncSession, user_id: int, page: int = 1, per_page: int = 10
@@ -106,27 +202,61 @@ class FlowService(FlowServiceInterface):
         """
         try:
             async with asyncio.timeout(get_app_settings().QUERY_TIMEOUT):
+                total_items = await self._get_flow_count(
+                    session=session, user_id=user_id
+                )
                 flows, total_items = await self.flow_repository.get_by_user_id_paged(
-                    session=session, user_id=user_id, page=page, per_page=per_page
+                    session=session,
+                    user_id=user_id,
+                    page=page,
+                    per_page=per_page,
+                    total_items=total_items,
                 )
 
                 # Map to response format
-                mapped_flows = [
-                    GetFlowResponseItem(
-                        flow_id=flow.flow_id,
-                        name=flow.name,
-                        description=flow.description,
-                        is_active=flow.is_active,
-                        created_at=flow.created_at,
+                return self._to_response_items(flows), total_items
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=503, detail="Database operation timed out")
+        except Exception as e:
+            logger.error(f"Error retrieving flows by user id {user_id}: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+    async def get_by_user_id_keyset(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        limit: int = 10,
+        cursor: Optional[Tuple[datetime, str]] = None,
+        include_total: bool = True,
+    ) -> Tuple[
+        List[GetFlowResponseItem], Optional[Tuple[datetime, str]], Optional[int]
+    ]:
+        """
+        Get flows by user id using cursor-based pagination on (modified_at, flow_id).
+
+        Returns:
+            (flows, next_cursor, total_items). total_items is the approximate
+            cached count, or None when include_total is False.
+        """
+        try:
+            async with asyncio.timeout(get_app_settings().QUERY_TIMEOUT):
+                flows, next_cursor = await self.flow_repository.get_by_user_id_keyset(
+                    session=session, user_id=user_id, limit=limit, cursor=cursor
+                )
+
+                total_items = None
+                if include_total:
+                    total_items = await self._get_flow_count(
+                        session=session, user_id=user_id
                     )
-                    for flow in flows
-                ]
 
-                return mapped_flows, total_items
+                return self._to_response_items(flows), next_cursor, total_items
         except asyncio.TimeoutError:
             raise HTTPException(status_code=503, detail="Database operation timed out")
         except Exception as e:
-            logger.error(f"Error retrieving flows by user id {user_id}: {str(e)}")
+            logger.error(
+                f"Error retrieving keyset flows by user id {user_id}: {str(e)}"
+            )
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
     async def create_empty_flow(self, session: AsyncSession, user_id: int) -> str:
@@ -135,6 +265,7 @@ class FlowService(FlowServiceInterface):
                 flow = await self.flow_repository.create_empty_flow(
                     session=session, user_id=user_id
                 )
+                self._invalidate_flow_count(session=session, user_id=user_id)
                 logger.info(f"Successfully created empty flow for user {user_id}")
                 return flow.flow_id
         except asyncio.TimeoutError:
@@ -166,6 +297,7 @@ class FlowService(FlowServiceInterface):
                     description=flow_request.description,
                     flow_definition=flow_request.flow_definition,
                 )
+                self._invalidate_flow_count(session=session, user_id=user_id)
                 logger.info(f"Successfully created flow with data for user {user_id}")
                 return flow
         except asyncio.TimeoutError:
@@ -199,10 +331,53 @@ class FlowService(FlowServiceInterface):
             logger.error(f"Error retrieving flow detail for flow {flow_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
+    async def get_cached_flow_definition(
+        self, session: AsyncSession, flow_id: str
+    ) -> Optional[CachedFlowDefinition]:
+        """
+        Get the runnable flow definition (with is_active and a version stamp).
+        Hot flows are served from the flow definition cache without a DB read.
+        """
+        try:
+            flow_definition_cache = get_flow_definition_cache()
+            cached = flow_definition_cache.get(flow_id)
+            if cached is not None:
+                return cached
+
+            async with asyncio.timeout(get_app_settings().QUERY_TIMEOUT):
+                row = await self.flow_repository.get_definition_by_id(
+                    session=session, flow_id=flow_id
+                )
+            if row is None:
+                return None
+
+            entry = CachedFlowDefinition(
+                flow_id=row.flow_id,
+                user_id=row.user_id,
+                is_active=bool(row.is_active),
+                flow_definition=row.flow_definition,
+                version=row.modified_at.isoformat() if row.modified_at else "",
+            )
+            flow_definition_cache.set(entry)
+            return entry
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=503, detail="Database operation timed out")
+        except Exception as e:
+            logger.error(
+                f"Error retrieving flow definition for flow {flow_id}: {str(e)}"
+            )
+            raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
     async def delete_flow(self, session: AsyncSession, flow_id: str):
         try:
             async with asyncio.timeout(get_app_settings().QUERY_TIMEOUT):
-                await self.flow_repository.delete_flow(session=session, flow_id=flow_id)
+                deleted_flow = await self.flow_repository.delete_flow(
+                    session=session, flow_id=flow_id
+                )
+                self._invalidate_flow_count(
+                    session=session, user_id=deleted_flow.user_id
+                )
+                self._invalidate_flow_definition(session=session, flow_id=flow_id)
                 logger.info(f"Successfully deleted flow {flow_id}")
         except asyncio.TimeoutError:
             raise HTTPException(status_code=503, detail="Database operation timed out")
@@ -246,6 +421,9 @@ class FlowService(FlowServiceInterface):
                         result = await self.flow_repository.save_flow_definition(
                             session=session, flow=flow_model
                         )
+                        self._invalidate_flow_definition(
+                            session=session, flow_id=flow_model.flow_id
+                        )
                         logger.info(
                             f"Successfully updated flow {flow_model.flow_id} for user {user_id}"
                         )
@@ -297,6 +475,7 @@ class FlowService(FlowServiceInterface):
                 result = await self.flow_repository.activate_flow(
                     session=session, flow_id=flow_id
                 )
+                self._invalidate_flow_definition(session=session, flow_id=flow_id)
                 logger.info(f"Successfully activated flow {flow_id} for user {user_id}")
                 return result
         except asyncio.TimeoutError:
@@ -340,6 +519,7 @@ class FlowService(FlowServiceInterface):
                 result = await self.flow_repository.deactivate_flow(
                     session=session, flow_id=flow_id
                 )
+                self._invalidate_flow_definition(session=session, flow_id=flow_id)
                 logger.info(
                     f"Successfully deactivated flow {flow_id} for user {user_id}"
                 )
@@ -216,6 +216,18 @@ class FlowTestServiceInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def bulk_update_test_case_runs(
+        self, session: AsyncSession, updates: Dict[str, Dict[str, Any]]
+    ) -> int:
+        """
+        Apply many partial test case run updates in one statement.
+
+        Args:
+            updates: {task_run_id: {column: value, ...}}
+        """
+        pass
+
     @abstractmethod
     async def get_latest_test_case_run_status(
         self, session: AsyncSession, test_case_id: int
@@ -804,6 +816,30 @@ class FlowTestService(FlowTestServiceInterface):
                 status_code=500, detail=f"Failed to set test case run status: {str(e)}"
             )
 
+    async def bulk_update_test_case_runs(
+        self, session: AsyncSession, updates: Dict[str, Dict[str, Any]]
+    ) -> int:
+        """
+        Apply many partial test case run updates in one statement.
+
+        Args:
+            updates: {task_run_id: {column: value, ...}}
+
+        Returns:
+            Number of runs updated
+        """
+        try:
+            async with asyncio.timeout(get_app_settings().QUERY_TIMEOUT):
+                return await self.test_repository.bulk_update_test_case_runs(
+                    session=session, updates=updates
+                )
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=503, detail="Database operation timed out")
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to update test case runs: {str(e)}"
+            )
+
     async def get_latest_test_case_run_status(
         self, session: AsyncSession, test_case_id: int
     ) -> str:
@@ -977,50 +1013,10 @@ class FlowTestService(FlowTestServiceInterface):
         Returns:
             bool: True if the test was successfully cancelled, False otherwise
         """
-        try:
-            async with asyncio.timeout(get_app_settings().QUERY_TIMEOUT):
-                # Get the test case run to check its current status
-                test_case_run = await self.test_repository.get_test_case_run_by_task_id(
-                    session=session, task_run_id=task_run_id
-                )
-
-                if not test_case_run:
-                    logger.warning(
-                        f"Test case run with task_run_id {task_run_id} not found"
-                    )
-                    return False
-
-                current_status = str(test_case_run.status)
-
-                # Check if the test can be cancelled
-                if current_status in [
-                    TestCaseRunStatus.PASSED.value,
-                    TestCaseRunStatus.FAILED.value,
-                    TestCaseRunStatus.CANCELLED.value,
-                    TestCaseRunStatus.SYSTEM_ERROR.value,
-                ]:
-                    logger.info(
-                        f"Test case run with task_run_id {task_run_id} is already in terminal status: {current_status}"
-                    )
-                    return False
-
-                # Update the status to CANCELLED
-                await self.test_repository.set_test_case_run_status(
-                    session=session,
-                    task_run_id=task_run_id,
-                    status=TestCaseRunStatus.CANCELLED.value,
-                )
-
-                logger.info(
-                    f"Successfully cancelled test case run with task_run_id {task_run_id}"
-                )
-                return True
-        except asyncio.TimeoutError:
-            raise HTTPException(status_code=503, detail="Database operation timed out")
-        except Exception as e:
-            raise HTTPException(
-                status_code=500, detail=f"Failed to cancel test case run: {str(e)}"
-            )
+        results = await self.cancel_test_case_runs(
+            session=session, task_run_ids=[task_run_id]
+        )
+        return results.get(task_run_id, False)
 
     async def cancel_test_case_runs(
         self, session: AsyncSession, task_run_ids: list[str]
@@ -1035,35 +1031,23 @@ class FlowTestService(FlowTestServiceInterface):
             dict[str, bool]: Dictionary mapping task run IDs to their cancellation status
         """
         try:
-            async with asyncio.timeout(60):  # Longer timeout for bulk operations
+            async with asyncio.timeout(get_app_settings().QUERY_TIMEOUT):
                 if not task_run_ids:
                     logger.warning("No task run IDs provided for cancellation")
                     return {}
 
-                results = {}
-
-                for task_run_id in task_run_ids:
-                    try:
-                        success = await self.cancel_test_case_run(
-                            session=session, task_run_id=task_run_id
-                        )
-                        results[task_run_id] = success
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to cancel test case run with task_run_id {task_run_id}: {str(e)}"
-                        )
-                        results[task_run_id] = False
-
-                successful_cancellations = sum(
-                    1 for success in results.values() if success
-                )
-                logger.info(
-                    f"Cancelled {successful_cancellations} out of {len(task_run_ids)} test case runs"
+                # Single set-based UPDATE; unknown and finished runs are skipped
+                cancelled = set(
+                    await self.test_repository.cancel_test_case_runs(
+                        session=session, task_run_ids=task_run_ids
+                    )
                 )
-
-                return results
+                return {
+                    task_run_id: task_run_id in cancelled
+                    for task_run_id in task_run_ids
+                }
         except asyncio.TimeoutError:
-            raise HTTPException(status_code=503, detail="Bulk operation timed out")
+            raise HTTPException(status_code=503, detail="Database operation timed out")
         except Exception as e:
             raise HTTPException(
                 status_code=500, detail=f"Failed to cancel test case runs: {str(e)}"
@@ -5,14 +5,95 @@ Handles edge cases, proper cleanup, and thread safety.
 
 import asyncio
 import functools
+import os
 import sys
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
-from typing import Any, Coroutine, TypeVar
+from typing import Any, Coroutine, Optional, TypeVar
 
 from loguru import logger
 
 T = TypeVar("T")
 
+# Persistent event loop of a worker process (see start_worker_loop)
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_thread: Optional[threading.Thread] = None
+_worker_pid: Optional[int] = None
+_worker_lock = threading.Lock()
+
+
+def start_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Start a worker-lifetime event loop in a background thread.
+
+    Called once per Celery worker process (worker_process_init). Afterwards
+    run_async() submits coroutines to this loop instead of creating a new
+    loop per call, so pooled async clients (DB engine, Redis) bound to the
+    loop are reused across tasks.
+    """
+    global _worker_loop, _worker_thread, _worker_pid
+
+    with _worker_lock:
+        if is_worker_loop_running():
+            return _worker_loop
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=loop.run_forever, name="worker-event-loop", daemon=True
+        )
+        thread.start()
+
+        _worker_loop, _worker_thread, _worker_pid = loop, thread, os.getpid()
+        logger.info(f"Started persistent worker event loop (pid={_worker_pid})")
+        return loop
+
+
+def stop_worker_loop(timeout: float = 10) -> None:
+    """Cancel pending work and close the worker loop (worker shutdown)."""
+    global _worker_loop, _worker_thread, _worker_pid
+
+    with _worker_lock:
+        if not is_worker_loop_running():
+            return
+        loop, thread = _worker_loop, _worker_thread
+
+        async def _shutdown():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+            await loop.shutdown_default_executor()
+
+        try:
+            asyncio.run_coroutine_threadsafe(_shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.error(f"Error during worker loop shutdown: {e}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            loop.close()
+            _worker_loop, _worker_thread, _worker_pid = None, None, None
+
+
+def is_worker_loop_running() -> bool:
+    """Whether this process has a live persistent worker loop."""
+    return (
+        _worker_loop is not None
+        and _worker_pid == os.getpid()
+        and _worker_thread is not None
+        and _worker_thread.is_alive()
+    )
+
+
+def in_worker_loop() -> bool:
+    """Whether the calling coroutine runs on the persistent worker loop."""
+    try:
+        return asyncio.get_running_loop() is _worker_loop and is_worker_loop_running()
+    except RuntimeError:
+        return False
+
 
 def run_async(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
     """
@@ -43,13 +124,19 @@ def run_async(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
     # Check if we're already in an event loop (avoid nested loop issues)
     try:
         running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop running - this is what we expect
+        running_loop = None
+    if running_loop is not None:
+        coro.close()
         raise RuntimeError(
             f"run_async() cannot be called from an already running event loop. "
             f"Current loop: {running_loop}. Use 'await' instead."
         )
-    except RuntimeError:
-        # No loop running - this is what we expect
-        pass
+
+    # Worker processes submit to their persistent loop
+    if is_worker_loop_running():
+        return _run_in_worker_loop(coro, timeout)
 
     # Create a new event loop for this thread
     loop = asyncio.new_event_loop()
@@ -100,6 +187,30 @@ def run_async(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
             asyncio.set_event_loop(None)
 
 
+def _run_in_worker_loop(coro: Coroutine[Any, Any, T], timeout: float | None) -> T:
+    future = asyncio.run_coroutine_threadsafe(coro, _worker_loop)
+    try:
+        return future.result(timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        raise asyncio.TimeoutError(f"Coroutine did not finish within {timeout}s")
+    except BaseException as e:
+        # Whatever interrupted the wait (soft time limit, SIGTERM's SystemExit,
+        # KeyboardInterrupt...), the coroutine must not outlive its caller on
+        # the shared loop. A no-op when the coroutine itself raised.
+        future.cancel()
+        if not future.done() or future.cancelled():
+            logger.warning(
+                f"{type(e).__name__} while waiting, cancelled the async task"
+            )
+        elif isinstance(e, Exception):
+            logger.error(
+                f"Error in async execution: {type(e).__name__}: {e}",
+                exc_info=sys.exc_info(),
+            )
+        raise
+
+
 def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
     """
     Cancel all pending tasks in the event loop.
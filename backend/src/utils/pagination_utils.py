@@ -0,0 +1,32 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+def encode_flow_cursor(modified_at: datetime, flow_id: str) -> str:
+    """Encode a (modified_at, flow_id) keyset position into an opaque cursor."""
+    raw = json.dumps(
+        {"m": modified_at.isoformat(), "f": flow_id}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("utf-8").rstrip("=")
+
+
+def decode_flow_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, str]]:
+    """
+    Decode an opaque cursor produced by `encode_flow_cursor`.
+
+    Returns:
+        (modified_at, flow_id) or None if no cursor was given.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parsed = json.loads(base64.urlsafe_b64decode(padded.encode("utf-8")))
+        return datetime.fromisoformat(parsed["m"]), str(parsed["f"])
+    except Exception as e:
+        raise ValueError("Invalid pagination cursor") from e
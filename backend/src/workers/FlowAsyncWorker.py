@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from time import perf_counter
 from typing import Any, Dict, List, Optional, Tuple
@@ -6,11 +7,24 @@ import networkx as nx
 from fastapi import HTTPException
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.dependencies.db_dependency import AsyncNullPoolSessionLocal
+from src.configs.config import get_app_settings
+from src.core.batch_plan import get_batch_plan_store
+from src.core.execution_service import get_execution_service
+from src.core.run_cancellation import get_run_cancellation
+from src.core.run_result_writer import get_run_result_writer
+from src.dependencies.db_dependency import get_task_sessionmaker
 from src.dependencies.redis_dependency import get_redis_client
 from src.exceptions.auth_exceptions import UNAUTHORIZED_EXCEPTION
+from src.exceptions.execution_exceptions import (
+    ExecutionCancelledError,
+    ExecutionSaturatedError,
+    ExecutionTimedOutError,
+    TenantExecutionLimitError,
+)
 from src.exceptions.graph_exceptions import GraphCompilerError
+from src.executors.CancellationToken import CancellationToken
 from src.executors.ExecutionContext import ExecutionContext
+from src.executors.ExecutionCheckpointStore import get_execution_checkpoint_store
 from src.executors.ExecutionEventPublisher import (
     ExecutionControl,
     ExecutionEventPublisher,
@@ -31,7 +45,7 @@ from src.schemas.flowbuilder.flow_graph_schemas import (
     CanvasFlowRunRequest,
     FlowExecutionResult,
 )
-from src.schemas.flows.flow_schemas import FlowRunResult
+from src.schemas.flows.flow_schemas import CachedFlowDefinition, FlowRunResult
 from src.services.ApiKeyService import ApiKeyService
 from src.services.FlowService import FlowService
 from src.services.FlowTestService import FlowTestService
@@ -44,6 +58,8 @@ class FlowAsyncWorker:
     def __init__(self, user_id: Optional[int] = None, task_id: str = ""):
         self.user_id = user_id
         self.task_id = task_id
+        # Test run row as last written, used as event payload without re-reads
+        self._run_snapshot: Dict[str, Any] = {}
 
     async def run_async(
         self,
@@ -52,6 +68,7 @@ class FlowAsyncWorker:
         session_id: Optional[str],
         flow_graph_request_dict: Dict,
         enable_debug: bool = True,
+        checkpoint: bool = False,
     ) -> FlowExecutionResult:
         """
         Execute a flow synchronously.
@@ -61,6 +78,8 @@ class FlowAsyncWorker:
             session_id: Session identifier for execution context
             flow_graph_request_dict: Flow graph configuration dictionary
             enable_debug: Whether to enable debug mode (currently unused)
+            checkpoint: Checkpoint completed nodes under the task id, so a
+                redelivered task resumes where the previous attempt stopped
             is_test: Whether this is a test run
 
         Returns:
@@ -110,6 +129,9 @@ class FlowAsyncWorker:
                 execution_event_publisher=None,
                 execution_context=execution_context,
                 enable_debug=enable_debug,
+                checkpoint_store=get_execution_checkpoint_store()
+                if checkpoint
+                else None,
             )
 
             logger.info("Starting graph execution")
@@ -168,18 +190,12 @@ class FlowAsyncWorker:
                 )
 
             # Retrieve and validate flow
-            flow_definition = await self._get_validated_flow(
-                flow_id, flow_service, session
-            )
+            flow = await self._get_validated_flow_record(flow_id, flow_service, session)
 
             # Execute the flow
             logger.info(f"Starting validated flow execution for flow_id: {flow_id}")
-            result = await self.run_async(
-                flow_id=flow_id,
-                flow_run_request=flow_run_request,
-                session_id=flow_run_request.session_id,
-                flow_graph_request_dict=flow_definition,
-                enable_debug=False,
+            result = await self._execute_api_run(
+                flow=flow, flow_run_request=flow_run_request
             )
 
             logger.success(f"Validated flow execution completed for flow_id: {flow_id}")
@@ -193,6 +209,72 @@ class FlowAsyncWorker:
             )
             raise
 
+    async def _execute_api_run(
+        self, flow: CachedFlowDefinition, flow_run_request: ApiFlowRunRequest
+    ) -> FlowExecutionResult:
+        """
+        Run an API flow in this process through the bounded execution service,
+        falling back to a Celery worker when the local pool is saturated.
+
+        Raises:
+            HTTPException: 429 when the flow owner has too many runs in flight,
+                          503 when saturated and the Celery fallback is disabled
+        """
+        try:
+            return await get_execution_service().run(
+                tenant_id=flow.user_id,
+                func=lambda: self.run_async(
+                    flow_id=flow.flow_id,
+                    flow_run_request=flow_run_request,
+                    session_id=flow_run_request.session_id,
+                    flow_graph_request_dict=flow.flow_definition,
+                    enable_debug=False,
+                ),
+            )
+        except TenantExecutionLimitError as e:
+            logger.warning(f"Tenant {flow.user_id} run rejected: {e}")
+            raise HTTPException(status_code=429, detail=str(e))
+        except ExecutionSaturatedError as e:
+            app_settings = get_app_settings()
+            if not app_settings.EXECUTION_SERVICE_CELERY_FALLBACK:
+                raise HTTPException(status_code=503, detail=str(e))
+
+            logger.info(f"Execution pool saturated ({e}), offloading to Celery")
+            return await self._run_on_celery(
+                flow=flow,
+                flow_run_request=flow_run_request,
+                timeout=app_settings.EXECUTION_SERVICE_CELERY_TIMEOUT_SECONDS,
+            )
+
+    async def _run_on_celery(
+        self,
+        flow: CachedFlowDefinition,
+        flow_run_request: ApiFlowRunRequest,
+        timeout: int,
+    ) -> FlowExecutionResult:
+        """Run the flow on a Celery worker and wait for its result."""
+        from src.celery_worker.tasks.flow_execution_tasks import run_api_flow
+
+        task = run_api_flow.apply_async(
+            kwargs={
+                "flow_id": flow.flow_id,
+                "flow_run_request_dict": flow_run_request.model_dump(),
+                "flow_graph_request_dict": flow.flow_definition,
+            }
+        )
+
+        # Poll the result backend without blocking the event loop
+        deadline = perf_counter() + timeout
+        poll_interval = 0.05
+        while not task.ready():
+            if perf_counter() > deadline:
+                task.revoke(terminate=True)
+                raise HTTPException(status_code=504, detail="Flow execution timed out")
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, 1.0)
+
+        return FlowExecutionResult.model_validate(task.get(propagate=True))
+
     async def _validate_api_key(
         self,
         api_key: Optional[str],
@@ -221,16 +303,20 @@ class FlowAsyncWorker:
             logger.warning("Invalid API key provided")
             raise UNAUTHORIZED_EXCEPTION
 
-        # Update last used timestamp
-        await api_key_service.set_last_used_at(
-            key_id=api_key_model.key_id, session=session
-        )
-
     async def _get_validated_flow(
         self, flow_id: str, flow_service: FlowService, session: AsyncSession
     ) -> Dict:
         """
-        Retrieve and validate flow from the database.
+        Retrieve and validate flow, returning its definition.
+        """
+        flow = await self._get_validated_flow_record(flow_id, flow_service, session)
+        return flow.flow_definition
+
+    async def _get_validated_flow_record(
+        self, flow_id: str, flow_service: FlowService, session: AsyncSession
+    ) -> CachedFlowDefinition:
+        """
+        Retrieve and validate flow (served from the flow definition cache when hot).
 
         Args:
             flow_id: Unique identifier for the flow
@@ -238,14 +324,14 @@ class FlowAsyncWorker:
             session: AsyncSession for database operations
 
         Returns:
-            Dict: Flow definition dictionary
+            CachedFlowDefinition: Flow record including its definition
 
         Raises:
             HTTPException: If flow is not found (404), not activated (409),
                           or has no definition (400)
         """
         logger.info(f"Retrieving flow definition for flow_id: {flow_id}")
-        flow = await flow_service.get_flow_detail_by_id(
+        flow = await flow_service.get_cached_flow_definition(
             flow_id=flow_id, session=session
         )
 
@@ -261,7 +347,7 @@ class FlowAsyncWorker:
             logger.warning(f"Flow has no definition: {flow_id}")
             raise HTTPException(status_code=400, detail="Flow has no definition")
 
-        return flow.flow_definition
+        return flow
 
     async def run_test_async(
         self,
@@ -271,13 +357,15 @@ class FlowAsyncWorker:
         session_id: Optional[str] = None,
         flow_test_service: Optional["FlowTestService"] = None,
         session: Optional[AsyncSession] = None,
+        execution_plan: Optional[List[List[str]]] = None,
     ) -> None:
         """
         Run a flow test asynchronously.
 
         Steps:
             1. Load test case and mark as QUEUED.
-            2. Compile the flow graph.
+            2. Compile the flow graph (skipped when a pinned execution_plan
+               of a batch run is given).
             3. Execute the flow.
             4. Save result and run pass criteria.
             5. Update status and publish events.
@@ -288,6 +376,7 @@ class FlowAsyncWorker:
             task_id=self.task_id,
             redis_client=redis_client,
             is_test=True,
+            flow_id=flow_id,
         )
 
         # Load test case and mark QUEUED
@@ -305,20 +394,18 @@ class FlowAsyncWorker:
 
         start_time: float = perf_counter()
 
-        if await self._is_cancelled(
-            test_case_id=case_id, service=flow_test_service, session=session
-        ):
+        if await self._is_cancelled():
             return
 
         # Compile flow graph
         graph, execution_plan = await self._compile_execution_plan(
-            flow_graph_request_dict=flow_graph_request_dict, input_text=input_text
+            flow_graph_request_dict=flow_graph_request_dict,
+            input_text=input_text,
+            execution_plan=execution_plan,
         )
 
         try:
-            if await self._is_cancelled(
-                test_case_id=case_id, service=flow_test_service, session=session
-            ):
+            if await self._is_cancelled():
                 return
             # Execute flow
             execution_result: FlowExecutionResult = await self._execute_flow(
@@ -330,19 +417,18 @@ class FlowAsyncWorker:
                 event_publisher,
                 case_id,
                 session,
+                timeout_ms=test_case.timeout_ms,
             )
 
             # Save result
             execution_time_ms: float = (perf_counter() - start_time) / 1000
-            await flow_test_service.update_test_case_run(
-                run_id=self.task_id,
+            await self._write_run(
                 finished_at=datetime.now(),
                 execution_time_ms=execution_time_ms,
                 actual_output=execution_result.model_dump(),
-                session=session,
             )
 
-            if await self._is_cancelled(case_id, flow_test_service, session):
+            if await self._is_cancelled():
                 return
 
             # Run pass criteria
@@ -359,28 +445,34 @@ class FlowAsyncWorker:
                 f"(TEST RUN) Flow execution completed for flow_id: {flow_id}"
             )
 
-        except GraphCompilerError as e:
-            await self._mark_failed(
-                flow_test_service, event_publisher, case_id, session
+        except ExecutionTimedOutError as e:
+            await self._write_run(
+                status=TestCaseRunStatus.FAILED,
+                error_message=str(e),
+                finished_at=datetime.now(),
             )
+            self._publish_event(event_publisher, case_id, TestCaseRunStatus.FAILED)
+            logger.warning(f"(TEST RUN) Test case {case_id} timed out: {e}")
+
+        except ExecutionCancelledError:
+            # The cancel route already marked the run CANCELLED
+            self._publish_event(event_publisher, case_id, TestCaseRunStatus.CANCELLED)
+            logger.info(f"(TEST RUN) Test case {case_id} was cancelled mid-execution")
+
+        except GraphCompilerError as e:
+            await self._mark_failed(event_publisher, case_id)
             logger.error(
                 f"(TEST RUN) Flow compilation failed for flow_id {flow_id}: {e}"
             )
 
         except Exception as e:
-            await flow_test_service.update_test_case_run(
-                run_id=self.task_id,
+            await self._write_run(
                 status=TestCaseRunStatus.SYSTEM_ERROR,
                 error_message=str(e),
                 finished_at=datetime.now(),
-                session=session,
             )
-            await self._publish_event(
-                flow_test_service,
-                event_publisher,
-                case_id,
-                TestCaseRunStatus.SYSTEM_ERROR,
-                session,
+            self._publish_event(
+                event_publisher, case_id, TestCaseRunStatus.SYSTEM_ERROR
             )
             logger.error(f"(TEST RUN) Flow execution failed for flow_id {flow_id}: {e}")
             raise
@@ -390,16 +482,27 @@ class FlowAsyncWorker:
         flow_id: str,
         case_id: int,
         session_id: Optional[str] = None,
+        batch_id: Optional[str] = None,
     ) -> None:
         try:
             logger.info(f"Starting validated flow execution for flow_id: {flow_id}")
 
-            async with AsyncNullPoolSessionLocal() as session:
-                flow_service = FlowService(flow_repository=FlowRepository())
-                # Retrieve and validate flow
-                flow_definition = await self._get_validated_flow(
-                    flow_id, flow_service, session
-                )
+            # Cases of a batch run share the plan compiled once for the batch
+            pinned_plan = (
+                await get_batch_plan_store().get(batch_id) if batch_id else None
+            )
+
+            async with get_task_sessionmaker()() as session:
+                if pinned_plan is not None:
+                    flow_definition = pinned_plan.flow_definition
+                    execution_plan = pinned_plan.execution_plan
+                else:
+                    flow_service = FlowService(flow_repository=FlowRepository())
+                    # Retrieve and validate flow
+                    flow_definition = await self._get_validated_flow(
+                        flow_id, flow_service, session
+                    )
+                    execution_plan = None
 
                 flow_test_service = FlowTestService(
                     test_repository=FlowTestRepository(),
@@ -407,14 +510,19 @@ class FlowAsyncWorker:
                 )
 
                 # Execute the flow
-                await self.run_test_async(
-                    case_id=case_id,
-                    flow_id=flow_id,
-                    flow_graph_request_dict=flow_definition,
-                    session_id=session_id,
-                    flow_test_service=flow_test_service,
-                    session=session,
-                )
+                try:
+                    await self.run_test_async(
+                        case_id=case_id,
+                        flow_id=flow_id,
+                        flow_graph_request_dict=flow_definition,
+                        session_id=session_id,
+                        flow_test_service=flow_test_service,
+                        session=session,
+                        execution_plan=execution_plan,
+                    )
+                finally:
+                    # Persist anything still buffered before the task ends
+                    await get_run_result_writer().flush()
 
                 await session.commit()
 
@@ -429,6 +537,53 @@ class FlowAsyncWorker:
             )
             raise
 
+    @classmethod
+    async def run_flow_test_chunk(
+        cls,
+        user_id: int,
+        flow_id: str,
+        cases: List[Dict[str, Any]],
+        batch_id: Optional[str] = None,
+        max_concurrency: int = 5,
+    ) -> Dict[str, Optional[BaseException]]:
+        """
+        Run a chunk of test cases of the same flow concurrently on this event
+        loop. Each case keeps its own run id, DB session and events; the
+        pinned plan, provider clients and the DB pool are shared.
+
+        Args:
+            cases: [{"task_id": ..., "case_id": ...}, ...]
+
+        Returns:
+            Dict mapping each case task_id to its error (None on success)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_case(case: Dict[str, Any]) -> None:
+            async with semaphore:
+                worker = cls(user_id=user_id, task_id=case["task_id"])
+                await worker.run_flow_test(
+                    flow_id=flow_id,
+                    case_id=case["case_id"],
+                    session_id=None,
+                    batch_id=batch_id,
+                )
+
+        results = await asyncio.gather(
+            *(run_case(case) for case in cases), return_exceptions=True
+        )
+
+        errors: Dict[str, Optional[BaseException]] = {}
+        for case, result in zip(cases, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"(TEST RUN) Case {case['case_id']} of chunk failed: {result}"
+                )
+                errors[case["task_id"]] = result
+            else:
+                errors[case["task_id"]] = None
+        return errors
+
     # --- FOR TEST ASYNC FLOW ---
 
     async def _mark_queued(
@@ -438,58 +593,66 @@ class FlowAsyncWorker:
         case_id: int,
         session: AsyncSession,
     ) -> None:
-        """Mark run as QUEUED and publish event."""
-        await service.update_test_case_run(
-            run_id=self.task_id,
-            status=TestCaseRunStatus.QUEUED,
-            started_at=datetime.now(),
-            session=session,
+        """Load the run once, mark it QUEUED and publish event."""
+        test_case_run = await service.get_test_case_run_by_task_id(
+            task_run_id=self.task_id, session=session
         )
-        await self._publish_event(
-            service, publisher, case_id, TestCaseRunStatus.QUEUED, session
+        self._run_snapshot = test_case_run.to_dict() if test_case_run else {}
+
+        await self._write_run(
+            status=TestCaseRunStatus.QUEUED, started_at=datetime.now()
         )
+        self._publish_event(publisher, case_id, TestCaseRunStatus.QUEUED)
 
     async def _mark_failed(
-        self,
-        service: "FlowTestService",
-        publisher: "ExecutionEventPublisher",
-        case_id: int,
-        session: AsyncSession,
+        self, publisher: "ExecutionEventPublisher", case_id: int
     ) -> None:
         """Mark run as FAILED and publish event."""
-        await service.set_test_case_run_status(
-            task_run_id=self.task_id, status=TestCaseRunStatus.FAILED, session=session
-        )
-        await self._publish_event(
-            service, publisher, case_id, TestCaseRunStatus.FAILED, session
-        )
+        await self._write_run(status=TestCaseRunStatus.FAILED)
+        self._publish_event(publisher, case_id, TestCaseRunStatus.FAILED)
 
-    async def _publish_event(
+    async def _write_run(self, **fields: Any) -> None:
+        """
+        Record run fields through the buffered test run writer (flushed at
+        once for terminal statuses) and keep the local snapshot in sync.
+        """
+        for key, value in fields.items():
+            if value is not None:
+                self._run_snapshot[key] = (
+                    value.isoformat() if isinstance(value, datetime) else value
+                )
+        await get_run_result_writer().update(self.task_id, **fields)
+
+    def _publish_event(
         self,
-        service: "FlowTestService",
         publisher: "ExecutionEventPublisher",
         case_id: int,
         status: "TestCaseRunStatus",
-        session: AsyncSession,
     ) -> None:
-        """Publish the latest run event with fresh test_run_data."""
-        test_case_run = await service.get_test_case_run_by_task_id(
-            task_run_id=self.task_id, session=session
-        )
-        test_run_data: Dict = test_case_run.to_dict() if test_case_run else {}
+        """Publish the latest run event with the current test_run_data."""
         publisher.publish_test_run_event(
-            case_id=case_id, status=status, test_run_data=test_run_data
+            case_id=case_id, status=status, test_run_data=dict(self._run_snapshot)
         )
 
     async def _compile_execution_plan(
-        self, flow_graph_request_dict: Dict, input_text: str
+        self,
+        flow_graph_request_dict: Dict,
+        input_text: str,
+        execution_plan: Optional[List[List[str]]] = None,
     ) -> Tuple[nx.MultiDiGraph, List]:
-        """Parse and compile the flow graph into an execution plan."""
-        logger.info("(TEST RUN) Parsing and compiling flow graph")
+        """
+        Parse and compile the flow graph into an execution plan. When a plan
+        already compiled for this flow is given, only the graph is loaded.
+        """
         flow_graph_request = CanvasFlowRunRequest(**flow_graph_request_dict)
         graph = GraphLoader.from_request(
             flow_graph_request, custom_input_text=input_text
         )
+        if execution_plan is not None:
+            logger.info("(TEST RUN) Using the batch's pinned execution plan")
+            return graph, [list(layer) for layer in execution_plan]
+
+        logger.info("(TEST RUN) Parsing and compiling flow graph")
         compiler = GraphCompiler(graph=graph, remove_standalone=False)
         execution_plan: List[List[str]] = await compiler.async_compile()
         return graph, execution_plan
@@ -504,13 +667,26 @@ class FlowAsyncWorker:
         publisher: "ExecutionEventPublisher",
         case_id: int,
         session: AsyncSession,
+        timeout_ms: Optional[float] = None,
     ) -> "FlowExecutionResult":
-        """Execute the compiled graph and return the execution result."""
+        """
+        Execute the compiled graph and return the execution result. The run
+        stops at the test case's timeout (or the default run deadline) and as
+        soon as it is cancelled. Completed nodes are checkpointed, so a retry
+        of the task resumes after them.
+        """
         execution_context = ExecutionContext(
             run_id=self.task_id, flow_id=flow_id, session_id=session_id
         )
         execution_control = ExecutionControl(start_node=None, scope="downstream")
 
+        run_timeout_seconds = None
+        if timeout_ms and timeout_ms >= get_app_settings().TEST_CASE_MIN_TIMEOUT_MS:
+            run_timeout_seconds = timeout_ms / 1000
+        cancellation_token = CancellationToken.from_settings(
+            run_timeout_seconds=run_timeout_seconds, cancel_check=self._is_cancelled
+        )
+
         logger.info(f"(TEST RUN) Creating executor with {len(execution_plan)} layers")
         executor = GraphExecutor(
             graph=graph,
@@ -519,15 +695,13 @@ class FlowAsyncWorker:
             execution_context=execution_context,
             execution_control=execution_control,
             enable_debug=False,
+            cancellation_token=cancellation_token,
+            checkpoint_store=get_execution_checkpoint_store(),
         )
 
         logger.info("(TEST RUN) Starting graph execution")
-        await service.set_test_case_run_status(
-            task_run_id=self.task_id, status=TestCaseRunStatus.RUNNING, session=session
-        )
-        await self._publish_event(
-            service, publisher, case_id, TestCaseRunStatus.RUNNING, session
-        )
+        await self._write_run(status=TestCaseRunStatus.RUNNING)
+        self._publish_event(publisher, case_id, TestCaseRunStatus.RUNNING)
 
         return await executor.execute()
 
@@ -545,7 +719,7 @@ class FlowAsyncWorker:
             flow_output=execution_result.chat_output.content
         )
         criteria_runner.load(pass_criteria)
-        runner_result: "RunnerResult" = criteria_runner.run()
+        runner_result: "RunnerResult" = await criteria_runner.arun()
 
         failed_criteria: List[StepDetail] = runner_result.failed_items
 
@@ -558,11 +732,9 @@ class FlowAsyncWorker:
             if runner_result.passed
             else TestCaseRunStatus.FAILED
         )
-        await service.update_test_case_run(
-            run_id=self.task_id,
+        await self._write_run(
             status=status,
             error_message=construct_error_msg if failed_criteria else None,
-            session=session,
         )
         publisher.publish_test_run_event(
             case_id=case_id,
@@ -572,14 +744,9 @@ class FlowAsyncWorker:
             error_message=construct_error_msg if failed_criteria else None,
         )
 
-    async def _is_cancelled(
-        self, test_case_id: int, service: FlowTestService, session: AsyncSession
-    ) -> bool:
-        """Check if task was cancelled"""
-        status = await service.get_latest_test_case_run_status(
-            test_case_id=test_case_id, session=session
-        )
-        if status == TestCaseRunStatus.CANCELLED:
-            logger.info(f"Test case {test_case_id} was cancelled, stopping execution")
+    async def _is_cancelled(self) -> bool:
+        """Check the Redis cancellation set for this run (no DB round trip)"""
+        if await get_run_cancellation().is_cancelled(self.task_id):
+            logger.info(f"Test run {self.task_id} was cancelled, stopping execution")
             return True
         return False
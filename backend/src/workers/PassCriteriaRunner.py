@@ -1,17 +1,21 @@
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.configs.config import get_app_settings
 from src.criterion import LLMJudgeCriterion, RegexCriterion, StringCriterion
 from src.criterion.BaseCriterion import Criterion
-from src.models.parsers import LLMJudgeRuleParser, RegexRuleParser, StringRuleParser
+from src.criterion.CompiledCriteria import compile_pass_criteria
 from src.models.validators.PassCriteriaRunnerModels import (
     CheckResult,
     RunnerResult,
     StepDetail,
 )
-from src.models.validators.PassCriteriaValidator import (
-    PassCriteriaRuleItem,
-    PassCriteriaValidator,
-)
+
+_CRITERIA_BY_TYPE = {
+    "llm_judge": LLMJudgeCriterion,
+    "string": StringCriterion,
+    "regex": RegexCriterion,
+}
 
 
 class PassCriteriaRunner:
@@ -20,10 +24,16 @@ class PassCriteriaRunner:
     - AND binds tighter than OR.
     - Short-circuits inside AND-groups on first failure.
     - Short-circuits across groups on first success.
+    - Cheap criteria run before LLM judges; `arun` also runs judges
+      concurrently and cancels them once the outcome is decided.
     """
 
-    def __init__(self, flow_output: str):
+    def __init__(self, flow_output: str, max_concurrent_judges: Optional[int] = None):
         self.flow_output = flow_output
+        self.max_concurrent_judges = (
+            max_concurrent_judges
+            or get_app_settings().PASS_CRITERIA_MAX_CONCURRENT_JUDGES
+        )
 
         self.logics_sequence: List[str] = []
         self.criteria_sequence: List[Criterion] = []
@@ -35,50 +45,137 @@ class PassCriteriaRunner:
             self.criteria_sequence: List[Criterion] = []
             return
 
-        pass_criteria: PassCriteriaValidator = PassCriteriaValidator.model_validate(
-            pass_criteria
-        )
-
-        self.logics_sequence: List[str] = pass_criteria.logics
+        # Parsed once per distinct criteria document, then bound to this output
+        compiled = compile_pass_criteria(pass_criteria)
+        self.logics_sequence: List[str] = compiled.logics
 
         criteria_sequence: List[Criterion] = []
-        rule_parser: PassCriteriaRuleItem
-        for rule_parser in pass_criteria.rules:
-            if rule_parser.type == "llm_judge":
-                criteria_sequence.append(
-                    LLMJudgeCriterion(
-                        id=rule_parser.id,
-                        input=self.flow_output,
-                        rule=LLMJudgeRuleParser.model_validate(
-                            rule_parser.config.model_dump()
-                        ),
-                    )
+        for compiled_rule in compiled.rules:
+            criterion_cls = _CRITERIA_BY_TYPE[compiled_rule.type]
+            criteria_sequence.append(
+                criterion_cls(
+                    id=compiled_rule.id, input=self.flow_output, rule=compiled_rule.rule
                 )
-            elif rule_parser.type == "string":
-                criteria_sequence.append(
-                    StringCriterion(
-                        id=rule_parser.id,
-                        input=self.flow_output,
-                        rule=StringRuleParser.model_validate(
-                            rule_parser.config.model_dump()
-                        ),
-                    )
+            )
+        self.criteria_sequence: List[Criterion] = criteria_sequence
+
+    def run(self) -> RunnerResult:
+        """Evaluate sequentially (cheap criteria first inside each AND-group)."""
+        early_result = self._precheck()
+        if early_result is not None:
+            return early_result
+
+        groups = self._partition_groups()
+        results: Dict[int, CheckResult] = {}
+
+        for gi, group in enumerate(groups):
+            group_all_true = True
+            for idx in self._cost_ordered(group):
+                res = self.criteria_sequence[idx].run()
+                results[idx] = res
+                if not res.passed:
+                    # remaining in this AND group are cancelled
+                    group_all_true = False
+                    break
+
+            if group_all_true:
+                return self._build_result(
+                    results, groups, stop_reason=f"group_success@{gi}"
                 )
-            elif rule_parser.type == "regex":
-                criteria_sequence.append(
-                    RegexCriterion(
-                        id=rule_parser.id,
-                        input=self.flow_output,
-                        rule=RegexRuleParser.model_validate(
-                            rule_parser.config.model_dump()
-                        ),
-                    )
+
+        return self._build_result(results, groups, stop_reason="all_groups_failed")
+
+    async def arun(self) -> RunnerResult:
+        """
+        Evaluate with a cost-aware plan:
+        1. Cheap deterministic criteria of every AND-group run first, so a
+           failing regex/string check settles its group without any LLM call.
+        2. The LLM judges of all groups still undecided run concurrently
+           (at most `max_concurrent_judges` at a time).
+        3. As soon as the outcome is decided (a group fully passes, or a
+           group gets a failing judge) the judges that no longer matter are
+           cancelled. A judge whose call is already in flight finishes in its
+           thread, but its result is discarded.
+        """
+        early_result = self._precheck()
+        if early_result is not None:
+            return early_result
+
+        groups = self._partition_groups()
+        results: Dict[int, CheckResult] = {}
+
+        # Cheap pass
+        pending_judges: Dict[int, List[int]] = {}
+        for gi, group in enumerate(groups):
+            cheap = [i for i in group if self.criteria_sequence[i].cost == 0]
+            judges = [i for i in group if self.criteria_sequence[i].cost > 0]
+
+            group_failed = False
+            for idx in cheap:
+                res = self.criteria_sequence[idx].run()
+                results[idx] = res
+                if not res.passed:
+                    group_failed = True
+                    break
+            if group_failed:
+                continue
+
+            if not judges:
+                return self._build_result(
+                    results, groups, stop_reason=f"group_success@{gi}"
                 )
-            else:
-                raise ValueError(f"Unknown rule type: {rule_parser.type}")
-        self.criteria_sequence: List[Criterion] = criteria_sequence
+            pending_judges[gi] = judges
+
+        if not pending_judges:
+            return self._build_result(results, groups, stop_reason="all_groups_failed")
+
+        # Concurrent judge pass
+        semaphore = asyncio.Semaphore(self.max_concurrent_judges)
+
+        async def judge(idx: int) -> CheckResult:
+            async with semaphore:
+                return await self.criteria_sequence[idx].arun()
 
-    def run(self) -> RunnerResult:  # noqa
+        tasks: Dict[asyncio.Task, Tuple[int, int]] = {
+            asyncio.create_task(judge(idx)): (gi, idx)
+            for gi, judges in pending_judges.items()
+            for idx in judges
+        }
+        remaining = {gi: len(judges) for gi, judges in pending_judges.items()}
+
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(
+                    tasks.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    gi, idx = tasks.pop(task)
+                    if gi not in remaining:
+                        continue  # Group already decided
+
+                    res = task.result()
+                    results[idx] = res
+                    if not res.passed:
+                        # Group failed: its other judges no longer matter
+                        del remaining[gi]
+                        for other, (other_gi, _) in list(tasks.items()):
+                            if other_gi == gi:
+                                other.cancel()
+                                del tasks[other]
+                        continue
+
+                    remaining[gi] -= 1
+                    if remaining[gi] == 0:
+                        return self._build_result(
+                            results, groups, stop_reason=f"group_success@{gi}"
+                        )
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return self._build_result(results, groups, stop_reason="all_groups_failed")
+
+    def _precheck(self) -> Optional[RunnerResult]:
         if len(self.criteria_sequence) == 0:
             return RunnerResult(
                 passed=True, stop_reason="no_criteria", failed_items=[], details=[]
@@ -94,62 +191,51 @@ class PassCriteriaRunner:
                 failed_items=[],
                 details=[],
             )
+        return None
 
-        # Partition into AND-groups split by OR
-        groups: List[List[Criterion]] = []
-        cur: List[Criterion] = [self.criteria_sequence[0]]
-        for op, crit in zip(self.logics_sequence, self.criteria_sequence[1:]):
+    def _partition_groups(self) -> List[List[int]]:
+        """Partition criteria indexes into AND-groups split by OR."""
+        groups: List[List[int]] = []
+        cur: List[int] = [0]
+        for idx, op in enumerate(self.logics_sequence, start=1):
             op_u = op.strip().upper()
             if op_u == "AND":
-                cur.append(crit)
+                cur.append(idx)
             elif op_u == "OR":
                 groups.append(cur)
-                cur = [crit]
+                cur = [idx]
             else:
                 raise ValueError(f"Unknown operator: {op}")
         groups.append(cur)
-
+        return groups
+
+    def _cost_ordered(self, group: List[int]) -> List[int]:
+        # Stable: criteria of equal cost keep the user-given order
+        return sorted(group, key=lambda i: self.criteria_sequence[i].cost)
+
+    def _build_result(
+        self, results: Dict[int, CheckResult], groups: List[List[int]], stop_reason: str
+    ) -> RunnerResult:
+        """
+        Details in the user-given order; unevaluated criteria are cancelled.
+        Passed when some AND-group had all its criteria evaluated and passing.
+        """
         failed_items: List[StepDetail] = []
         details: List[StepDetail] = []
-
-        # Evaluate groups
-        for gi, group in enumerate(groups):
-            group_all_true = True
-            for crit in group:
-                res = crit.run()
-                detail = StepDetail(id=crit.id, result=res)
-                details.append(detail)
-
-                if not res.passed:
-                    failed_items.append(detail)
-                    # cancel remaining in this AND group
-                    for rem in group[group.index(crit) + 1 :]:
-                        cancelled = CheckResult(passed=False, is_cancelled=True)
-                        detail = StepDetail(id=rem.id, result=cancelled)
-                        details.append(detail)
-                        failed_items.append(detail)
-                    group_all_true = False
-                    break
-
-            if group_all_true:
-                # cancel subsequent groups
-                for rem_group in groups[gi + 1 :]:
-                    for rem in rem_group:
-                        cancelled = CheckResult(passed=False, is_cancelled=True)
-                        detail = StepDetail(id=rem.id, result=cancelled)
-                        details.append(detail)
-                        failed_items.append(detail)
-                return RunnerResult(
-                    passed=True,
-                    stop_reason=f"group_success@{gi}",
-                    failed_items=failed_items,
-                    details=details,
-                )
-
-        # All groups failed
+        for idx, crit in enumerate(self.criteria_sequence):
+            res = results.get(idx) or CheckResult(passed=False, is_cancelled=True)
+            detail = StepDetail(id=crit.id, result=res)
+            details.append(detail)
+            if not res.passed:
+                failed_items.append(detail)
+
+        passed = any(
+            all(idx in results and results[idx].passed for idx in group)
+            for group in groups
+        )
         return RunnerResult(
-            passed=False,
-            stop_reason="all_groups_failed",
+            passed=passed,
+            stop_reason=stop_reason,
             failed_items=failed_items,
             details=details,
         )